@@ -6,6 +6,7 @@ import json
 import uuid
 import logging
 import os
+from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
@@ -20,6 +21,7 @@ from sx.paths import PathResolver
 
 from .db import connect, ensure_source, get_default_source_id, init_db, list_sources, set_default_source
 from .markdown import TEMPLATE_VERSION, render_note
+from .pool import ReadPool
 from .postgres_mirror import maybe_sync_postgres_mirror
 from .repositories import PostgresRepository, get_repository
 from .scheduler import Scheduler
@@ -68,6 +70,10 @@ class NoteIn(BaseModel):
     template_version: str | None = None
 
 
+class ConfirmUploadIn(BaseModel):
+    object_name: str
+
+
 class DangerFilters(BaseModel):
     q: str | None = ""
     bookmarked_only: bool = False
@@ -132,11 +138,22 @@ class ProfileConfigIn(BaseModel):
 
 
 def create_app(settings: Settings) -> FastAPI:
-    app = FastAPI(title="sx_obsidian SQLite API", version="0.1.0")
     repository = get_repository(settings)
     scheduler = Scheduler(settings)
     backend_mode = str(getattr(settings, "SX_DB_BACKEND_MODE", "SQLITE") or "SQLITE").strip().upper()
     is_pg_primary = backend_mode == "POSTGRES_PRIMARY"
+    # Read-only connections for search so it never contends with writers.
+    read_pool = None if is_pg_primary else ReadPool(settings.SX_DB_PATH, profile=settings.SX_DB_PROFILE)
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI):
+        yield
+        # Flush queued scheduler writes and release worker threads/pooled connections.
+        scheduler.close()
+        if read_pool is not None:
+            read_pool.close()
+
+    app = FastAPI(title="sx_obsidian SQLite API", version="0.1.0", lifespan=lifespan)
 
     def _sanitize_source_id(v: object) -> str:
         raw = str(v or "").strip()
@@ -145,10 +162,22 @@ def create_app(settings: Settings) -> FastAPI:
         cleaned = re.sub(r"[^a-zA-Z0-9._-]", "", raw)
         return cleaned or str(settings.SX_DEFAULT_SOURCE_ID or "default")
 
+    # Parsed env files keyed by path -> ((st_mtime_ns, st_size), values). The
+    # SchedulerX env is read on every media/link/note request; re-parse only
+    # when the file changes.
+    env_file_cache: dict[str, tuple[tuple[int, int], dict[str, str]]] = {}
+
     def _parse_env_file(path: Path) -> dict[str, str]:
+        try:
+            st = path.stat()
+        except OSError:
+            return {}
+        cache_key = str(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        hit = env_file_cache.get(cache_key)
+        if hit is not None and hit[0] == stamp:
+            return dict(hit[1])
         out: dict[str, str] = {}
-        if not path.exists():
-            return out
         for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
             s = line.strip()
             if not s or s.startswith("#") or "=" not in s:
@@ -161,7 +190,8 @@ def create_app(settings: Settings) -> FastAPI:
             if (val.startswith('"') and val.endswith('"')) or (val.startswith("'") and val.endswith("'")):
                 val = val[1:-1]
             out[key] = val
-        return out
+        env_file_cache[cache_key] = (stamp, out)
+        return dict(out)
 
     def _update_env_file(path: Path, updates: dict[str, str | None]) -> None:
         """Atomically update key-value pairs in a .env file.
@@ -267,7 +297,7 @@ def create_app(settings: Settings) -> FastAPI:
                         )
                     pg_conn.commit()
         else:
-            conn0 = connect(settings.SX_DB_PATH)
+            conn0 = connect(settings.SX_DB_PATH, profile=settings.SX_DB_PROFILE)
             init_db(conn0, enable_fts=settings.SX_DB_ENABLE_FTS)
             ensure_source(conn0, default_source_id, label=default_source_id)
             if not conn0.execute("SELECT 1 FROM sources WHERE is_default=1 LIMIT 1").fetchone():
@@ -324,7 +354,7 @@ def create_app(settings: Settings) -> FastAPI:
                     resolved_default = default_source_id
             else:
                 try:
-                    conn = connect(settings.SX_DB_PATH)
+                    conn = connect(settings.SX_DB_PATH, profile=settings.SX_DB_PROFILE)
                     init_db(conn, enable_fts=settings.SX_DB_ENABLE_FTS)
                     resolved_default = _sanitize_source_id(get_default_source_id(conn, fallback=default_source_id))
                 except Exception:
@@ -368,7 +398,7 @@ def create_app(settings: Settings) -> FastAPI:
             }
         else:
             try:
-                conn = connect(settings.SX_DB_PATH)
+                conn = connect(settings.SX_DB_PATH, profile=settings.SX_DB_PROFILE)
                 init_db(conn, enable_fts=settings.SX_DB_ENABLE_FTS)
                 ensure_source(conn, source_id, label=source_id)
                 conn.commit()
@@ -420,7 +450,7 @@ def create_app(settings: Settings) -> FastAPI:
     def get_sources() -> dict:
         if is_pg_primary:
             return repository.list_sources()
-        conn = connect(settings.SX_DB_PATH)
+        conn = connect(settings.SX_DB_PATH, profile=settings.SX_DB_PROFILE)
         init_db(conn, enable_fts=settings.SX_DB_ENABLE_FTS)
         rows = list_sources(conn)
         active_default = get_default_source_id(conn, fallback=default_source_id)
@@ -651,7 +681,7 @@ def create_app(settings: Settings) -> FastAPI:
                 pg_conn.commit()
             return {"ok": True, "source_id": source_id, "schema": schema_info.get("schema")}
 
-        conn = connect(settings.SX_DB_PATH)
+        conn = connect(settings.SX_DB_PATH, profile=settings.SX_DB_PROFILE)
         init_db(conn, enable_fts=settings.SX_DB_ENABLE_FTS)
         ensure_source(
             conn,
@@ -703,7 +733,7 @@ def create_app(settings: Settings) -> FastAPI:
                 pg_conn.commit()
             return {"ok": True, "source_id": sid}
 
-        conn = connect(settings.SX_DB_PATH)
+        conn = connect(settings.SX_DB_PATH, profile=settings.SX_DB_PROFILE)
         init_db(conn, enable_fts=settings.SX_DB_ENABLE_FTS)
         row = conn.execute("SELECT id FROM sources WHERE id=?", (sid,)).fetchone()
         if not row:
@@ -756,7 +786,7 @@ def create_app(settings: Settings) -> FastAPI:
                 pg_conn.commit()
             return {"ok": True, "default_source_id": sid}
 
-        conn = connect(settings.SX_DB_PATH)
+        conn = connect(settings.SX_DB_PATH, profile=settings.SX_DB_PROFILE)
         init_db(conn, enable_fts=settings.SX_DB_ENABLE_FTS)
         ensure_source(conn, sid, label=sid)
         set_default_source(conn, sid)
@@ -796,7 +826,7 @@ def create_app(settings: Settings) -> FastAPI:
                 pg_conn.commit()
             return {"ok": True, "deleted": sid}
 
-        conn = connect(settings.SX_DB_PATH)
+        conn = connect(settings.SX_DB_PATH, profile=settings.SX_DB_PROFILE)
         init_db(conn, enable_fts=settings.SX_DB_ENABLE_FTS)
 
         src = conn.execute("SELECT id, is_default FROM sources WHERE id=?", (sid,)).fetchone()
@@ -895,8 +925,12 @@ def create_app(settings: Settings) -> FastAPI:
     @app.get("/search")
     def search(request: Request, q: str = "", limit: int = 50, offset: int = 0):
         source_id = str(getattr(request.state, "sx_source_id", settings.SX_DEFAULT_SOURCE_ID))
-        conn = _conn()
-        results = search_fn(conn, q, limit=limit, offset=offset, source_id=source_id)
+        if read_pool is not None:
+            with read_pool.acquire() as conn:
+                results = search_fn(conn, q, limit=limit, offset=offset, source_id=source_id)
+        else:
+            conn = _conn()
+            results = search_fn(conn, q, limit=limit, offset=offset, source_id=source_id)
         return {"results": results, "limit": limit, "offset": offset}
 
     @app.post("/admin/bootstrap/schema")
@@ -913,7 +947,7 @@ def create_app(settings: Settings) -> FastAPI:
         if is_pg_primary and isinstance(repository, PostgresRepository):
             sid = _CTX_SOURCE_ID.get()
             return repository.connection_for_source(sid)
-        conn = connect(settings.SX_DB_PATH)
+        conn = connect(settings.SX_DB_PATH, profile=settings.SX_DB_PROFILE)
         init_db(conn, enable_fts=settings.SX_DB_ENABLE_FTS)
         return conn
 
@@ -2364,6 +2398,15 @@ def create_app(settings: Settings) -> FastAPI:
             raise HTTPException(status_code=400, detail=result.get("error"))
         return result
 
+    @app.post("/items/{item_id}/schedule/confirm-upload")
+    def confirm_schedule_upload(item_id: str, request: Request, payload: ConfirmUploadIn = Body(...)):
+        """Record a media file the client uploaded via a presigned PUT URL."""
+        source_id = _sid(request)
+        result = scheduler.confirm_upload(source_id, item_id, payload.object_name)
+        if not result.get("ok"):
+            raise HTTPException(status_code=400, detail=result.get("error"))
+        return result
+
     @app.get("/jobs")
     def list_jobs(request: Request, limit: int = 50, offset: int = 0):
         source_id = _sid(request)
@@ -4,10 +4,12 @@ import json
 import re
 import gzip
 import os
+import queue
 import subprocess
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import Annotated, Iterable, Optional
 
 try:
     import typer  # type: ignore
@@ -133,6 +135,7 @@ if typer is None:  # pragma: no cover
 from .db import (
     connect,
     ensure_source,
+    fts_needs_rebuild,
     get_default_source_id,
     init_db,
     list_sources,
@@ -164,6 +167,11 @@ BANNER = """
 """
 
 
+def _connect(s):
+    """Open the configured SQLite database with its PRAGMA profile."""
+    return connect(s.SX_DB_PATH, profile=s.SX_DB_PROFILE)
+
+
 def _project_root() -> Path:
     return Path(__file__).resolve().parent.parent
 
@@ -320,6 +328,49 @@ def _open_text_maybe_gzip(path: Path, mode: str):
         return path.open(mode, encoding="utf-8")
 
 
+def _write_jsonl_pipelined(path: Path, objs: Iterable[dict], *, batch_rows: int = 1000) -> None:
+    """Write `objs` as JSON lines to `path` (gzip when .gz), compressing on a writer thread.
+
+    The calling thread steps the DB cursor and encodes rows while the writer
+    thread compresses/writes the previous batch; the bounded queue keeps
+    memory flat for large exports.
+    """
+    chunks: queue.Queue[str | None] = queue.Queue(maxsize=8)
+    errors: list[BaseException] = []
+
+    def _writer() -> None:
+        drained = False
+        try:
+            with _open_text_maybe_gzip(path, "wt") as f:
+                while (chunk := chunks.get()) is not None:
+                    f.write(chunk)
+                drained = True
+        except BaseException as e:  # surfaced to the caller below
+            errors.append(e)
+            # Keep consuming so the producer never blocks on a full queue.
+            while not drained and chunks.get() is not None:
+                pass
+
+    writer = threading.Thread(target=_writer, name="sx-userdata-writer", daemon=True)
+    writer.start()
+    try:
+        lines: list[str] = []
+        for obj in objs:
+            lines.append(json.dumps(obj, ensure_ascii=False))
+            if len(lines) >= batch_rows:
+                if errors:
+                    break
+                chunks.put("\n".join(lines) + "\n")
+                lines = []
+        if lines and not errors:
+            chunks.put("\n".join(lines) + "\n")
+    finally:
+        chunks.put(None)
+        writer.join()
+    if errors:
+        raise errors[0]
+
+
 def _print_next_steps(steps: list[str]) -> None:
     """Print suggested next steps."""
     console.print("\n[bold green]✓ Done![/bold green]")
@@ -517,7 +568,7 @@ def status(
     ))
     
     try:
-        conn = connect(s.SX_DB_PATH)
+        conn = _connect(s)
         init_db(conn, enable_fts=s.SX_DB_ENABLE_FTS)
 
         sid = _normalize_source_id(source, fallback=get_default_source_id(conn, _normalize_source_id(s.SX_DEFAULT_SOURCE_ID)))
@@ -600,15 +651,19 @@ def import_data(
             stats = import_all(conn, consolidated, authors, bookmarks, source_id=source_id)
             conn.commit()
         else:
-            conn = connect(s.SX_DB_PATH)
+            conn = _connect(s)
             init_db(conn, enable_fts=s.SX_DB_ENABLE_FTS)
             ensure_source(conn, source_id, label=source_id)
             conn.commit()
             
+            # Checked before importing: new rows may reuse the rowids of deleted
+            # videos that the FTS index still points at.
+            stale_fts = not rebuild_index and fts_needs_rebuild(conn)
+
             progress.add_task("Importing CSV data...", total=None)
             stats = import_all(conn, consolidated, authors, bookmarks, source_id=source_id)
             
-            if rebuild_index:
+            if rebuild_index or stale_fts:
                 progress.add_task("Rebuilding search index...", total=None)
                 rebuild_fts(conn)
     
@@ -678,7 +733,7 @@ def prune_missing_media(
     """
 
     s = load_settings()
-    conn = connect(s.SX_DB_PATH)
+    conn = _connect(s)
     init_db(conn, enable_fts=s.SX_DB_ENABLE_FTS)
 
     resolver = PathResolver(
@@ -768,6 +823,8 @@ def prune_missing_media(
         )
         deleted += len(chunk)
     conn.commit()
+    # Deleted rowids can be reused by later inserts; drop their FTS entries now.
+    rebuild_fts(conn)
 
     console.print(f"\n[bold green]✓ Deleted {deleted:,} row(s) from videos[/bold green] (cascades to notes/meta).")
 
@@ -783,7 +840,7 @@ def find(
 ):
     """Search the library by caption, author, or ID."""
     s = load_settings()
-    conn = connect(s.SX_DB_PATH)
+    conn = _connect(s)
     init_db(conn, enable_fts=s.SX_DB_ENABLE_FTS)
     source_id = _normalize_source_id(source, fallback=get_default_source_id(conn, _normalize_source_id(s.SX_DEFAULT_SOURCE_ID)))
     ensure_source(conn, source_id, label=source_id)
@@ -833,7 +890,7 @@ def refresh_notes(
         conn = repo.connection_for_source(sid)
         source_id = sid
     else:
-        conn = connect(s.SX_DB_PATH)
+        conn = _connect(s)
         init_db(conn, enable_fts=s.SX_DB_ENABLE_FTS)
         source_id = _normalize_source_id(source, fallback=get_default_source_id(conn, _normalize_source_id(s.SX_DEFAULT_SOURCE_ID)))
         ensure_source(conn, source_id, label=source_id)
@@ -962,7 +1019,7 @@ def setup():
     console.print("\n[bold]Step 2: Initialize Database[/bold]")
     with Progress(SpinnerColumn(), TextColumn("{task.description}"), console=console) as progress:
         progress.add_task("Creating database...", total=None)
-        conn = connect(s.SX_DB_PATH)
+        conn = _connect(s)
         init_db(conn, enable_fts=s.SX_DB_ENABLE_FTS)
     console.print(f"[green]✓[/green] Database ready at: {s.SX_DB_PATH}")
     
@@ -999,7 +1056,7 @@ def database(
     
     with Progress(SpinnerColumn(), TextColumn("{task.description}"), console=console) as progress:
         progress.add_task("Initializing database...", total=None)
-        conn = connect(s.SX_DB_PATH)
+        conn = _connect(s)
         init_db(conn, enable_fts=s.SX_DB_ENABLE_FTS)
         
         if rebuild:
@@ -1034,7 +1091,7 @@ def export_userdata(
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
     s = load_settings()
-    conn = connect(s.SX_DB_PATH)
+    conn = _connect(s)
     init_db(conn, enable_fts=s.SX_DB_ENABLE_FTS)
 
     source_id = _normalize_source_id(source, fallback="") if source else ""
@@ -1049,52 +1106,48 @@ def export_userdata(
         "includes": {"user_meta": bool(include_meta), "video_notes": bool(include_notes)},
     }
 
-    meta_rows = []
-    note_rows = []
-    if include_meta:
-        meta_rows = conn.execute(
-                        """
-                        SELECT
-                            source_id,
-                            video_id,
-                            rating,
-                            status,
-                            statuses,
-                            tags,
-                            notes,
-                            product_link,
-                            author_links,
-                            platform_targets,
-                            workflow_log,
-                            post_url,
-                            published_time,
-                            updated_at
-                        FROM user_meta
-                        WHERE (?='' OR source_id=?)
-                        """
-                        ,
-                        (source_id, source_id),
-        ).fetchall()
-    if include_notes:
-        note_rows = conn.execute(
-            "SELECT source_id, video_id, markdown, template_version, updated_at FROM video_notes WHERE (?='' OR source_id=?)",
-            (source_id, source_id),
-        ).fetchall()
-
-    with _open_text_maybe_gzip(out_path, "wt") as f:
-        f.write(json.dumps(header, ensure_ascii=False) + "\n")
-        meta_count = 0
-        note_count = 0
-
-        for r in meta_rows:
-            obj = {"type": "user_meta", **dict(r)}
-            f.write(json.dumps(obj, ensure_ascii=False) + "\n")
-            meta_count += 1
-
-        for r in note_rows:
-            obj = {"type": "video_note", **dict(r)}
-            f.write(json.dumps(obj, ensure_ascii=False) + "\n")
-            note_count += 1
+    counts = {"user_meta": 0, "video_note": 0}
+
+    def _export_objs():
+        # Rows are read straight off the cursors (no fetchall) and encoded as
+        # they go; _write_jsonl_pipelined compresses on its own thread.
+        yield header
+        if include_meta:
+            for r in conn.execute(
+                """
+                SELECT
+                    source_id,
+                    video_id,
+                    rating,
+                    status,
+                    statuses,
+                    tags,
+                    notes,
+                    product_link,
+                    author_links,
+                    platform_targets,
+                    workflow_log,
+                    post_url,
+                    published_time,
+                    updated_at
+                FROM user_meta
+                WHERE (?='' OR source_id=?)
+                """,
+                (source_id, source_id),
+            ):
+                counts["user_meta"] += 1
+                yield {"type": "user_meta", **dict(r)}
+        if include_notes:
+            for r in conn.execute(
+                "SELECT source_id, video_id, markdown, template_version, updated_at FROM video_notes WHERE (?='' OR source_id=?)",
+                (source_id, source_id),
+            ):
+                counts["video_note"] += 1
+                yield {"type": "video_note", **dict(r)}
+
+    _write_jsonl_pipelined(out_path, _export_objs())
+    meta_count = counts["user_meta"]
+    note_count = counts["video_note"]
 
     console.print(Panel.fit(
         "\n".join(
@@ -1134,7 +1187,7 @@ def import_userdata(
         raise typer.Exit(code=1)
 
     s = load_settings()
-    conn = connect(s.SX_DB_PATH)
+    conn = _connect(s)
     init_db(conn, enable_fts=s.SX_DB_ENABLE_FTS)
 
     source_override = _normalize_source_id(source, fallback="") if source else ""
@@ -1457,7 +1510,7 @@ def media_index(
             console.print(f"[dim]Sample mapping:[/dim] {sample[0]} → {sample[1]}")
         raise typer.Exit(code=0)
 
-    conn = connect(s.SX_DB_PATH)
+    conn = _connect(s)
     init_db(conn, enable_fts=s.SX_DB_ENABLE_FTS)
 
     updated_cover = 0
@@ -1593,7 +1646,7 @@ app.add_typer(sources_app, name="sources")
 @sources_app.command("list", help="List registered sources")
 def sources_list():
     s = load_settings()
-    conn = connect(s.SX_DB_PATH)
+    conn = _connect(s)
     init_db(conn, enable_fts=s.SX_DB_ENABLE_FTS)
     ensure_source(conn, _normalize_source_id(s.SX_DEFAULT_SOURCE_ID), label=_normalize_source_id(s.SX_DEFAULT_SOURCE_ID))
     if not conn.execute("SELECT 1 FROM sources WHERE is_default=1 LIMIT 1").fetchone():
@@ -1639,7 +1692,7 @@ def sources_add(
         default = False
 
     sid = _normalize_source_id(source_id)
-    conn = connect(s.SX_DB_PATH)
+    conn = _connect(s)
     init_db(conn, enable_fts=s.SX_DB_ENABLE_FTS)
     ensure_source(conn, sid, label=(label or sid), kind=kind, description=description, enabled=True)
     if default:
@@ -1652,7 +1705,7 @@ def sources_add(
 def sources_set_default(source_id: str = typer.Argument(..., help="Source ID")):
     s = load_settings()
     sid = _normalize_source_id(source_id)
-    conn = connect(s.SX_DB_PATH)
+    conn = _connect(s)
     init_db(conn, enable_fts=s.SX_DB_ENABLE_FTS)
     ensure_source(conn, sid, label=sid, enabled=True)
     set_default_source(conn, sid)
@@ -1664,7 +1717,7 @@ def sources_set_default(source_id: str = typer.Argument(..., help="Source ID")):
 def sources_remove(source_id: str = typer.Argument(..., help="Source ID")):
     s = load_settings()
     sid = _normalize_source_id(source_id)
-    conn = connect(s.SX_DB_PATH)
+    conn = _connect(s)
     init_db(conn, enable_fts=s.SX_DB_ENABLE_FTS)
 
     row = conn.execute("SELECT is_default FROM sources WHERE id=?", (sid,)).fetchone()
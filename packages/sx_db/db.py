@@ -144,22 +144,85 @@ CREATE VIRTUAL TABLE IF NOT EXISTS videos_fts USING fts5(
 """
 
 
-def connect(db_path: Path) -> sqlite3.Connection:
-    conn = sqlite3.connect(str(db_path))
+# Per-connection PRAGMA sets, selected via Settings.SX_DB_PROFILE.
+# page_size only takes effect on a fresh database (before the first write).
+PRAGMA_PROFILES: dict[str, tuple[str, ...]] = {
+    "high_performance": (
+        "PRAGMA page_size=4096",
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA cache_size=-64000",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA wal_autocheckpoint=1000",
+    ),
+    "low_resource": (
+        "PRAGMA page_size=4096",
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA cache_size=-2000",
+        "PRAGMA mmap_size=0",
+        "PRAGMA temp_store=DEFAULT",
+        "PRAGMA wal_autocheckpoint=1000",
+    ),
+}
+DEFAULT_PRAGMA_PROFILE = "high_performance"
+
+# `PRAGMA user_version` from which `videos_fts` rowids mirror `videos.rowid`.
+# Older databases indexed FTS rows under their own rowids and are rebuilt once.
+FTS_ROWID_VERSION = 1
+
+
+class _SxConnection(sqlite3.Connection):
+    """sqlite3 connection that refreshes planner statistics on close.
+
+    `_has_fts` caches whether `videos_fts` exists (None = not checked yet), valid
+    while `PRAGMA schema_version` still equals `_has_fts_schema`.
+    """
+
+    _has_fts: bool | None = None
+    _has_fts_schema: int | None = None
+
+    def close(self) -> None:
+        try:
+            self.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
+        super().close()
+
+
+def connect(db_path: Path, *, profile: str | None = None) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(db_path), factory=_SxConnection)
     conn.row_factory = sqlite3.Row
+    key = str(profile or DEFAULT_PRAGMA_PROFILE).strip().lower()
+    for pragma in PRAGMA_PROFILES.get(key, PRAGMA_PROFILES[DEFAULT_PRAGMA_PROFILE]):
+        conn.execute(pragma)
     return conn
 
 
 def init_db(conn: sqlite3.Connection, *, enable_fts: bool) -> None:
     conn.executescript(SCHEMA_SQL)
     _ensure_columns(conn)
-    _ensure_composite_primary_keys(conn)
+    videos_rebuilt = _ensure_composite_primary_keys(conn)
     _ensure_indexes(conn)
     if enable_fts:
         conn.executescript(FTS_SQL)
+        _set_has_fts(conn, True)
+    _ensure_fts_rowids(conn, force=videos_rebuilt)
     conn.commit()
 
 
+def _ensure_fts_rowids(conn: sqlite3.Connection, *, force: bool = False) -> None:
+    """Rebuild `videos_fts` once for pre-FTS_ROWID_VERSION databases.
+
+    `force` is set when `videos` itself was just rebuilt, which renumbers rowids.
+    """
+    if not force and int(conn.execute("PRAGMA user_version").fetchone()[0]) >= FTS_ROWID_VERSION:
+        return
+    rebuild_fts(conn)
+    conn.execute(f"PRAGMA user_version={FTS_ROWID_VERSION}")
+
+
 def _ensure_columns(conn: sqlite3.Connection) -> None:
     """Best-effort schema migration for existing databases.
 
@@ -281,11 +344,12 @@ def _ensure_columns(conn: sqlite3.Connection) -> None:
         _add_column_if_missing("job_queue", "updated_at", "TEXT")
 
 
-def _ensure_composite_primary_keys(conn: sqlite3.Connection) -> None:
+def _ensure_composite_primary_keys(conn: sqlite3.Connection) -> bool:
     """Rebuild legacy tables so PKs are source-aware composites.
 
     This enables duplicate item IDs across different sources while preserving
-    strict uniqueness within a source.
+    strict uniqueness within a source. Returns True when `videos` was rebuilt
+    (its rowids changed, so the FTS index must be rebuilt too).
     """
 
     def _pk_cols(table: str) -> list[str]:
@@ -433,7 +497,8 @@ def _ensure_composite_primary_keys(conn: sqlite3.Connection) -> None:
         conn.execute(f"DROP TABLE {table}")
         conn.execute(f"ALTER TABLE {tmp} RENAME TO {table}")
 
-    if _pk_cols("videos") != ["source_id", "id"]:
+    videos_rebuilt = _pk_cols("videos") != ["source_id", "id"]
+    if videos_rebuilt:
         _rebuild_videos()
     if _pk_cols("user_meta") != ["source_id", "video_id"]:
         _rebuild_user_meta()
@@ -445,6 +510,7 @@ def _ensure_composite_primary_keys(conn: sqlite3.Connection) -> None:
         _rebuild_raw("csv_bookmarks_raw", "video_id")
     if _pk_cols("csv_authors_raw") != ["source_id", "author_id"]:
         _rebuild_raw("csv_authors_raw", "author_id")
+    return videos_rebuilt
 
 
 def _ensure_indexes(conn: sqlite3.Connection) -> None:
@@ -473,6 +539,12 @@ def _ensure_indexes(conn: sqlite3.Connection) -> None:
         conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_videos_bookmarked ON videos(bookmarked)"
         )
+    if {"source_id", "bookmarked", "updated_at"} <= videos_cols:
+        # Serves the browse/LIKE ordering (bookmarked DESC, updated_at DESC) per source
+        # without sorting every row of the source first.
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_videos_source_browse ON videos(source_id, bookmarked, updated_at)"
+        )
 
     meta_cols = _cols("user_meta")
     if "status" in meta_cols:
@@ -570,23 +642,50 @@ def set_default_source(conn: sqlite3.Connection, source_id: str) -> None:
     )
 
 
-def upsert_fts(conn: sqlite3.Connection, row: dict) -> None:
-    # If FTS table doesn't exist, skip.
-    cur = conn.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name='videos_fts'"
-    ).fetchone()
-    if not cur:
-        return
+def _schema_version(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("PRAGMA schema_version").fetchone()[0])
 
-    conn.execute(
-        "INSERT INTO videos_fts(source_id, id, caption, author_unique_id, author_name) VALUES(?, ?, ?, ?, ?)",
-        (
-            row.get("source_id") or "default",
-            row.get("id"),
-            row.get("caption") or "",
-            row.get("author_unique_id") or "",
-            row.get("author_name") or "",
-        ),
+
+def _set_has_fts(conn: sqlite3.Connection, value: bool) -> None:
+    try:
+        conn._has_fts_schema = _schema_version(conn)  # type: ignore[attr-defined]
+        conn._has_fts = value  # type: ignore[attr-defined]
+    except AttributeError:
+        pass  # plain sqlite3.Connection (not created via connect()) has no __dict__
+
+
+def has_fts_table(conn: sqlite3.Connection) -> bool:
+    """Return whether `videos_fts` exists, cached on the connection.
+
+    The cache is keyed on `PRAGMA schema_version`, so long-lived (pooled)
+    connections notice when another connection creates or drops the index.
+    """
+    cached = getattr(conn, "_has_fts", None)
+    if cached is not None and getattr(conn, "_has_fts_schema", None) == _schema_version(conn):
+        return cached
+    found = bool(
+        conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='videos_fts'").fetchone()
+    )
+    _set_has_fts(conn, found)
+    return found
+
+
+def fts_needs_rebuild(conn: sqlite3.Connection) -> bool:
+    """Return whether `videos_fts` holds rowids that no longer exist in `videos`.
+
+    Such entries come from deleted videos; once SQLite reuses their rowid for a
+    new row, search would resolve the stale entry to the wrong video.
+    """
+    if not has_fts_table(conn):
+        return False
+    return bool(
+        conn.execute(
+            """
+            SELECT 1 FROM videos_fts_docsize d
+            WHERE NOT EXISTS (SELECT 1 FROM videos v WHERE v.rowid = d.id)
+            LIMIT 1
+            """
+        ).fetchone()
     )
 
 
@@ -597,6 +696,7 @@ def rebuild_fts(conn: sqlite3.Connection) -> None:
     - `videos_fts` is created as a *contentless* FTS5 table (content=''), which
       cannot be cleared with `DELETE FROM videos_fts`.
     - The most reliable rebuild strategy is to DROP + recreate the virtual table.
+    - FTS rowids mirror `videos.rowid` so search can join back to `videos`.
     """
 
     has_fts = conn.execute(
@@ -609,9 +709,12 @@ def rebuild_fts(conn: sqlite3.Connection) -> None:
     conn.execute("DROP TABLE IF EXISTS videos_fts")
     conn.executescript(FTS_SQL)
 
-    rows = conn.execute(
-        "SELECT source_id, id, caption, author_unique_id, author_name FROM videos"
-    ).fetchall()
-    for r in rows:
-        upsert_fts(conn, dict(r))
+    conn.execute(
+        """
+        INSERT INTO videos_fts(rowid, source_id, id, caption, author_unique_id, author_name)
+        SELECT rowid, COALESCE(source_id, 'default'), id,
+               COALESCE(caption, ''), COALESCE(author_unique_id, ''), COALESCE(author_name, '')
+        FROM videos
+        """
+    )
     conn.commit()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from .db import DEFAULT_PRAGMA_PROFILE, PRAGMA_PROFILES, _SxConnection
+
+# Per-connection PRAGMAs that are valid on a read-only connection; journal_mode,
+# page_size and wal_autocheckpoint belong to the writer.
+_READ_PRAGMA_PREFIXES = ("PRAGMA cache_size", "PRAGMA mmap_size", "PRAGMA temp_store")
+
+
+class ReadPool:
+    """Small pool of read-only SQLite connections for query paths like search.
+
+    Connections are opened lazily with `mode=ro` (up to `size`) and handed out
+    one caller at a time via `acquire()`. Under WAL they read concurrently with
+    the single writer and never take the write lock.
+    """
+
+    def __init__(self, db_path: Path, *, size: int = 4, profile: str | None = None, timeout: float = 30.0):
+        self.db_path = Path(db_path)
+        self.size = max(1, int(size))
+        self.profile = profile
+        self.timeout = float(timeout)
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._all: list[sqlite3.Connection] = []
+
+    def _open(self) -> sqlite3.Connection:
+        uri = self.db_path.resolve().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False, factory=_SxConnection)
+        conn.row_factory = sqlite3.Row
+        key = str(self.profile or DEFAULT_PRAGMA_PROFILE).strip().lower()
+        for pragma in PRAGMA_PROFILES.get(key, PRAGMA_PROFILES[DEFAULT_PRAGMA_PROFILE]):
+            if pragma.startswith(_READ_PRAGMA_PREFIXES):
+                conn.execute(pragma)
+        conn.execute("PRAGMA query_only=1")
+        return conn
+
+    @contextmanager
+    def acquire(self) -> Iterator[sqlite3.Connection]:
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._lock:
+                if len(self._all) < self.size:
+                    conn = self._open()
+                    self._all.append(conn)
+            if conn is None:
+                conn = self._idle.get(timeout=self.timeout)
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            conns, self._all = self._all, []
+        self._idle = queue.LifoQueue()
+        for conn in conns:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
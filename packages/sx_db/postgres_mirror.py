@@ -67,10 +67,22 @@ def _to_int(value: object) -> int | None:
         return None
 
 
+# Parsed env files: path -> ((st_mtime_ns, st_size), values). The mirror check
+# runs on every API request, so the SchedulerX env is re-parsed only on change.
+_ENV_FILE_CACHE: dict[str, tuple[tuple[int, int], dict[str, str]]] = {}
+
+
 def _parse_env_file(path: Path) -> dict[str, str]:
+    try:
+        st = path.stat()
+    except OSError:
+        return {}
+    cache_key = str(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _ENV_FILE_CACHE.get(cache_key)
+    if hit is not None and hit[0] == stamp:
+        return dict(hit[1])
     out: dict[str, str] = {}
-    if not path.exists():
-        return out
     for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
         s = line.strip()
         if not s or s.startswith("#") or "=" not in s:
@@ -83,7 +95,8 @@ def _parse_env_file(path: Path) -> dict[str, str]:
         if (val.startswith('"') and val.endswith('"')) or (val.startswith("'") and val.endswith("'")):
             val = val[1:-1]
         out[key] = val
-    return out
+    _ENV_FILE_CACHE[cache_key] = (stamp, out)
+    return dict(out)
 
 
 def _build_db_url_from_alias(env_map: dict[str, str], alias: str) -> str | None:
@@ -168,7 +181,7 @@ def _sync_from_postgres(settings: Settings, source_id: str, pg_url: str) -> dict
             "source_id": source_id,
         }
 
-    sqlite_conn = connect(settings.SX_DB_PATH)
+    sqlite_conn = connect(settings.SX_DB_PATH, profile=settings.SX_DB_PROFILE)
     init_db(sqlite_conn, enable_fts=settings.SX_DB_ENABLE_FTS)
     ensure_source(sqlite_conn, source_id, label=source_id)
 
@@ -34,9 +34,13 @@ class Repository(Protocol):
 
 
 _SAFE_IDENT = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_CLEAN_SID = re.compile(r"[A-Za-z0-9._-]+")
 
 
 def sanitize_source_id(v: object, fallback: str = "default") -> str:
+    # Fast path: most ids ("default", "sx_p01") are already clean.
+    if isinstance(v, str) and v and _CLEAN_SID.fullmatch(v):
+        return v
     raw = str(v or "").strip() or str(fallback or "default").strip()
     cleaned = re.sub(r"[^a-zA-Z0-9._-]", "", raw)
     return cleaned or "default"
@@ -87,7 +91,7 @@ class SqliteRepository:
         self.settings = settings
 
     def _conn(self):
-        conn = connect(self.settings.SX_DB_PATH)
+        conn = connect(self.settings.SX_DB_PATH, profile=self.settings.SX_DB_PROFILE)
         init_db(conn, enable_fts=self.settings.SX_DB_ENABLE_FTS)
         return conn
 
@@ -188,22 +192,47 @@ class _FakeCursor:
         return self._many or []
 
 
+class CompatRowBatch:
+    """Shared column layout for all rows of one result set.
+
+    Rows built from the same batch keep only a value tuple and reuse the
+    batch's key tuple and key→index map.
+    """
+
+    __slots__ = ("keys", "index")
+
+    def __init__(self, keys: tuple[str, ...]):
+        self.keys = keys
+        self.index = {k: i for i, k in enumerate(keys)}
+
+    def row(self, data: Mapping[str, Any]) -> CompatRow:
+        return CompatRow._from_batch(self, tuple(data.values()))
+
+
 class CompatRow(Mapping[str, Any]):
-    def __init__(self, data: dict[str, Any]):
-        self._data = dict(data)
-        self._keys = list(self._data.keys())
-        self._vals = [self._data[k] for k in self._keys]
+    __slots__ = ("_batch", "_vals")
+
+    def __init__(self, data: Mapping[str, Any]):
+        self._batch = CompatRowBatch(tuple(data.keys()))
+        self._vals = tuple(data.values())
+
+    @classmethod
+    def _from_batch(cls, batch: CompatRowBatch, vals: tuple[Any, ...]) -> CompatRow:
+        row = cls.__new__(cls)
+        row._batch = batch
+        row._vals = vals
+        return row
 
     def __getitem__(self, key):
         if isinstance(key, int):
             return self._vals[key]
-        return self._data[key]
+        return self._vals[self._batch.index[key]]
 
     def __iter__(self):
-        return iter(self._data)
+        return iter(self._batch.keys)
 
     def __len__(self):
-        return len(self._data)
+        return len(self._vals)
 
 
 class CompatCursor:
@@ -219,15 +248,19 @@ class CompatCursor:
         if row is None:
             return None
         if isinstance(row, Mapping):
-            return CompatRow(dict(row))
+            return CompatRow(row)
         return row
 
     def fetchall(self):
         rows = self._cur.fetchall() or []
         out = []
+        batch: CompatRowBatch | None = None
         for row in rows:
             if isinstance(row, Mapping):
-                out.append(CompatRow(dict(row)))
+                # dict_row yields the same column order for every row of a result set.
+                if batch is None:
+                    batch = CompatRowBatch(tuple(row.keys()))
+                out.append(batch.row(row))
             else:
                 out.append(row)
         return out
@@ -288,6 +321,9 @@ class PostgresRepository:
         self._dsn = str(settings.SX_POSTGRES_DSN or "").strip()
         self._schema_prefix = safe_ident(str(settings.SX_POSTGRES_SCHEMA_PREFIX or "sx"))
         self._registry_table = safe_ident(str(settings.SX_POSTGRES_REGISTRY_TABLE or "sx_source_registry"))
+        # Set once the global tables and default source are in place; later
+        # resolve_schema()/connection_for_source() calls skip the bootstrap.
+        self._globals_ready = False
 
     def _require_psycopg(self):
         try:
@@ -342,6 +378,8 @@ class PostgresRepository:
             )
 
     def _ensure_global_tables(self, conn) -> None:
+        if self._globals_ready:
+            return
         with conn.cursor() as cur:
             cur.execute(
                 f"""
@@ -369,7 +407,21 @@ class PostgresRepository:
                 )
                 """
             )
+            # Ensure a default source exists up-front so read paths never need a
+            # conditional write. No-op once any source is flagged as default.
+            default_sid = sanitize_source_id(self.settings.SX_DEFAULT_SOURCE_ID)
+            now = datetime.utcnow().isoformat(timespec="seconds") + "Z"
+            cur.execute(
+                """
+                INSERT INTO public.sources(id, label, enabled, is_default, created_at, updated_at)
+                SELECT %s, %s, 1, 1, %s, %s
+                WHERE NOT EXISTS (SELECT 1 FROM public.sources WHERE is_default=1)
+                ON CONFLICT(id) DO UPDATE SET is_default=1, updated_at=EXCLUDED.updated_at
+                """,
+                (default_sid, default_sid, now, now),
+            )
         conn.commit()
+        self._globals_ready = True
 
     def _create_schema_objects(self, conn, schema: str) -> None:
         safe_schema = safe_ident(schema)
@@ -690,24 +742,15 @@ class PostgresRepository:
 
     def list_sources(self) -> dict[str, Any]:
         with self._connect() as conn:
+            # _ensure_global_tables guarantees a default row, so this path is read-only.
             self._ensure_global_tables(conn)
             with conn.cursor() as cur:
                 cur.execute("SELECT id, label, kind, description, enabled, is_default, created_at, updated_at FROM public.sources ORDER BY id")
                 rows = [dict(r) for r in (cur.fetchall() or [])]
-                cur.execute("SELECT id FROM public.sources WHERE is_default=1 LIMIT 1")
-                d = cur.fetchone()
-                default_sid = str(d["id"]) if d and d.get("id") else sanitize_source_id(self.settings.SX_DEFAULT_SOURCE_ID)
-                if not d:
-                    now = datetime.utcnow().isoformat(timespec="seconds") + "Z"
-                    cur.execute(
-                        """
-                        INSERT INTO public.sources(id, label, enabled, is_default, created_at, updated_at)
-                        VALUES(%s, %s, 1, 1, %s, %s)
-                        ON CONFLICT(id) DO UPDATE SET is_default=1, updated_at=EXCLUDED.updated_at
-                        """,
-                        (default_sid, default_sid, now, now),
-                    )
-                    conn.commit()
+        default_sid = next(
+            (str(r["id"]) for r in rows if r.get("is_default") and r.get("id")),
+            sanitize_source_id(self.settings.SX_DEFAULT_SOURCE_ID),
+        )
         return {"sources": rows, "default_source_id": default_sid}
 
     def list_items(self, source_id: str, *, limit: int = 50, offset: int = 0) -> dict[str, Any]:
@@ -7,21 +7,70 @@ and managing the job queue for publishing.
 
 import json
 import logging
+import os
+import re
+import shutil
 import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import boto3
+import yaml
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from .settings import Settings
 from .repositories import get_repository
+from .writer import WriterQueue
 
 logger = logging.getLogger(__name__)
 
+# Large media goes up as concurrent multipart chunks; small files stay single-PUT.
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+_UPLOAD_WORKERS = 8
+# Upper bound on waiting for the writer thread, so a stuck writer cannot hang requests.
+_WRITE_TIMEOUT = 60.0
+# Every upload worker may run max_concurrency part uploads at once; size the
+# botocore pool to match (its default of 10 would serialize them).
+_R2_MAX_POOL_CONNECTIONS = _UPLOAD_WORKERS * _TRANSFER_CONFIG.max_concurrency
+
+# libyaml's C loader/dumper when available; same safe semantics as safe_load/safe_dump.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# [[media.mp4]] wikilinks or ![alt](path.mp4) embeds, in one pass.
+_MEDIA_RE = re.compile(r"\[\[([^\]]*?\.mp4)\]\]|!\[[^\]]*\]\(([^)]*?\.mp4)\)", re.IGNORECASE)
+
+_ARTIFACT_UPSERT_SQL = """
+    INSERT INTO scheduling_artifacts 
+    (source_id, video_id, platform, artifact_json, r2_media_url, status, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, 'draft_review', ?, ?)
+    ON CONFLICT(source_id, video_id, platform) DO UPDATE SET
+        artifact_json=excluded.artifact_json,
+        r2_media_url=excluded.r2_media_url,
+        updated_at=excluded.updated_at
+"""
+_JOB_INSERT_SQL = """
+    INSERT INTO job_queue
+    (id, source_id, video_id, platform, action, status, scheduled_time, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, 'pending', ?, ?, ?)
+"""
+_ARTIFACT_MEDIA_UPDATE_SQL = """
+    UPDATE scheduling_artifacts
+    SET r2_media_url=?, updated_at=?
+    WHERE source_id=? AND video_id=?
+"""
+
 class Scheduler:
     def __init__(self, settings: Settings):
         self.settings = settings
@@ -35,38 +84,126 @@ class Scheduler:
                 endpoint_url=f"https://{settings.SX_R2_ACCOUNT_ID}.r2.cloudflarestorage.com",
                 aws_access_key_id=settings.SX_R2_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.SX_R2_SECRET_ACCESS_KEY,
-                config=Config(signature_version="s3v4"),
+                config=Config(signature_version="s3v4", max_pool_connections=_R2_MAX_POOL_CONNECTIONS),
                 region_name="auto"
             )
+        # boto3 clients are thread-safe, so all media uploads share self.s3_client.
+        self._upload_pool = ThreadPoolExecutor(max_workers=_UPLOAD_WORKERS, thread_name_prefix="sx-r2-upload")
+        # All local SQLite writes go through one writer thread (started on first use).
+        self._writer = WriterQueue(settings.SX_DB_PATH, profile=settings.SX_DB_PROFILE)
+        # stem -> note path, plus the mtime of every scanned directory so a
+        # note added/removed/renamed anywhere in the vault invalidates the index.
+        self._note_index: dict[str, Path] | None = None
+        self._note_index_dirs: dict[str, float] = {}
+        self._note_index_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Flush queued DB writes and release worker threads."""
+        self._writer.close()
+        self._upload_pool.shutdown(wait=True)
+
+    def _vault_path(self) -> Path:
+        return Path(self.settings.SX_VAULT_PATH or ".")
+
+    def _scan_notes(self, vault_path: Path) -> tuple[dict[str, Path], dict[str, float]]:
+        index: dict[str, Path] = {}
+        dirs: dict[str, float] = {}
+        stack = [str(vault_path)]
+        while stack:
+            d = stack.pop()
+            try:
+                dirs[d] = os.stat(d).st_mtime
+                entries = os.scandir(d)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue  # .obsidian, .trash, .git
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".md"):
+                        index.setdefault(entry.name[:-3], Path(entry.path))
+        return index, dirs
+
+    def _note_index_stale(self) -> bool:
+        for d, mtime in self._note_index_dirs.items():
+            try:
+                if os.stat(d).st_mtime != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
 
     def _get_note_path(self, source_id: str, video_id: str) -> Path | None:
         """Find the markdown note for a given video."""
         # For MVP, assume notes are in the active vault directory
         # The true resolution would use sx config or path logic
-        vault_path = Path(self.settings.SX_VAULT_PATH or ".")
+        vault_path = self._vault_path()
         possible_note = vault_path / "Videos" / f"{video_id}.md"
         if possible_note.exists():
             return possible_note
-            
-        # Try finding anywhere in vault
-        for md_file in vault_path.rglob("*.md"):
-            if md_file.stem == video_id:
-                return md_file
-        return None
+
+        # Try finding anywhere in vault via a cached stem index; rebuild only
+        # when a directory changed since the last scan.
+        with self._note_index_lock:
+            if self._note_index is not None:
+                hit = self._note_index.get(video_id)
+                if hit is not None and hit.exists():
+                    return hit
+            if self._note_index is None or self._note_index_stale():
+                self._note_index, self._note_index_dirs = self._scan_notes(vault_path)
+            return self._note_index.get(video_id)
 
     def _extract_media_paths(self, markdown_text: str) -> list[str]:
         """Extract media references from markdown (e.g., [[media.mp4]] or ![cover](/path/to/media.mp4))."""
-        # Very simplified extraction for prototype
-        paths = []
-        import re
-        # Match [[filename.mp4]]
-        matches = re.findall(r"\[\[(.*?\.mp4)\]\]", markdown_text, re.IGNORECASE)
-        paths.extend(matches)
-        
-        # Match ![alt](path.mp4)
-        matches2 = re.findall(r"\!\[.*?\]\((.*?\.mp4)\)", markdown_text, re.IGNORECASE)
-        paths.extend(matches2)
-        return list(set(paths))
+        # Very simplified extraction for prototype; dict keeps first-seen order while deduping.
+        paths: dict[str, None] = {}
+        for m in _MEDIA_RE.finditer(markdown_text):
+            paths[m.group(1) or m.group(2)] = None
+        return list(paths)
+
+    def _resolve_media(
+        self, m_path: str, roots: tuple[Path, ...], dir_files: dict[Path, dict[str, Path]]
+    ) -> Path | None:
+        """Resolve a media reference against `roots` in order.
+
+        Bare file names are looked up in one `os.scandir` listing per root
+        (memoized in `dir_files` for the caller), instead of a stat per
+        candidate; references with directory parts fall back to `exists()`.
+        """
+        if "/" in m_path or "\\" in m_path:
+            for root in roots:
+                full_path = root / m_path
+                if full_path.exists():
+                    return full_path
+            return None
+        for root in roots:
+            files = dir_files.get(root)
+            if files is None:
+                files = {}
+                try:
+                    with os.scandir(root) as entries:
+                        for entry in entries:
+                            if entry.is_file():
+                                files[entry.name] = Path(entry.path)
+                except OSError:
+                    pass
+                dir_files[root] = files
+            hit = files.get(m_path)
+            if hit is not None:
+                return hit
+        return None
+
+    def _content_type(self, local_path: Path) -> str:
+        return "video/mp4" if local_path.suffix.lower() == ".mp4" else "image/jpeg"
+
+    def _public_url(self, object_name: str) -> str:
+        # Construct public URL assuming custom domain or standard R2 bucket URL
+        public_domain = getattr(self.settings, "SX_R2_PUBLIC_DOMAIN", None)
+        if public_domain:
+            return f"https://{public_domain}/{object_name}"
+        return f"https://{self.settings.SX_R2_BUCKET_NAME}.r2.cloudflarestorage.com/{object_name}"
 
     def _upload_to_r2(self, local_path: Path, object_name: str) -> str | None:
         """Upload a file to R2 and return its URL."""
@@ -74,29 +211,111 @@ class Scheduler:
             logger.warning("R2 client not configured. Skipping upload.")
             return None
             
+        extra_args = {"ContentType": self._content_type(local_path)}
         try:
-            content_type = "video/mp4" if local_path.suffix.lower() == ".mp4" else "image/jpeg"
+            # upload_file reads each part from disk as it is sent; handing
+            # s3transfer a seekable file object instead makes it copy every
+            # part into a BytesIO.
             self.s3_client.upload_file(
-                str(local_path), 
-                self.settings.SX_R2_BUCKET_NAME, 
+                str(local_path),
+                self.settings.SX_R2_BUCKET_NAME,
                 object_name,
-                ExtraArgs={"ContentType": content_type}
+                ExtraArgs=extra_args,
+                Config=_TRANSFER_CONFIG,
             )
-            
-            # Construct public URL assuming custom domain or standard R2 bucket URL
-            public_domain = getattr(self.settings, "SX_R2_PUBLIC_DOMAIN", None)
-            if public_domain:
-                return f"https://{public_domain}/{object_name}"
-            return f"https://{self.settings.SX_R2_BUCKET_NAME}.r2.cloudflarestorage.com/{object_name}"
-        except ClientError as e:
+            return self._public_url(object_name)
+        except (ClientError, OSError) as e:
             logger.error(f"Failed to upload to R2: {e}")
             return None
 
-    def enqueue_scheduling_job(self, source_id: str, video_id: str) -> dict[str, Any]:
-        """
-        Process a note conceptually transitioning to 'status: scheduling'.
-        Generates artifact, uploads to R2, and queues a job.
+    def _presign_put(self, object_name: str, content_type: str) -> str | None:
+        """Return a presigned PUT URL so the client can upload straight to R2."""
+        if not self.s3_client or not self.settings.SX_R2_BUCKET_NAME:
+            logger.warning("R2 client not configured. Skipping presign.")
+            return None
+
+        try:
+            return self.s3_client.generate_presigned_url(
+                "put_object",
+                Params={
+                    "Bucket": self.settings.SX_R2_BUCKET_NAME,
+                    "Key": object_name,
+                    "ContentType": content_type,
+                },
+                ExpiresIn=int(self.settings.SX_R2_PRESIGN_EXPIRES_SEC),
+            )
+        except ClientError as e:
+            logger.error(f"Failed to presign R2 upload: {e}")
+            return None
+
+    def _uses_presigned_uploads(self) -> bool:
+        mode = str(getattr(self.settings, "SX_R2_UPLOAD_MODE", "server") or "server").strip().lower()
+        return mode == "presigned"
+
+    def _frontmatter_bounds(self, content: str) -> tuple[int, int] | None:
+        """Return (start, end) of the YAML between the leading `---` fences.
+
+        `end` points at the newline before the closing fence, so the body
+        (including its first newline) starts at `end + 4`.
         """
+        if not content.startswith("---"):
+            return None
+        end = content.find("\n---", 3)
+        if end == -1:
+            return None
+        return 3, end
+
+    def _read_frontmatter(self, content: str) -> dict[str, Any]:
+        frontmatter = {}
+        bounds = self._frontmatter_bounds(content)
+        if bounds:
+            try:
+                frontmatter = yaml.load(content[bounds[0]:bounds[1]], Loader=_YAML_LOADER) or {}
+            except yaml.YAMLError:
+                pass
+        return frontmatter
+
+    def _write_frontmatter(self, note_path: Path, content: str, frontmatter: dict[str, Any]) -> None:
+        bounds = self._frontmatter_bounds(content)
+        if not bounds:
+            return
+        new_fm = yaml.dump(frontmatter, Dumper=_YAML_DUMPER, sort_keys=False)
+        # Write to a sibling temp file and swap it in so readers never see a
+        # half-written note.
+        tmp_path = note_path.with_name(note_path.name + ".tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as f:
+                f.write("---\n")
+                f.write(new_fm)
+                f.write("---")
+                f.write(content[bounds[1] + 4:])
+            # The temp file was created with umask permissions; keep the note's.
+            shutil.copymode(note_path, tmp_path)
+            os.replace(tmp_path, note_path)
+        except BaseException:
+            # Never leave a stray .md.tmp in the vault.
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _write(self, source_id: str, unit: list[tuple[str, list[Any]]]) -> None:
+        """Apply (sql, rows) statements atomically for a source."""
+        if not hasattr(self.repo, "connection_for_source"):
+            self._writer.submit_unit(unit).result(timeout=_WRITE_TIMEOUT)
+            return
+
+        conn = self.repo.connection_for_source(source_id)
+        try:
+            for sql, rows in unit:
+                conn.executemany(sql, rows)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _prepare_job(self, source_id: str, video_id: str) -> dict[str, Any]:
+        """Parse the note, upload media, and build the artifact/job rows (no DB writes)."""
         note_path = self._get_note_path(source_id, video_id)
         if not note_path:
             return {"ok": False, "error": f"Note not found for {video_id}"}
@@ -104,41 +323,49 @@ class Scheduler:
         content = note_path.read_text(encoding="utf-8")
         
         # 1. Parse Frontmatter (simplified)
-        import yaml
-        frontmatter = {}
-        if content.startswith("---"):
-            parts = content.split("---", 2)
-            if len(parts) >= 3:
-                try:
-                    frontmatter = yaml.safe_load(parts[1]) or {}
-                except yaml.YAMLError:
-                    pass
-                    
-        # 2. Upload Media to R2
-        r2_url = None
+        frontmatter = self._read_frontmatter(content)
+
+        # 2. Upload Media to R2 (all resolved media, concurrently)
         media_paths = self._extract_media_paths(content)
-        # For simplicity in MVP, take the first valid media path
-        vault_path = Path(self.settings.SX_VAULT_PATH or ".")
+        vault_path = self._vault_path()
+        dir_files: dict[Path, dict[str, Path]] = {}
+        uploads: list[tuple[Path, str]] = []
         for m_path in media_paths:
             # Try to resolve relative to note or vault
-            full_path = note_path.parent / m_path
-            if not full_path.exists():
-                full_path = vault_path / m_path
-                if not full_path.exists():
-                    continue
-            
-            r2_url = self._upload_to_r2(full_path, f"{source_id}/{video_id}/{full_path.name}")
-            if r2_url:
-                # Update frontmatter in file (writeback)
-                frontmatter["r2_media_url"] = r2_url
-                # Simplified writeback logic:
-                if content.startswith("---"):
-                    parts = content.split("---", 2)
-                    new_fm = yaml.dump(frontmatter, sort_keys=False)
-                    new_content = f"---\n{new_fm}---\n{parts[2].strip()}"
-                    note_path.write_text(new_content, encoding="utf-8")
-                break
-                
+            full_path = self._resolve_media(m_path, (note_path.parent, vault_path), dir_files)
+            if full_path is None:
+                continue
+            uploads.append((full_path, f"{source_id}/{video_id}/{full_path.name}"))
+
+        upload_targets: list[dict[str, Any]] = []
+        r2_urls: list[str] = []
+        if self._uses_presigned_uploads():
+            # Client pushes bytes to R2 itself, then calls confirm_upload().
+            for full_path, object_name in uploads:
+                content_type = self._content_type(full_path)
+                url = self._presign_put(object_name, content_type)
+                if url:
+                    upload_targets.append(
+                        {
+                            "object_name": object_name,
+                            "local_path": str(full_path),
+                            "content_type": content_type,
+                            "put_url": url,
+                            "public_url": self._public_url(object_name),
+                        }
+                    )
+        else:
+            futures = [self._upload_pool.submit(self._upload_to_r2, fp, obj) for fp, obj in uploads]
+            r2_urls = [url for url in (f.result() for f in futures) if url]
+        r2_url = r2_urls[0] if r2_urls else None
+
+        if r2_url:
+            # Update frontmatter in file (writeback) once for all uploads
+            frontmatter["r2_media_url"] = r2_url
+            if len(r2_urls) > 1:
+                frontmatter["r2_media_urls"] = r2_urls
+            self._write_frontmatter(note_path, content, frontmatter)
+
         # 3. Create Artifact
         platform = frontmatter.get("platform", "tiktok")
         publish_time = frontmatter.get("publish_time")
@@ -148,48 +375,98 @@ class Scheduler:
             "caption": frontmatter.get("caption", ""),
             "tags": frontmatter.get("tags", []),
             "r2_media_url": r2_url,
+            "r2_media_urls": r2_urls,
             "platform": platform,
             "scheduled_time": publish_time
         }
         
         now = datetime.utcnow().isoformat() + "Z"
-        
+        job_id = f"job_{video_id}_{uuid.uuid4().hex}"
+        action = "publish_scheduled" if publish_time else "publish_draft"
+        return {
+            "ok": True,
+            "job_id": job_id,
+            "artifact": artifact,
+            "upload_targets": upload_targets,
+            "artifact_row": (source_id, video_id, platform, json.dumps(artifact), r2_url, now, now),
+            "job_row": (job_id, source_id, video_id, platform, action, publish_time, now, now),
+        }
+
+    def _persist_jobs(self, source_id: str, prepared: list[dict[str, Any]]) -> None:
+        """Write all artifact + job rows for one source in a single transaction."""
+        artifact_rows = [p["artifact_row"] for p in prepared]
+        job_rows = [p["job_row"] for p in prepared]
+
         # 4. Save to DB (SQLite / Supabase Mirror)
-        conn = self.repo.connection_for_source(source_id) if hasattr(self.repo, "connection_for_source") else connect(self.settings.SX_DB_PATH)
-        job_id = f"job_{video_id}_{int(time.time())}"
-        
-        try:
-            # Insert Artifact
-            conn.execute(
-                """
-                INSERT INTO scheduling_artifacts 
-                (source_id, video_id, platform, artifact_json, r2_media_url, status, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, 'draft_review', ?, ?)
-                ON CONFLICT(source_id, video_id, platform) DO UPDATE SET
-                    artifact_json=excluded.artifact_json,
-                    r2_media_url=excluded.r2_media_url,
-                    updated_at=excluded.updated_at
-                """,
-                (source_id, video_id, platform, json.dumps(artifact), r2_url, now, now)
-            )
-            
-            # Queue Job
-            action = "publish_scheduled" if publish_time else "publish_draft"
-            conn.execute(
-                """
-                INSERT INTO job_queue
-                (id, source_id, video_id, platform, action, status, scheduled_time, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, 'pending', ?, ?, ?)
-                """,
-                (job_id, source_id, video_id, platform, action, publish_time, now, now)
-            )
-            conn.commit()
-            
-        finally:
-            if hasattr(conn, "close"):
-                conn.close()
-                
-        return {"ok": True, "job_id": job_id, "artifact": artifact}
+        self._write(
+            source_id,
+            [(_ARTIFACT_UPSERT_SQL, artifact_rows), (_JOB_INSERT_SQL, job_rows)],
+        )
+
+    def enqueue_many(self, items: list[tuple[str, str]]) -> list[dict[str, Any]]:
+        """Enqueue several (source_id, video_id) notes.
+
+        All notes are parsed (and media uploaded) first; rows are then written with
+        one transaction per source instead of one per note.
+        """
+        prepared = [self._prepare_job(sid, vid) for sid, vid in items]
+
+        by_source: dict[str, list[dict[str, Any]]] = {}
+        for (sid, _vid), p in zip(items, prepared):
+            if p.get("ok"):
+                by_source.setdefault(sid, []).append(p)
+        # A failed source transaction only fails that source's entries.
+        persist_errors: dict[str, str] = {}
+        for sid, batch in by_source.items():
+            try:
+                self._persist_jobs(sid, batch)
+            except Exception as e:
+                logger.error(f"Failed to persist scheduling jobs for {sid}: {e}")
+                persist_errors[sid] = str(e)
+
+        results: list[dict[str, Any]] = []
+        for (sid, vid), p in zip(items, prepared):
+            if not p.get("ok"):
+                results.append(p)
+                continue
+            if sid in persist_errors:
+                results.append({"ok": False, "error": f"Failed to persist job for {vid}: {persist_errors[sid]}"})
+                continue
+            artifact = p["artifact"]
+            if p["upload_targets"]:
+                # Attached after persisting so signed URLs never land in artifact_json.
+                artifact["upload_targets"] = p["upload_targets"]
+            results.append({"ok": True, "job_id": p["job_id"], "artifact": artifact})
+        return results
+
+    def enqueue_scheduling_job(self, source_id: str, video_id: str) -> dict[str, Any]:
+        """
+        Process a note conceptually transitioning to 'status: scheduling'.
+        Generates artifact, uploads to R2, and queues a job.
+        """
+        return self.enqueue_many([(source_id, video_id)])[0]
+
+    def confirm_upload(self, source_id: str, video_id: str, object_name: str) -> dict[str, Any]:
+        """Record a client-side (presigned) upload as the note's R2 media URL."""
+        expected_prefix = f"{source_id}/{video_id}/"
+        if not object_name.startswith(expected_prefix):
+            return {"ok": False, "error": f"object_name must start with {expected_prefix!r}"}
+        # The prefix check alone lets "src/vid/../../other/x" through.
+        if "\\" in object_name or any(seg in ("", ".", "..") for seg in object_name.split("/")):
+            return {"ok": False, "error": "object_name must not contain empty, '.' or '..' path segments"}
+
+        r2_url = self._public_url(object_name)
+        now = datetime.utcnow().isoformat() + "Z"
+
+        note_path = self._get_note_path(source_id, video_id)
+        if note_path:
+            content = note_path.read_text(encoding="utf-8")
+            frontmatter = self._read_frontmatter(content)
+            frontmatter["r2_media_url"] = r2_url
+            self._write_frontmatter(note_path, content, frontmatter)
+
+        self._write(source_id, [(_ARTIFACT_MEDIA_UPDATE_SQL, [(r2_url, now, source_id, video_id)])])
+        return {"ok": True, "video_id": video_id, "r2_media_url": r2_url}
 
     def start_worker(self, poll_interval: int = 60):
         """Start a background worker to poll for pending jobs."""
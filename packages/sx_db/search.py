@@ -2,6 +2,35 @@ from __future__ import annotations
 
 import sqlite3
 
+from .db import has_fts_table
+
+
+def _sanitize_fts(q: str) -> str:
+    """Turn free text into a safe FTS5 MATCH expression.
+
+    Every whitespace-separated term is double-quoted (internal quotes doubled)
+    so operators/punctuation like `foo:bar` or a stray `"` cannot raise a syntax
+    error, and the last term gets `*` for as-you-type prefix matching.
+    """
+    terms = ['"' + t.replace('"', '""') + '"' for t in q.split()]
+    if terms:
+        terms[-1] += "*"
+    return " ".join(terms)
+
+
+def _fetch_dicts(cur) -> list[dict]:
+    """Materialize result rows as dicts with minimal per-row overhead.
+
+    For sqlite cursors, rows are fetched as plain tuples (no per-row
+    sqlite3.Row object) and zipped with the column names read once from
+    `cursor.description`. Other cursors (postgres compat) fall back to dict(row).
+    """
+    if isinstance(cur, sqlite3.Cursor):
+        cur.row_factory = None
+        cols = tuple(d[0] for d in cur.description)
+        return [dict(zip(cols, r)) for r in cur.fetchall()]
+    return [dict(r) for r in cur.fetchall()]
+
 
 def search(
     conn: sqlite3.Connection,
@@ -13,43 +42,61 @@ def search(
 ) -> list[dict]:
     q = (q or "").strip()
     if not q:
-        rows = conn.execute(
-            "SELECT id, author_unique_id, author_name, substr(caption, 1, 160) AS snippet, bookmarked "
-            "FROM videos WHERE source_id=? ORDER BY bookmarked DESC, updated_at DESC LIMIT ? OFFSET ?",
-            (source_id, limit, offset),
-        ).fetchall()
-        return [dict(r) for r in rows]
-
-    # FTS path if present
-    has_fts = conn.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name='videos_fts'"
-    ).fetchone()
-
-    if has_fts:
+        return _fetch_dicts(
+            conn.execute(
+                "SELECT id, author_unique_id, author_name, substr(caption, 1, 160) AS snippet, bookmarked "
+                "FROM videos WHERE source_id=? ORDER BY bookmarked DESC, updated_at DESC LIMIT ? OFFSET ?",
+                (source_id, limit, offset),
+            )
+        )
+
+    # FTS path if present (existence is cached on the connection)
+    if has_fts_table(conn):
         try:
-            rows = conn.execute(
+            # videos_fts is contentless (its columns read back NULL), so join on rowid.
+            # bm25 column weights: source_id, id (unindexed), caption, author_unique_id, author_name.
+            # The inner query ranks and pages rowids only; captions are read for
+            # the returned page instead of being carried through the sort.
+            match = _sanitize_fts(q)
+            cur = conn.execute(
                 """
                 SELECT v.id, v.author_unique_id, v.author_name,
                        substr(v.caption, 1, 160) AS snippet,
                        v.bookmarked,
-                       bm25(videos_fts) AS score
-                FROM videos_fts
-                JOIN videos v ON v.id = videos_fts.id AND v.source_id = videos_fts.source_id
-                WHERE videos_fts MATCH ? AND v.source_id=?
-                ORDER BY score
-                LIMIT ? OFFSET ?
+                       hits.score
+                FROM (
+                    SELECT v.rowid AS rid, bm25(videos_fts, 0.0, 0.0, 10.0, 5.0, 5.0) AS score
+                    FROM videos_fts
+                    JOIN videos v ON v.rowid = videos_fts.rowid
+                    WHERE videos_fts MATCH ? AND v.source_id=?
+                    ORDER BY score
+                    LIMIT ? OFFSET ?
+                ) AS hits
+                JOIN videos v ON v.rowid = hits.rid
+                ORDER BY hits.score
                 """,
-                (q, source_id, limit, offset),
-            ).fetchall()
+                (match, source_id, limit, offset),
+            )
+            rows = _fetch_dicts(cur)
             if rows:
-                return [dict(r) for r in rows]
+                return rows
+            if offset and conn.execute(
+                """
+                SELECT 1 FROM videos_fts JOIN videos v ON v.rowid = videos_fts.rowid
+                WHERE videos_fts MATCH ? AND v.source_id=? LIMIT 1
+                """,
+                (match, source_id),
+            ).fetchone():
+                # Paged past the end of FTS results; don't switch to LIKE mid-listing.
+                return []
         except sqlite3.OperationalError:
-            # If the user types something that isn't valid FTS syntax, fallback.
+            # Sanitized input should always parse; stay defensive anyway.
             pass
 
-    # Fallback LIKE (substring match; slower but user-friendly)
+    # Fallback LIKE (substring/id match; slower but user-friendly). Only reached
+    # without an FTS table or when FTS has no match at all.
     like = f"%{q}%"
-    rows = conn.execute(
+    cur = conn.execute(
         """
         SELECT id, author_unique_id, author_name, substr(caption, 1, 160) AS snippet, bookmarked
         FROM videos
@@ -58,5 +105,5 @@ def search(
         LIMIT ? OFFSET ?
         """,
         (source_id, like, like, like, like, limit, offset),
-    ).fetchall()
-    return [dict(r) for r in rows]
+    )
+    return _fetch_dicts(cur)
@@ -21,6 +21,9 @@ class Settings(BaseSettings):
     # Database
     SX_DB_PATH: Path = Field(default=Path("data/sx_obsidian.db"))
     SX_DB_ENABLE_FTS: bool = Field(default=True)
+    # SQLite connection PRAGMA profile: high_performance (WAL, 64MB cache, 256MB mmap)
+    # or low_resource (WAL, small cache, no mmap).
+    SX_DB_PROFILE: str = Field(default="high_performance")
 
     # API
     SX_API_HOST: str = Field(default="127.0.0.1")
@@ -88,6 +91,8 @@ class Settings(BaseSettings):
 
     # Notes
     SX_ACTIVE_NOTES_DIR: str = Field(default="_db/media_active")
+    # Vault root the scheduler searches for `<video_id>.md` notes.
+    SX_VAULT_PATH: str | None = Field(default=None)
 
     # Cloudflare R2 Settings
     SX_R2_ACCOUNT_ID: str | None = Field(default=None)
@@ -95,6 +100,12 @@ class Settings(BaseSettings):
     SX_R2_SECRET_ACCESS_KEY: str | None = Field(default=None)
     SX_R2_BUCKET_NAME: str | None = Field(default=None)
     SX_R2_PUBLIC_URL_PREFIX: str | None = Field(default=None)
+    # Media upload strategy for scheduling:
+    # - server: the API process uploads media to R2 inline (default)
+    # - presigned: return presigned PUT URLs; the client uploads directly and then
+    #   calls the confirm-upload endpoint so the API records the public URL.
+    SX_R2_UPLOAD_MODE: str = Field(default="server")
+    SX_R2_PRESIGN_EXPIRES_SEC: int = Field(default=3600)
 
 
 def load_settings() -> Settings:
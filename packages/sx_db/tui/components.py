@@ -1,6 +1,7 @@
 """Reusable UI components for the TUI."""
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING
 
 try:
@@ -100,6 +101,33 @@ def render_welcome_banner(console: Console) -> None:
 # HEADER (context bar below banner)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# (monotonic timestamp, db path, item count, source count) of the last header read.
+_HEADER_CACHE: tuple[float, str, int, int] | None = None
+_HEADER_CACHE_TTL_SEC = 5.0
+
+
+def _header_counts(settings: Settings) -> tuple[int, int]:
+    """Return (videos, sources) counts, reused for a few seconds across renders."""
+    global _HEADER_CACHE
+    db_key = str(settings.SX_DB_PATH)
+    cached = _HEADER_CACHE
+    if cached is not None and cached[1] == db_key and time.monotonic() - cached[0] < _HEADER_CACHE_TTL_SEC:
+        return cached[2], cached[3]
+
+    from ..db import connect, init_db
+
+    conn = connect(settings.SX_DB_PATH, profile=settings.SX_DB_PROFILE)
+    try:
+        init_db(conn, enable_fts=settings.SX_DB_ENABLE_FTS)
+        total, sources_count = conn.execute(
+            "SELECT (SELECT COUNT(*) FROM videos), (SELECT COUNT(*) FROM sources)"
+        ).fetchone()
+    finally:
+        conn.close()
+    _HEADER_CACHE = (time.monotonic(), db_key, int(total), int(sources_count))
+    return _HEADER_CACHE[2], _HEADER_CACHE[3]
+
+
 def render_header(console: Console, settings: Settings) -> None:
     """Render app header with database context and stats.
     
@@ -107,15 +135,9 @@ def render_header(console: Console, settings: Settings) -> None:
         console: Rich Console for output
         settings: Application settings
     """
-    from ..db import connect, init_db
-    
     # Try to get DB stats
     try:
-        conn = connect(settings.SX_DB_PATH)
-        init_db(conn, enable_fts=settings.SX_DB_ENABLE_FTS)
-        
-        total = conn.execute("SELECT COUNT(*) FROM videos").fetchone()[0]
-        sources_count = conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0]
+        total, sources_count = _header_counts(settings)
         db_exists = True
     except Exception:
         total, sources_count = 0, 0
@@ -10,6 +10,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from urllib.parse import quote
 
+# Project-root .env used when callers don't pass an explicit path.
+DEFAULT_ENV_PATH = Path(__file__).resolve().parent.parent.parent / ".env"
+
 
 @dataclass
 class DatabaseServer:
@@ -65,7 +68,7 @@ def discover_servers(env_path: str | Path | None = None) -> list[DatabaseServer]
     Returns a list of DatabaseServer objects (typically [local, cloud]).
     """
     if env_path is None:
-        env_path = Path(__file__).resolve().parent.parent.parent / ".env"
+        env_path = DEFAULT_ENV_PATH
 
     env_path = Path(env_path)
     if not env_path.exists():
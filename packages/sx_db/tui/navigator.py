@@ -33,6 +33,8 @@ class Navigator:
     def __init__(self):
         """Initialize with main menu as the starting screen."""
         self.stack: list[str] = ["main_menu"]
+        # Rendered breadcrumb string; reset whenever the stack changes.
+        self._cached_crumbs: str | None = None
     
     def push(self, screen: str) -> None:
         """Navigate to a new screen by pushing onto the stack.
@@ -41,6 +43,7 @@ class Navigator:
             screen: Screen identifier to navigate to
         """
         self.stack.append(screen)
+        self._cached_crumbs = None
     
     def pop(self) -> str | None:
         """Go back to the previous screen.
@@ -49,12 +52,14 @@ class Navigator:
             The screen that was popped, or None if at root
         """
         if len(self.stack) > 1:
+            self._cached_crumbs = None
             return self.stack.pop()
         return None
     
     def home(self) -> None:
         """Reset navigation to the main menu."""
         self.stack = ["main_menu"]
+        self._cached_crumbs = None
     
     def current(self) -> str:
         """Get the current screen identifier.
@@ -70,11 +75,10 @@ class Navigator:
         Returns:
             Breadcrumb path like "Home > Sources > Add Source"
         """
-        labels = [
-            self.SCREEN_LABELS.get(screen, screen)
-            for screen in self.stack
-        ]
-        return " > ".join(labels)
+        if self._cached_crumbs is None:
+            label = self.SCREEN_LABELS.get
+            self._cached_crumbs = " > ".join([label(screen, screen) for screen in self.stack])
+        return self._cached_crumbs
     
     def depth(self) -> int:
         """Get the current navigation depth.
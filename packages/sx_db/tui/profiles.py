@@ -10,6 +10,8 @@ Key distinction:
 """
 from __future__ import annotations
 
+import functools
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -25,6 +27,9 @@ def _safe_is_dir(base: str | Path, *subpaths: str) -> bool:
 if TYPE_CHECKING:
     pass
 
+# Project-root .env used when callers don't pass an explicit path.
+DEFAULT_ENV_PATH = Path(__file__).resolve().parent.parent.parent / ".env"
+
 
 @dataclass
 class SourceProfile:
@@ -75,7 +80,11 @@ class SourceProfile:
 
     def has_csvs(self) -> bool:
         """Check if the xlsx_files dir has any CSVs."""
-        return self.xlsx_dir.exists() and any(self.xlsx_dir.glob("*.csv"))
+        try:
+            with os.scandir(self.xlsx_dir) as it:
+                return any(e.name.endswith(".csv") and e.is_file() for e in it)
+        except OSError:
+            return False
 
 
 @dataclass
@@ -106,7 +115,7 @@ def discover_profiles(env_path: str | Path | None = None) -> list[SourceProfile]
         List of SourceProfile sorted by index.
     """
     if env_path is None:
-        env_path = Path(__file__).resolve().parent.parent.parent / ".env"
+        env_path = DEFAULT_ENV_PATH
 
     env_path = Path(env_path)
     if not env_path.exists():
@@ -172,7 +181,7 @@ def discover_vaults(env_path: str | Path | None = None) -> list[VaultTarget]:
         List of VaultTarget.
     """
     if env_path is None:
-        env_path = Path(__file__).resolve().parent.parent.parent / ".env"
+        env_path = DEFAULT_ENV_PATH
 
     env_path = Path(env_path)
     if not env_path.exists():
@@ -199,6 +208,56 @@ def discover_vaults(env_path: str | Path | None = None) -> list[VaultTarget]:
     return vaults
 
 
+def env_mtime_ns() -> int:
+    """Modification time of the default .env (0 when missing); a discovery cache key."""
+    try:
+        return os.stat(DEFAULT_ENV_PATH).st_mtime_ns
+    except OSError:
+        return 0
+
+
+@functools.lru_cache(maxsize=4)
+def _profiles_for(env_mtime_ns: int) -> tuple[SourceProfile, ...]:
+    return tuple(discover_profiles())
+
+
+@functools.lru_cache(maxsize=4)
+def _vaults_for(env_mtime_ns: int) -> tuple[VaultTarget, ...]:
+    return tuple(discover_vaults())
+
+
+def discover_profiles_cached() -> tuple[SourceProfile, ...]:
+    """Profiles for the default .env, parsed only when the file changed.
+
+    `active` depends on the vault root existing (drives get mounted/unmounted
+    without touching .env), so it is re-checked with one stat per profile and
+    the cache is dropped if any flag flipped.
+    """
+    profiles = _profiles_for(env_mtime_ns())
+    if any(p.active != (bool(p.vault_path) and _safe_is_dir(p.vault_path)) for p in profiles):
+        _profiles_for.cache_clear()
+        profiles = _profiles_for(env_mtime_ns())
+    return profiles
+
+
+def discover_vaults_cached() -> tuple[VaultTarget, ...]:
+    """Vaults for the default .env, parsed only when the file changed.
+
+    `has_obsidian` is re-checked the same way as profile `active` flags.
+    """
+    vaults = _vaults_for(env_mtime_ns())
+    if any(v.has_obsidian != _safe_is_dir(v.path, ".obsidian") for v in vaults):
+        _vaults_for.cache_clear()
+        vaults = _vaults_for(env_mtime_ns())
+    return vaults
+
+
+def clear_discovery_cache() -> None:
+    """Forget cached profile/vault discovery (after .env writes and on explicit refresh)."""
+    _profiles_for.cache_clear()
+    _vaults_for.cache_clear()
+
+
 def _parse_env_file(path: Path) -> dict[str, str]:
     """Simple .env parser — key=value lines, ignores comments and blanks."""
     env: dict[str, str] = {}
@@ -11,6 +11,11 @@ if TYPE_CHECKING:
     from .state import UIState
 
 
+# Rendered labels/aliases that screens may return instead of canonical commands.
+_BACK_ALIASES = frozenset({"back", "← back", "< back", "go back", "previous", "prev", "b"})
+_HOME_ALIASES = frozenset({"home", "main", "main menu", "h"})
+
+
 class Router:
     """Main navigation loop with screen dispatch.
     
@@ -102,9 +107,9 @@ class Router:
         s = str(result).strip().lower()
         if not s:
             return None
-        if s in {"back", "← back", "< back", "go back", "previous", "prev", "b"}:
+        if s in _BACK_ALIASES:
             return "back"
-        if s in {"home", "main", "main menu", "h"}:
+        if s in _HOME_ALIASES:
             return "home"
         return str(result)
 
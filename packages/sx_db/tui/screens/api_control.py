@@ -9,7 +9,6 @@ import sys
 import time
 import json
 from pathlib import Path
-from urllib.request import urlopen
 
 import questionary
 from rich.panel import Panel
@@ -34,6 +33,17 @@ def _build_api_server_cmd(host: str, port: str) -> list[str]:
     return [sys.executable, "-m", "sx_db", "serve", "--host", host, "--port", str(port)]
 
 
+def urlopen(*args, **kwargs):
+    """urllib.request.urlopen, imported on first use.
+
+    urllib.request pulls in http.client/ssl and is only needed once a health
+    check runs, so keep it off the TUI start-up path.
+    """
+    from urllib.request import urlopen as _urlopen
+
+    return _urlopen(*args, **kwargs)
+
+
 def _api_healthy(host: str, port: str, timeout_sec: float = 0.5) -> bool:
     try:
         with urlopen(f"http://{host}:{port}/health", timeout=timeout_sec) as resp:
@@ -58,8 +68,8 @@ def _fetch_health_payload(host: str, port: str, timeout_sec: float = 1.0) -> dic
 
 
 def _wait_for_api_health(host: str, port: str, timeout_sec: float = 5.0) -> bool:
-    deadline = time.time() + timeout_sec
-    while time.time() < deadline:
+    deadline = time.monotonic() + timeout_sec
+    while time.monotonic() < deadline:
         if _api_healthy(host, port):
             return True
         time.sleep(0.2)
@@ -1,18 +1,43 @@
 """Build & Deploy screen — build plugin and install to vaults."""
 from __future__ import annotations
 
+import contextlib
+import functools
+import heapq
 import json
+import os
 import shutil
+import stat
 import subprocess
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
+from typing import Callable
 
 import questionary
 from prompt_toolkit import prompt
 from prompt_toolkit.key_binding import KeyBindings
+from rich.markup import escape
 from rich.panel import Panel
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
+
+try:
+    import fcntl
+    import termios
+    import tty
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore
+    termios = None  # type: ignore
+    tty = None  # type: ignore
+
 from ..components import BRAND_STYLE, nav_choices, render_header
-from ..profiles import discover_profiles, discover_vaults
+from ..profiles import clear_discovery_cache, discover_profiles_cached, discover_vaults_cached
 from ..router import Router, register_screen
 
 # Project root (relative to this file)
@@ -20,14 +45,42 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 PLUGIN_DIR = PROJECT_ROOT / "obsidian-plugin"
 PLUGIN_ID = "sx-obsidian-db"
 KNOWN_VAULTS_PATH = PROJECT_ROOT / "_logs" / "known_vault_paths.json"
+BUILD_LOG_PATH = PROJECT_ROOT / "_logs" / "plugin_build.log"
 
 # Files to copy into the plugin dir inside each vault
 PLUGIN_ARTIFACTS = ["main.js", "manifest.json", "styles.css"]
 
+_ENTRY_NAME = attrgetter("name")
+
+
+# Last parsed memory file, keyed by (path, st_mtime_ns, st_size).
+_MEM_CACHE: tuple[tuple[str, int, int], list[str]] | None = None
+
+# Background plugin build and its buffered status lines. Shared across screen
+# visits so re-entering never starts a second npm run in PLUGIN_DIR.
+_BUILD: tuple[Future, list[str]] | None = None
+
+
+def _dedupe_paths(items) -> list[str]:
+    """Strip, drop empties, and dedupe while keeping first-seen order."""
+    return list(dict.fromkeys(s for p in items if (s := str(p or "").strip())))
+
+
+def _memory_cache_key() -> tuple[str, int, int] | None:
+    try:
+        st = os.stat(KNOWN_VAULTS_PATH)
+    except OSError:
+        return None
+    return str(KNOWN_VAULTS_PATH), st.st_mtime_ns, st.st_size
+
 
 def _load_known_vault_memory() -> list[str]:
-    if not KNOWN_VAULTS_PATH.exists():
+    global _MEM_CACHE
+    key = _memory_cache_key()
+    if key is None:
         return []
+    if _MEM_CACHE is not None and _MEM_CACHE[0] == key:
+        return list(_MEM_CACHE[1])
     try:
         raw = json.loads(KNOWN_VAULTS_PATH.read_text(encoding="utf-8", errors="ignore"))
     except Exception:
@@ -38,47 +91,36 @@ def _load_known_vault_memory() -> list[str]:
     if not isinstance(raw, list):
         return []
 
-    out: list[str] = []
-    seen: set[str] = set()
-    for p in raw:
-        s = str(p or "").strip()
-        if not s or s in seen:
-            continue
-        seen.add(s)
-        out.append(s)
-    return out
+    out = _dedupe_paths(raw)
+    _MEM_CACHE = (key, out)
+    return list(out)
+
+
+def _dump_memory(obj: dict) -> bytes:
+    """Serialize to indented UTF-8 JSON with a trailing newline (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
 
 
 def _save_known_vault_memory(paths: list[str]) -> None:
+    global _MEM_CACHE
     KNOWN_VAULTS_PATH.parent.mkdir(parents=True, exist_ok=True)
-    unique: list[str] = []
-    seen: set[str] = set()
-    for p in paths:
-        s = str(p or "").strip()
-        if not s or s in seen:
-            continue
-        seen.add(s)
-        unique.append(s)
-    KNOWN_VAULTS_PATH.write_text(
-        json.dumps({"paths": unique}, ensure_ascii=False, indent=2) + "\n",
-        encoding="utf-8",
-    )
+    unique = _dedupe_paths(paths)
+    KNOWN_VAULTS_PATH.write_bytes(_dump_memory({"paths": unique}))
+    key = _memory_cache_key()
+    _MEM_CACHE = (key, unique) if key is not None else None
 
 
 def _remember_vault_paths(paths: list[Path]) -> None:
     existing = _load_known_vault_memory()
-    merged = list(existing)
-    seen = set(existing)
-    for p in paths:
-        s = str(p)
-        if s not in seen:
-            merged.append(s)
-            seen.add(s)
-    _save_known_vault_memory(merged)
+    _save_known_vault_memory(existing + [str(p) for p in paths])
 
 
-def _forget_vault_paths(paths: list[str]) -> int:
-    existing = _load_known_vault_memory()
+def _forget_vault_paths(paths: list[str], existing: list[str] | None = None) -> int:
+    """Drop `paths` from memory and save once; `existing` skips re-loading it."""
+    if existing is None:
+        existing = _load_known_vault_memory()
     drop = {str(p).strip() for p in paths if str(p).strip()}
     kept = [p for p in existing if p not in drop]
     if kept == existing:
@@ -167,24 +209,149 @@ def _capture_memory_list_action() -> str:
     return "done"
 
 
-def _render_remembered_vaults_panel(memory_paths: list[str], cursor: int) -> str:
+def _has_obsidian(path_str: str) -> bool:
+    """Return whether `<path>/.obsidian` is a directory (one stat, no Path objects)."""
+    try:
+        return stat.S_ISDIR(os.stat(os.path.join(path_str, ".obsidian")).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
+# Raw key sequences (cbreak mode) → remembered-vault manager actions.
+# Longest first so arrow-key escapes win over their prefixes.
+_RAW_KEY_ACTIONS: tuple[tuple[bytes, str], ...] = (
+    (b"\x1b[3~", "delete"),
+    (b"\x1b[A", "up"),
+    (b"\x1bOA", "up"),
+    (b"\x1b[B", "down"),
+    (b"\x1bOB", "down"),
+    (b"k", "up"),
+    (b"j", "down"),
+    (b"\x7f", "delete"),
+    (b"\x08", "delete"),
+    (b"d", "delete"),
+    (b"\r", "done"),
+    (b"\n", "done"),
+    (b"q", "cancel"),
+)
+
+
+def _next_raw_action(data: bytes) -> tuple[str | None, int]:
+    """Return the first recognised action in `data` and how many bytes it used.
+
+    A read may hold several keys (fast typing) or an unknown escape sequence
+    (e.g. right arrow); a bare Esc counts as cancel only when it ends the read.
+    With no action, every byte is consumed.
+    """
+    i = 0
+    while i < len(data):
+        if data[i:] == b"\x1b":
+            return "cancel", len(data)
+        for seq, action in _RAW_KEY_ACTIONS:
+            if data.startswith(seq, i):
+                return action, i + len(seq)
+        if data[i] == 0x1B:
+            # Skip an unrecognised CSI/SS3 sequence as a whole.
+            j = i + 2
+            while j < len(data) and not (0x40 <= data[j] <= 0x7E):
+                j += 1
+            i = j + 1
+            continue
+        i += 1
+    return None, len(data)
+
+
+def _decode_raw_action(data: bytes) -> str | None:
+    """Return the first recognised action in a raw read, or None."""
+    return _next_raw_action(data)[0]
+
+
+# Bytes read past the last decoded action (keys typed ahead, pastes), per fd.
+_RAW_PENDING: dict[int, bytes] = {}
+
+
+def _read_raw_action(fd: int) -> str:
+    """Read one manager action straight from a tty in cbreak mode.
+
+    Only the terminal mode is toggled per keypress (restored before any
+    other prompt runs); unknown keys are ignored. Keys after the decoded one
+    are kept for the next call instead of being dropped.
+    """
+    buf = _RAW_PENDING.pop(fd, b"")
+    if buf:
+        action, used = _next_raw_action(buf)
+        if action:
+            if used < len(buf):
+                _RAW_PENDING[fd] = buf[used:]
+            return action
+    old = termios.tcgetattr(fd)
+    try:
+        # TCSANOW (not the default TCSAFLUSH) keeps keys typed ahead.
+        tty.setcbreak(fd, termios.TCSANOW)
+        while True:
+            buf = os.read(fd, 32)
+            action, used = _next_raw_action(buf)
+            if action:
+                if used < len(buf):
+                    _RAW_PENDING[fd] = buf[used:]
+                return action
+    except KeyboardInterrupt:
+        return "cancel"
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old)
+
+
+def _raw_action_reader() -> Callable[[], str] | None:
+    """Return a raw-tty action reader, or None when stdin is not a POSIX tty."""
+    if termios is None:
+        return None
+    try:
+        fd = sys.stdin.fileno()
+        if not os.isatty(fd):
+            return None
+    except (AttributeError, OSError, ValueError):
+        return None
+    return functools.partial(_read_raw_action, fd)
+
+
+_MANAGER_FOOTER = (
+    "\n\n"
+    "[dim]Use ↑/↓ to move, Delete (or Backspace/d) to remove selected path.[/]\n"
+    "[dim]Press Enter when finished.[/]"
+)
+
+
+def _vault_row(path_str: str, has_obsidian: bool) -> str:
+    """Marker-less list row: `<path>  [✓ .obsidian]` / `<path>  [no .obsidian]`."""
+    return f"{path_str}  [{'✓ .obsidian' if has_obsidian else 'no .obsidian'}]"
+
+
+def _render_remembered_vaults_panel(
+    memory_paths: list[str],
+    cursor: int,
+    obsidian_status: dict[str, bool] | None = None,
+    row_cache: dict[str, str] | None = None,
+) -> str:
+    """Render the remembered-vault list.
+
+    `obsidian_status` lets the manager loop probe each path once per session
+    instead of once per keypress redraw; `row_cache` keeps the formatted rows
+    across redraws so only the cursor marker is applied per render.
+    """
+    if not memory_paths:
+        return "(empty)" + _MANAGER_FOOTER
+
+    rows = row_cache if row_cache is not None else {}
     lines: list[str] = []
     for idx, p in enumerate(memory_paths):
-        marker = "❯" if idx == cursor else " "
-        has_obs = "✓ .obsidian" if (Path(p) / ".obsidian").is_dir() else "no .obsidian"
-        lines.append(f"{marker} {p}  [{has_obs}]")
-
-    if not lines:
-        lines.append("(empty)")
-
-    lines.extend(
-        [
-            "",
-            "[dim]Use ↑/↓ to move, Delete (or Backspace/d) to remove selected path.[/]",
-            "[dim]Press Enter when finished.[/]",
-        ]
-    )
-    return "\n".join(lines)
+        row = rows.get(p)
+        if row is None:
+            found = obsidian_status.get(p) if obsidian_status is not None else None
+            if found is None:
+                found = _has_obsidian(p)
+            row = rows[p] = _vault_row(p, found)
+        lines.append(("❯ " if idx == cursor else "  ") + row)
+    return "\n".join(lines) + _MANAGER_FOOTER
 
 
 def _default_checked_vault_paths(
@@ -199,80 +366,183 @@ def _default_checked_vault_paths(
       2) all existing profile vault roots discovered from .env
       3) any known vault that already has `.obsidian`
     """
-    checked: set[str] = set()
-
+    # One pass over profiles collects both priority 1 and the priority 2
+    # candidates; the is_dir probes only run when priority 1 came up empty.
     indices = set(active_profile_indices or [])
-    if indices:
-        for p in profiles:
-            root = str(p.vault_root)
-            if p.index in indices and root in all_paths:
-                checked.add(root)
-
-    if not checked:
-        for p in profiles:
-            root = str(p.vault_root)
-            if p.vault_root.is_dir() and root in all_paths:
-                checked.add(root)
-
-    if not checked:
-        for path_str, label in all_paths.items():
-            if "✓ .obsidian" in label:
-                checked.add(path_str)
-
-    return checked
+    selected: set[str] = set()
+    profile_roots: list[str] = []
+    for p in profiles:
+        root = str(p.vault_root)
+        if root not in all_paths:
+            continue
+        profile_roots.append(root)
+        if p.index in indices:
+            selected.add(root)
+    if selected:
+        return selected
+
+    is_dir = os.path.isdir
+    existing = {root for root in profile_roots if is_dir(root)}
+    if existing:
+        return existing
+
+    return {path_str for path_str, label in all_paths.items() if "✓ .obsidian" in label}
+
+
+def _run_npm(args: list[str], timeout: float | None = None) -> int:
+    """Run npm in PLUGIN_DIR, appending its output to BUILD_LOG_PATH (not held in memory)."""
+    with BUILD_LOG_PATH.open("ab") as log:
+        log.write(f"$ npm {' '.join(args)}\n".encode("utf-8"))
+        log.flush()
+        return subprocess.run(
+            ["npm", *args],
+            cwd=str(PLUGIN_DIR),
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            # Never read the tty that the questionary prompts are using.
+            stdin=subprocess.DEVNULL,
+            timeout=timeout,
+            # Python opens fds non-inheritable (PEP 446), so the fork can skip
+            # the close-all-fds pass. The environment is passed through as-is:
+            # npm needs proxy/registry/nvm variables from the user's shell.
+            close_fds=os.name != "posix",
+        ).returncode
+
+
+def _print_build_log_tail(say: Callable[[str], None], lines: int = 15) -> None:
+    try:
+        tail = BUILD_LOG_PATH.read_text(encoding="utf-8", errors="replace").splitlines()[-lines:]
+    except OSError:
+        return
+    for line in tail:
+        say(f"  [dim]{escape(line)}[/]")
+    say(f"  [dim]Full log: {BUILD_LOG_PATH}[/]")
 
 
-def _build_plugin(router: Router) -> bool:
+def _build_plugin(router: Router, emit: Callable[[str], None] | None = None) -> bool:
     """Run npm build in obsidian-plugin/ directory.
 
+    npm output goes to BUILD_LOG_PATH; its tail is shown on failure. With
+    `emit` (background builds), status lines are handed to it and no
+    spinner is drawn.
+
     Returns:
         True on success.
     """
+    say = emit or router.console.print
+
+    def _status(message: str):
+        return router.console.status(message) if emit is None else contextlib.nullcontext()
+
     if not PLUGIN_DIR.exists():
-        router.console.print(
+        say(
             f"[red]✗ Plugin directory not found: {PLUGIN_DIR}[/]"
         )
         return False
 
+    BUILD_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    BUILD_LOG_PATH.write_bytes(b"")
+
     # Check node_modules
     if not (PLUGIN_DIR / "node_modules").exists():
-        with router.console.status("[cyan]Installing plugin dependencies...[/]"):
-            result = subprocess.run(
-                ["npm", "install"],
-                cwd=str(PLUGIN_DIR),
-                capture_output=True,
-                text=True,
-            )
-        if result.returncode != 0:
-            router.console.print("[red]✗ npm install failed[/]")
+        with _status("[cyan]Installing plugin dependencies...[/]"):
+            returncode = _run_npm(["install"])
+        if returncode != 0:
+            say("[red]✗ npm install failed[/]")
+            _print_build_log_tail(say)
             return False
-        router.console.print("[green]✓ Dependencies installed[/]")
+        say("[green]✓ Dependencies installed[/]")
 
-    with router.console.status("[cyan]Building plugin...[/]"):
-        result = subprocess.run(
-            ["npm", "run", "build"],
-            cwd=str(PLUGIN_DIR),
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
+    with _status("[cyan]Building plugin...[/]"):
+        returncode = _run_npm(["run", "build"], timeout=120)
 
-    if result.returncode == 0:
-        router.console.print("[green]✓ Plugin built successfully[/]")
+    if returncode == 0:
+        say("[green]✓ Plugin built successfully[/]")
         return True
     else:
-        router.console.print("[red]✗ Build failed — check obsidian-plugin/ for errors[/]")
+        say("[red]✗ Build failed — check obsidian-plugin/ for errors[/]")
+        _print_build_log_tail(say)
+        return False
+
+
+def _start_build(router: Router) -> tuple[Future, list[str], bool]:
+    """Start a background build, or return the one still in flight.
+
+    Returns (future, status lines, reused).
+    """
+    global _BUILD
+    if _BUILD is not None and not _BUILD[0].done():
+        return (*_BUILD, True)
+    # Status lines are buffered so they never land inside a prompt.
+    lines: list[str] = []
+    pool = ThreadPoolExecutor(max_workers=1)
+    future = pool.submit(_build_plugin, router, lines.append)
+    pool.shutdown(wait=False)
+    _BUILD = (future, lines)
+    return future, lines, False
+
+
+def _load_plugin_artifacts() -> dict[str, tuple[bytes, os.stat_result]]:
+    """Read each built artifact once: name → (bytes, source stat)."""
+    out: dict[str, tuple[bytes, os.stat_result]] = {}
+    for artifact in PLUGIN_ARTIFACTS:
+        src = PLUGIN_DIR / artifact
+        try:
+            out[artifact] = (src.read_bytes(), src.stat())
+        except OSError:
+            continue
+    return out
+
+
+# Linux FICLONE ioctl: copy-on-write clone on btrfs/XFS/overlay-capable filesystems.
+_FICLONE = 0x40049409
+
+
+def _clone_or_copy(src: str, dst: str) -> str:
+    """copytree copy_function: reflink-clone when the filesystem supports it.
+
+    A clone shares data blocks copy-on-write, so creation is O(inodes) but
+    the two vaults stay independent (unlike hardlinks, where Obsidian
+    rewriting a config file in one vault would change the template too).
+    Falls back to shutil.copy2 everywhere else.
+    """
+    if fcntl is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+def _same_content(dst: Path, blob: bytes) -> bool:
+    """True if `dst` already holds exactly `blob` (size check first, then bytes)."""
+    try:
+        if os.stat(dst).st_size != len(blob):
+            return False
+        return dst.read_bytes() == blob
+    except OSError:
         return False
 
 
-def _deploy_to_vault(router: Router, vault_path: Path) -> bool:
+def _deploy_to_vault(
+    router: Router,
+    vault_path: Path,
+    emit: Callable[[str], None] | None = None,
+    artifacts: dict[str, tuple[bytes, os.stat_result]] | None = None,
+) -> bool:
     """Deploy built plugin to a vault.
 
     If .obsidian/ doesn't exist, copies template from active vault.
+    Status lines go to `emit` (default: the router console); `artifacts`
+    are preloaded build outputs from `_load_plugin_artifacts()`.
 
     Returns:
         True on success.
     """
+    say = emit or router.console.print
     obsidian_dir = vault_path / ".obsidian"
 
     # ── Handle missing .obsidian ───────────────────────────────────
@@ -280,31 +550,22 @@ def _deploy_to_vault(router: Router, vault_path: Path) -> bool:
         template_obsidian: Path | None = None
 
         # Prefer profile-defined vaults first, then generic VAULT_* entries.
-        candidate_roots: list[Path] = []
-        seen: set[str] = set()
-        for p in discover_profiles():
-            root = p.vault_root
-            key = str(root)
-            if key not in seen:
-                seen.add(key)
-                candidate_roots.append(root)
-        for v in discover_vaults():
-            root = Path(v.path)
-            key = str(root)
-            if key not in seen:
-                seen.add(key)
-                candidate_roots.append(root)
+        candidate_roots = dict.fromkeys(
+            [str(p.vault_root) for p in discover_profiles_cached()]
+            + [os.path.normpath(v.path) for v in discover_vaults_cached()]
+        )
+        target = str(vault_path)
 
         for root in candidate_roots:
-            if root == vault_path:
+            if root == target:
                 continue
-            cand = root / ".obsidian"
-            if cand.exists():
-                template_obsidian = cand
+            cand = os.path.join(root, ".obsidian")
+            if os.path.exists(cand):
+                template_obsidian = Path(cand)
                 break
 
         if template_obsidian is not None:
-            router.console.print(
+            say(
                 f"  [yellow]⚠ No .obsidian at {vault_path.name}[/]\n"
                 f"  [dim]  Creating from template...[/]"
             )
@@ -313,15 +574,16 @@ def _deploy_to_vault(router: Router, vault_path: Path) -> bool:
                     str(template_obsidian),
                     str(obsidian_dir),
                     dirs_exist_ok=True,
+                    copy_function=_clone_or_copy,
                 )
-                router.console.print(
+                say(
                     f"  [green]✓[/] Template .obsidian created"
                 )
             except Exception:
-                router.console.print(f"  [red]✗ Failed to create .obsidian[/]")
+                say(f"  [red]✗ Failed to create .obsidian[/]")
                 return False
         else:
-            router.console.print(
+            say(
                 f"  [red]✗ No .obsidian at {vault_path} and no template available from configured VAULT_* roots[/]"
             )
             return False
@@ -330,25 +592,87 @@ def _deploy_to_vault(router: Router, vault_path: Path) -> bool:
     plugin_dest = obsidian_dir / "plugins" / PLUGIN_ID
     plugin_dest.mkdir(parents=True, exist_ok=True)
 
+    if artifacts is None:
+        artifacts = _load_plugin_artifacts()
     for artifact in PLUGIN_ARTIFACTS:
-        src = PLUGIN_DIR / artifact
-        if src.exists():
-            shutil.copy2(str(src), str(plugin_dest / artifact))
+        loaded = artifacts.get(artifact)
+        if loaded is not None:
+            blob, st = loaded
+            dst = plugin_dest / artifact
+            if _same_content(dst, blob):
+                continue  # unchanged since the last deploy
+            mode = st.st_mode & 0o777
+            fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            # os.open applies `mode` only on create; match copy2 on overwrite too
+            # (os.chmod rather than fchmod, which Windows lacks before 3.13).
+            os.chmod(dst, mode)
+            os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
         else:
-            router.console.print(
+            say(
                 f"  [yellow]⚠ {artifact} not found in build output[/]"
             )
 
-    router.console.print(
+    say(
         f"  [green]✓[/] Deployed to {vault_path.name}"
     )
     return True
 
 
+def _deploy_to_vaults(router: Router, vault_paths: list[Path]) -> int:
+    """Deploy to several vaults concurrently and return the success count.
+
+    Copies are IO-bound, so vaults are handled in a small thread pool. Each
+    worker buffers its status lines, which are printed per vault in input
+    order so Rich output never interleaves. Artifacts are read once for all
+    vaults.
+    """
+    artifacts = _load_plugin_artifacts()
+    if len(vault_paths) <= 1:
+        return sum(_deploy_to_vault(router, vp, artifacts=artifacts) for vp in vault_paths)
+
+    def _run(vp: Path) -> tuple[bool, list[str]]:
+        lines: list[str] = []
+        return _deploy_to_vault(router, vp, emit=lines.append, artifacts=artifacts), lines
+
+    success = 0
+    with ThreadPoolExecutor(max_workers=min(8, len(vault_paths))) as ex:
+        for ok, lines in ex.map(_run, vault_paths):
+            for line in lines:
+                router.console.print(line)
+            success += int(ok)
+    return success
+
+
 # ══════════════════════════════════════════════════════════════════════
 # Interactive Directory Browser (inspired by DocuMorph CLI)
 # ══════════════════════════════════════════════════════════════════════
 
+def _visible_subdirs(current: Path, limit: int | None = None) -> tuple[list[os.DirEntry], int]:
+    """Return (first `limit` non-hidden subdirectories by name, total count).
+
+    Uses `os.scandir` so the directory type usually comes from the listing
+    itself (d_type) instead of one stat per child. Symlinked directories are
+    still followed, as before. With a `limit`, only the displayed head is
+    ordered (heap selection) rather than sorting the whole directory.
+    Raises OSError if `current` cannot be listed.
+    """
+    with os.scandir(current) as it:
+        entries = [e for e in it if not e.name.startswith(".")]
+    dirs: list[os.DirEntry] = []
+    for e in entries:
+        try:
+            if e.is_dir():
+                dirs.append(e)
+        except OSError:
+            continue
+    if limit is not None and len(dirs) > limit:
+        return heapq.nsmallest(limit, dirs, key=_ENTRY_NAME), len(dirs)
+    dirs.sort(key=_ENTRY_NAME)
+    return dirs, len(dirs)
+
+
 def _browse_directory(start: Path | None = None) -> Path | None:
     """Interactive directory browser — navigate filesystem with arrow keys.
 
@@ -383,32 +707,29 @@ def _browse_directory(start: Path | None = None) -> Path | None:
             ("/mnt/t", "⏩ Jump to /mnt/t"),
         ]
         for path_str, label in shortcuts:
-            if Path(path_str).is_dir() and str(current) != path_str:
+            if os.path.isdir(path_str) and str(current) != path_str:
                 choices.append(questionary.Choice(label, value=path_str))
 
         # Subdirectories
         choices.append(questionary.Separator("── Directories ──"))
 
-        safe_dirs: list[Path] = []
+        safe_dirs: list[os.DirEntry] = []
+        total_dirs = 0
         try:
-            for entry in sorted(current.iterdir()):
-                try:
-                    if entry.is_dir() and not entry.name.startswith("."):
-                        safe_dirs.append(entry)
-                except (PermissionError, OSError):
-                    continue
+            # Cap at 30 to keep menu manageable
+            safe_dirs, total_dirs = _visible_subdirs(current, limit=30)
         except (PermissionError, OSError):
             choices.append(
                 questionary.Choice("[Permission denied]", value="__parent__")
             )
 
-        for d in safe_dirs[:30]:  # Cap at 30 to keep menu manageable
-            choices.append(questionary.Choice(f"  📁 {d.name}/", value=str(d)))
+        for d in safe_dirs:
+            choices.append(questionary.Choice(f"  📁 {d.name}/", value=d.path))
 
-        if len(safe_dirs) > 30:
+        if total_dirs > 30:
             choices.append(
                 questionary.Choice(
-                    f"  ... and {len(safe_dirs) - 30} more",
+                    f"  ... and {total_dirs - 30} more",
                     value="__noop__",
                 )
             )
@@ -532,65 +853,72 @@ def _manage_known_vaults(router: Router, memory_paths: list[str]) -> None:
         router.console.print("[yellow]No remembered vault paths yet.[/]")
         return
 
+    obsidian_status = {p: _has_obsidian(p) for p in memory_paths}
+    row_cache: dict[str, str] = {}
+
     # Primary UX: in-list interactive manager with Delete key handling.
+    read_action = _raw_action_reader() or _capture_memory_list_action
+    working = list(memory_paths)
+    cursor = 0
+    total_removed = 0
     try:
-        working = list(memory_paths)
-        cursor = 0
-        total_removed = 0
-
-        while True:
-            router.console.print(
-                Panel(
-                    _render_remembered_vaults_panel(working, cursor),
-                    title="Remembered vault paths",
-                    border_style="cyan",
+        try:
+            while True:
+                router.console.print(
+                    Panel(
+                        _render_remembered_vaults_panel(working, cursor, obsidian_status, row_cache),
+                        title="Remembered vault paths",
+                        border_style="cyan",
+                    )
                 )
-            )
-
-            if not working:
-                router.console.print("[yellow]All remembered paths removed.[/]")
-                break
 
-            action = _capture_memory_list_action()
-            if action == "up":
-                cursor = (cursor - 1) % len(working)
-                continue
-            if action == "down":
-                cursor = (cursor + 1) % len(working)
-                continue
-            if action == "cancel":
-                break
-            if action == "done":
-                break
+                if not working:
+                    router.console.print("[yellow]All remembered paths removed.[/]")
+                    break
 
-            if action == "delete":
-                target = working[cursor]
-                confirm = questionary.confirm(
-                    f"Forget remembered path?\n{target}",
-                    default=False,
-                    style=BRAND_STYLE,
-                ).ask()
-                if not confirm:
+                action = read_action()
+                if action == "up":
+                    cursor = (cursor - 1) % len(working)
                     continue
-
-                updated, next_cursor, removed_path = _delete_memory_at_cursor(working, cursor)
-                if removed_path:
-                    removed_count = _forget_vault_paths([removed_path])
-                    total_removed += removed_count
-                working = updated
-                cursor = next_cursor
-
+                if action == "down":
+                    cursor = (cursor + 1) % len(working)
+                    continue
+                if action == "cancel":
+                    break
+                if action == "done":
+                    break
+
+                if action == "delete":
+                    target = working[cursor]
+                    confirm = questionary.confirm(
+                        f"Forget remembered path?\n{target}",
+                        default=False,
+                        style=BRAND_STYLE,
+                    ).ask()
+                    if not confirm:
+                        continue
+
+                    updated, next_cursor, removed_path = _delete_memory_at_cursor(working, cursor)
+                    if removed_path:
+                        total_removed += 1
+                        row_cache.pop(removed_path, None)
+                    working = updated
+                    cursor = next_cursor
+        finally:
+            # One write for the whole session instead of load+save per delete;
+            # confirmed deletes are kept even if the manager fails mid-session.
+            if total_removed:
+                _save_known_vault_memory(working)
         if total_removed:
             router.console.print(f"[green]✓ Removed {total_removed} remembered path(s).[/]")
         return
     except Exception:
         # Fallback UX for terminals that cannot provide the keybinding experience.
+        if not working:
+            return
         choices = [
-            questionary.Choice(
-                f"{p}  [{'✓ .obsidian' if (Path(p) / '.obsidian').is_dir() else 'no .obsidian'}]",
-                value=p,
-            )
-            for p in memory_paths
+            questionary.Choice(row_cache.get(p) or _vault_row(p, obsidian_status[p]), value=p)
+            for p in working
         ]
         selected = questionary.checkbox(
             "Select remembered paths to forget (space=toggle, enter=remove):",
@@ -600,7 +928,7 @@ def _manage_known_vaults(router: Router, memory_paths: list[str]) -> None:
 
         if not selected:
             return
-        removed = _forget_vault_paths([str(x) for x in selected])
+        removed = _forget_vault_paths([str(x) for x in selected], working)
         router.console.print(f"[green]✓ Removed {removed} remembered path(s).[/]")
 
 
@@ -614,30 +942,27 @@ def _collect_vault_paths(router: Router) -> list[Path] | str | None:
         - None when selection is cancelled/empty
     """
     while True:
-        known_vaults = discover_vaults()
+        known_vaults = discover_vaults_cached()
         remembered = _load_known_vault_memory()
-        profiles = discover_profiles()
-
-        # Merge known vault paths + vault roots from profiles + remembered memory
+        profiles = discover_profiles_cached()
+
+        # Merge known vault paths + remembered memory + vault roots from profiles
+        # in one pass; the first source to name a path wins, so each unique path
+        # is probed for `.obsidian` at most once.
+        candidates = chain(
+            ((v.path, v.has_obsidian, "", False) for v in known_vaults),
+            ((p, None, " [remembered]", False) for p in remembered),
+            ((str(p.vault_root), None, f" ({p.label})", True) for p in profiles),
+        )
         all_paths: dict[str, str] = {}  # path → label
-
-        for v in known_vaults:
-            status = "✓ .obsidian" if v.has_obsidian else "no .obsidian"
-            all_paths[v.path] = f"{v.path}  [{status}]"
-
-        for p in remembered:
-            if p in all_paths:
+        for path_str, has_obs, suffix, must_exist in candidates:
+            if path_str in all_paths:
                 continue
-            has_obs = (Path(p) / ".obsidian").is_dir()
-            status = "✓ .obsidian" if has_obs else "no .obsidian"
-            all_paths[p] = f"{p}  [{status}] [remembered]"
-
-        for p in profiles:
-            root = str(p.vault_root)
-            if root not in all_paths and p.vault_root.is_dir():
-                has_obs = (p.vault_root / ".obsidian").is_dir()
-                status = "✓ .obsidian" if has_obs else "no .obsidian"
-                all_paths[root] = f"{root}  [{status}] ({p.label})"
+            if must_exist and not os.path.isdir(path_str):
+                continue
+            if has_obs is None:
+                has_obs = _has_obsidian(path_str)
+            all_paths[path_str] = _vault_row(path_str, has_obs) + suffix
 
         # ── First: ask what they want to do ────────────────────────────
         method_choices: list = []
@@ -715,22 +1040,54 @@ def _collect_vault_paths(router: Router) -> list[Path] | str | None:
         return chosen
 
 
+# Static screen header, built once at import.
+_HEADER_PANEL = Panel(
+    "Build the Obsidian plugin from source and\n"
+    "install it to selected vault paths.",
+    title="Build & Deploy",
+    border_style="cyan",
+)
+
+
 @register_screen("build_deploy")
 def show_build_deploy(router: Router) -> str | None:
     """Build the Obsidian plugin and deploy to selected vaults."""
+    clear_discovery_cache()
     render_header(router.console, router.settings)
 
-    router.console.print(
-        Panel(
-            "Build the Obsidian plugin from source and\n"
-            "install it to selected vault paths.",
-            title="Build & Deploy",
-            border_style="cyan",
-        )
-    )
+    router.console.print(_HEADER_PANEL)
+
+    # ── Step 1: Build (in the background while vaults are picked) ──
+    build_future, build_lines, reused = _start_build(router)
+    if reused:
+        router.console.print("[dim]Plugin build from the previous visit is still running...[/]\n")
+    else:
+        router.console.print("[dim]Building plugin in the background...[/]\n")
+
+    # ── Step 2: Select vaults ──────────────────────────────────────
+    vault_paths = _collect_vault_paths(router)
+    if isinstance(vault_paths, str):
+        return vault_paths
 
-    # ── Step 1: Build ──────────────────────────────────────────────
-    if not _build_plugin(router):
+    timed_out: subprocess.TimeoutExpired | None = None
+    try:
+        if not build_future.done():
+            with router.console.status("[cyan]Waiting for plugin build...[/]"):
+                built = build_future.result()
+        else:
+            built = build_future.result()
+    except subprocess.TimeoutExpired as e:
+        built, timed_out = False, e
+    for line in build_lines:
+        router.console.print(line)
+    if timed_out is not None:
+        router.console.print(
+            Panel(
+                f"✗ Plugin build timed out after {timed_out.timeout:.0f}s\n[dim]Full log: {BUILD_LOG_PATH}[/]",
+                border_style="red",
+            )
+        )
+    if not built:
         choice = questionary.select(
             "Actions:",
             choices=nav_choices(),
@@ -738,10 +1095,6 @@ def show_build_deploy(router: Router) -> str | None:
         ).ask()
         return choice
 
-    # ── Step 2: Select vaults ──────────────────────────────────────
-    vault_paths = _collect_vault_paths(router)
-    if isinstance(vault_paths, str):
-        return vault_paths
     if not vault_paths:
         router.console.print("[yellow]No vault selected; plugin was built but not installed.[/]")
         choice = questionary.select(
@@ -757,10 +1110,7 @@ def show_build_deploy(router: Router) -> str | None:
     # ── Step 3: Deploy ─────────────────────────────────────────────
     router.console.print("\n[bold]Deploying plugin...[/]\n")
 
-    success = 0
-    for vp in vault_paths:
-        if _deploy_to_vault(router, vp):
-            success += 1
+    success = _deploy_to_vaults(router, vault_paths)
 
     router.console.print(
         Panel(
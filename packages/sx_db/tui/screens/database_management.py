@@ -1,15 +1,20 @@
 """Database management screen — Prisma local/cloud schema operations."""
 from __future__ import annotations
 
+import fnmatch
+import functools
 import os
 import re
+import select
 import shlex
 import shutil
+import signal
+import socket
 import subprocess
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from urllib.request import urlopen
 
 import questionary
 from rich.panel import Panel
@@ -17,7 +22,7 @@ from rich.table import Table
 
 from ..components import BRAND_STYLE, nav_choices, render_header
 from ..db_targets import DatabaseServer, discover_servers
-from ..profiles import SourceProfile, discover_profiles
+from ..profiles import SourceProfile, clear_discovery_cache, discover_profiles_cached, env_mtime_ns
 from ..router import Router, register_screen
 from .database_management_menu import (
     database_management_advanced_choices,
@@ -32,9 +37,52 @@ PRISMA_SCHEMA_LOCAL = PRISMA_DIR / "schema.local.prisma"
 PRISMA_SCHEMA_CLOUD = PRISMA_DIR / "schema.cloud.prisma"
 LOG_DIR = PROJECT_ROOT / "_logs"
 
+# Prisma targets are a closed set; unknown targets raise KeyError.
+_SCHEMA_PATH: dict[str, Path] = {"local": PRISMA_SCHEMA_LOCAL, "cloud": PRISMA_SCHEMA_CLOUD}
+_TARGET_LABEL: dict[str, str] = {"local": "Local", "cloud": "Cloud"}
+_STUDIO_PORT: dict[str, int] = {"local": 5555, "cloud": 5556}
+
+# Python opens descriptors non-inheritable (PEP 446), so on POSIX the child
+# needn't walk and close every fd after fork; stdout/stderr are still wired.
+_CLOSE_FDS = os.name != "posix"
+
+_SAFE_SCHEMA_RE = re.compile(r"[^a-zA-Z0-9_.-]")
+_SS_PID_RE = re.compile(r"pid=(\d+)")
+
+
+@functools.lru_cache(maxsize=4)
+def _servers_cached(env_mtime_ns: int) -> dict[str, DatabaseServer]:
+    return {s.name: s for s in discover_servers()}
+
+
+@functools.lru_cache(maxsize=1)
+def _npx_path() -> str | None:
+    return shutil.which("npx")
+
+
+def _prisma_cli() -> list[str] | None:
+    """Command prefix for the Prisma CLI.
+
+    Prefers the project-local binary, which starts one node process per step
+    instead of npx plus prisma; falls back to `npx --yes prisma`.
+    """
+    local = PROJECT_ROOT / "node_modules" / ".bin" / "prisma"
+    if local.is_file():
+        return [str(local)]
+    if _npx_path() is None:
+        return None
+    return ["npx", "--yes", "prisma"]
+
+
+def _clear_discovery_cache() -> None:
+    """Forget cached profile/server/npx discovery (called on screen entry)."""
+    clear_discovery_cache()
+    _servers_cached.cache_clear()
+    _npx_path.cache_clear()
+
 
 def _choose_profile(router: Router) -> SourceProfile | str | None:
-    profiles = [p for p in discover_profiles() if p.active]
+    profiles = [p for p in discover_profiles_cached() if p.active]
     if not profiles:
         router.console.print("[yellow]No active profiles found.[/]")
         return None
@@ -67,18 +115,13 @@ def _choose_profile(router: Router) -> SourceProfile | str | None:
     return match
 
 
-def _server_for_name(name: str) -> DatabaseServer | None:
-    for s in discover_servers():
-        if s.name == name:
-            return s
-    return None
-
-
 def _prisma_env_for(profile: SourceProfile) -> dict[str, str]:
-    env = os.environ.copy()
+    """Database URL variables for `profile`, to overlay on os.environ at spawn time."""
+    env: dict[str, str] = {}
 
-    local = _server_for_name("local")
-    cloud = _server_for_name("cloud")
+    servers = _servers_cached(env_mtime_ns())
+    local = servers.get("local")
+    cloud = servers.get("cloud")
 
     if local:
         env["LOCAL_DATABASE_URL"] = local.prisma_dsn(schema=profile.schema_name)
@@ -89,64 +132,119 @@ def _prisma_env_for(profile: SourceProfile) -> dict[str, str]:
 
 
 def _schema_for_target(target: str) -> Path:
-    return PRISMA_SCHEMA_LOCAL if target == "local" else PRISMA_SCHEMA_CLOUD
+    return _SCHEMA_PATH[target]
 
 
 def _target_label(target: str) -> str:
-    return "Local" if target == "local" else "Cloud"
+    return _TARGET_LABEL[target]
 
 
 def _studio_port_for_target(target: str) -> int:
-    return 5555 if target == "local" else 5556
+    return _STUDIO_PORT[target]
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """Create `path` (and parents) the first time it is needed in this process."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _safe_schema(schema_name: str) -> str:
+    """Schema name as used in log file names."""
+    return _SAFE_SCHEMA_RE.sub("_", schema_name)
 
 
 def _log_path(prefix: str, target: str, schema_name: str) -> Path:
-    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(LOG_DIR)
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_schema = re.sub(r"[^a-zA-Z0-9_.-]", "_", schema_name)
-    return LOG_DIR / f"{prefix}_{target}_{safe_schema}_{stamp}.log"
+    return LOG_DIR / f"{prefix}_{target}_{_safe_schema(schema_name)}_{stamp}.log"
 
 
 def _tail_text(path: Path, max_lines: int = 40) -> str:
-    if not path.exists():
-        return ""
+    """Return the last `max_lines` lines of a log, reading backwards in 8 KiB blocks."""
     try:
-        lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-        return "\n".join(lines[-max_lines:])
-    except Exception:
+        with path.open("rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            chunks: list[bytes] = []
+            newlines = 0
+            while pos > 0 and newlines <= max_lines:
+                step = min(8192, pos)
+                pos -= step
+                f.seek(pos)
+                buf = f.read(step)
+                newlines += buf.count(b"\n")
+                chunks.append(buf)
+    except OSError:
         return ""
+    data = b"".join(reversed(chunks))
+    # Cut at the newline that starts the last `max_lines` lines so only the
+    # tail is decoded and split (the blocks may hold many more lines).
+    pos = len(data) - 1 if data.endswith(b"\n") else len(data)
+    for _ in range(max_lines):
+        pos = data.rfind(b"\n", 0, pos)
+        if pos < 0:
+            break
+    lines = data[pos + 1 :].decode("utf-8", errors="ignore").splitlines()
+    return "\n".join(lines[-max_lines:])
+
+
+def _port_busy(port: int) -> bool:
+    """True if something on localhost (IPv4 or IPv6) accepts connections on `port`."""
+    try:
+        with socket.create_connection(("localhost", port), timeout=0.1):
+            return True
+    except OSError:
+        return False
 
 
 def _wait_for_studio(port: int, timeout_sec: float = 8.0) -> bool:
-    deadline = datetime.now().timestamp() + timeout_sec
-    while datetime.now().timestamp() < deadline:
+    """Poll until something accepts TCP connections on 127.0.0.1:`port`."""
+    deadline = time.monotonic() + timeout_sec
+    while time.monotonic() < deadline:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(0.2)
         try:
-            with urlopen(f"http://127.0.0.1:{port}", timeout=0.8) as resp:
-                if int(getattr(resp, "status", 0) or 0) in (200, 301, 302, 307, 308):
-                    return True
-        except Exception:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return True
+        except OSError:
             pass
+        finally:
+            sock.close()
+        time.sleep(0.1)
     return False
 
 
-def _run_prisma(router: Router, target: str, args: list[str], profile: SourceProfile) -> bool:
-    if not PRISMA_DIR.exists():
-        router.console.print(f"[red]Prisma folder not found:[/] {PRISMA_DIR}")
-        return False
+def _preflight(router: Router, target: str) -> tuple[Path, list[str]] | None:
+    """Check the schema file and Prisma CLI for `target`; print why and return None if unusable.
 
+    The schema living under PRISMA_DIR makes the folder check implicit, so the
+    folder is only probed to explain a missing schema.
+    """
     schema_path = _schema_for_target(target)
     if not schema_path.exists():
-        router.console.print(f"[red]Schema file not found:[/] {schema_path}")
-        return False
+        if not PRISMA_DIR.exists():
+            router.console.print(f"[red]Prisma folder not found:[/] {PRISMA_DIR}")
+        else:
+            router.console.print(f"[red]Schema file not found:[/] {schema_path}")
+        return None
 
-    if shutil.which("npx") is None:
+    prisma_cli = _prisma_cli()
+    if prisma_cli is None:
         router.console.print("[red]`npx` not found. Install Node.js/npm first.[/]")
+        return None
+    return schema_path, prisma_cli
+
+
+def _run_prisma(router: Router, target: str, args: list[str], profile: SourceProfile) -> bool:
+    checked = _preflight(router, target)
+    if checked is None:
         return False
+    schema_path, prisma_cli = checked
 
-    if args[:2] == ["db", "pull"] and schema_path.exists():
+    if args[:2] == ["db", "pull"]:
         try:
-            backup_dir = PRISMA_DIR / "backups"
-            backup_dir.mkdir(parents=True, exist_ok=True)
+            backup_dir = _ensure_dir(PRISMA_DIR / "backups")
             stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_name = f"{schema_path.name}.{target}.{profile.schema_name}.{stamp}.bak"
             shutil.copy2(schema_path, backup_dir / backup_name)
@@ -156,45 +254,51 @@ def _run_prisma(router: Router, target: str, args: list[str], profile: SourcePro
         except Exception as e:
             router.console.print(f"[yellow]Warning: could not create schema backup: {e}[/]")
 
-    cmd = ["npx", "--yes", "prisma", *args, "--schema", str(schema_path)]
-    env = _prisma_env_for(profile)
+    cmd = [*prisma_cli, *args, "--schema", str(schema_path)]
+    env_overlay = _prisma_env_for(profile)
 
+    # Output goes straight to a log file; only its tail is read back for display.
+    log_path = _log_path("prisma_cmd", target, profile.schema_name)
     try:
         with router.console.status(
             f"[cyan]Running Prisma ({_target_label(target)} · {profile.schema_name})...[/]"
-        ):
+        ), open(log_path, "ab") as lf:
             result = subprocess.run(
                 cmd,
                 cwd=str(PROJECT_ROOT),
-                env=env,
-                capture_output=True,
-                text=True,
+                env={**os.environ, **env_overlay},
+                stdout=lf,
+                stderr=subprocess.STDOUT,
                 timeout=300,
+                close_fds=_CLOSE_FDS,
             )
     except subprocess.TimeoutExpired:
         router.console.print("[red]Prisma command timed out after 5 minutes.[/]")
+        router.console.print(f"[dim]Log: {log_path}[/]")
         return False
     except Exception as e:
         router.console.print(f"[red]Failed to run Prisma:[/] {e}")
         return False
 
+    output = _tail_text(log_path, max_lines=40).strip()
     if result.returncode == 0:
         router.console.print(
             f"[green]✓ Prisma {_target_label(target)} command succeeded[/] "
             f"([dim]{' '.join(args)}[/])"
         )
-        if result.stdout.strip():
-            router.console.print(Panel(result.stdout.strip()[:2000], title="Prisma Output", border_style="green"))
+        if output:
+            router.console.print(Panel(output[-2000:], title="Prisma Output", border_style="green"))
+        router.console.print(f"[dim]Log: {log_path}[/]")
         return True
 
-    err = (result.stderr or "").strip() or (result.stdout or "").strip() or "Unknown error"
     router.console.print(
         Panel(
-            err[:3000],
+            (output or "Unknown error")[-3000:],
             title=f"Prisma {_target_label(target)} failed",
             border_style="red",
         )
     )
+    router.console.print(f"[dim]Log: {log_path}[/]")
     return False
 
 
@@ -205,29 +309,20 @@ def _launch_prisma_studio(
     log_path: Path | None = None,
     quiet: bool = False,
 ) -> bool:
-    if not PRISMA_DIR.exists():
-        router.console.print(f"[red]Prisma folder not found:[/] {PRISMA_DIR}")
+    checked = _preflight(router, target)
+    if checked is None:
         return False
+    schema_path, prisma_cli = checked
 
-    schema_path = _schema_for_target(target)
-    if not schema_path.exists():
-        router.console.print(f"[red]Schema file not found:[/] {schema_path}")
-        return False
-
-    if shutil.which("npx") is None:
-        router.console.print("[red]`npx` not found. Install Node.js/npm first.[/]")
-        return False
-
-    env = _prisma_env_for(profile)
+    env_overlay = _prisma_env_for(profile)
     port = _studio_port_for_target(target)
 
     # Ensure stale listeners don't block a fresh Studio launch.
-    _stop_prisma_studio(router, target=target, quiet=True)
+    if _port_busy(port):
+        _stop_prisma_studio(router, target=target, quiet=True)
 
     cmd = [
-        "npx",
-        "--yes",
-        "prisma",
+        *prisma_cli,
         "studio",
         "--schema",
         str(schema_path),
@@ -248,10 +343,11 @@ def _launch_prisma_studio(
             proc = subprocess.Popen(
                 cmd,
                 cwd=str(PROJECT_ROOT),
-                env=env,
+                env={**os.environ, **env_overlay},
                 stdout=lf,
                 stderr=lf,
                 start_new_session=True,
+                close_fds=_CLOSE_FDS,
             )
     except Exception as e:
         if not quiet:
@@ -299,7 +395,64 @@ def _launch_prisma_studio(
     return True
 
 
+def _proc_listen_inodes(port: int) -> set[str] | None:
+    """Socket inodes in LISTEN state on `port` per /proc/net/tcp{,6}; None if unreadable."""
+    suffix = f":{port:04X}"
+    inodes: set[str] = set()
+    readable = False
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(table, encoding="ascii", errors="replace") as f:
+                next(f, None)  # header
+                for line in f:
+                    fields = line.split()
+                    # sl local_address rem_address st ... inode
+                    if len(fields) > 9 and fields[3] == "0A" and fields[1].endswith(suffix):
+                        inodes.add(fields[9])
+            readable = True
+        except OSError:
+            continue
+    return inodes if readable else None
+
+
+def _proc_pids_for_inodes(inodes: set[str]) -> set[int]:
+    """PIDs holding any of the given socket inodes (only processes we may inspect)."""
+    targets = {f"socket:[{inode}]" for inode in inodes}
+    pids: set[int] = set()
+    with os.scandir("/proc") as it:
+        for proc in it:
+            if not proc.name.isdigit():
+                continue
+            try:
+                with os.scandir(f"/proc/{proc.name}/fd") as fds:
+                    for fd in fds:
+                        try:
+                            if os.readlink(fd.path) in targets:
+                                pids.add(int(proc.name))
+                                break
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+    return pids
+
+
 def _pids_listening_on_port(port: int) -> set[int]:
+    # On Linux read the kernel socket tables directly instead of forking
+    # lsof/ss. Nothing listening is authoritative; listeners whose owner we
+    # cannot inspect fall through to the tools below.
+    if sys.platform.startswith("linux"):
+        try:
+            inodes = _proc_listen_inodes(port)
+            if inodes is not None:
+                if not inodes:
+                    return set()
+                found = _proc_pids_for_inodes(inodes)
+                if found:
+                    return found
+        except OSError:
+            pass
+
     pids: set[int] = set()
 
     # Try lsof first (cleanest output for PIDs).
@@ -333,7 +486,7 @@ def _pids_listening_on_port(port: int) -> set[int]:
                 for line in result.stdout.splitlines():
                     if f":{port} " not in line and not line.rstrip().endswith(f":{port}"):
                         continue
-                    for m in re.finditer(r"pid=(\d+)", line):
+                    for m in _SS_PID_RE.finditer(line):
                         pids.add(int(m.group(1)))
         except Exception:
             pass
@@ -341,35 +494,84 @@ def _pids_listening_on_port(port: int) -> set[int]:
     return pids
 
 
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def _send_signal(pid: int, sig: int) -> None:
+    try:
+        os.kill(pid, sig)
+    except OSError:
+        pass
+
+
+def _wait_for_exit(pids: list[int], timeout_sec: float) -> list[int]:
+    """Wait up to `timeout_sec` for all `pids` to exit; return those still running.
+
+    Uses pidfds (Linux 5.3+) so the wait ends as soon as the last process
+    exits; elsewhere it sleeps once and probes each PID.
+    """
+    if not pids:
+        return []
+    pidfd_open = getattr(os, "pidfd_open", None)
+    poll = getattr(select, "poll", None)
+    fds: dict[int, int] = {}
+    if pidfd_open is not None and poll is not None:
+        try:
+            for pid in pids:
+                try:
+                    fds[pid] = pidfd_open(pid)
+                except ProcessLookupError:
+                    continue
+        except OSError:
+            for fd in fds.values():
+                os.close(fd)
+            fds = {}
+        else:
+            try:
+                poller = poll()
+                pid_for_fd = {fd: pid for pid, fd in fds.items()}
+                for fd in pid_for_fd:
+                    poller.register(fd, select.POLLIN)
+                pending = set(pid_for_fd)
+                deadline = time.monotonic() + timeout_sec
+                while pending:
+                    remaining_ms = int((deadline - time.monotonic()) * 1000)
+                    if remaining_ms <= 0:
+                        break
+                    for fd, _ in poller.poll(remaining_ms):
+                        pending.discard(fd)
+                        poller.unregister(fd)
+                return sorted(pid_for_fd[fd] for fd in pending)
+            finally:
+                for fd in fds.values():
+                    os.close(fd)
+
+    time.sleep(timeout_sec)
+    return [pid for pid in pids if _pid_alive(pid)]
+
+
 def _stop_prisma_studio(router: Router, target: str | None = None, quiet: bool = False) -> bool:
     targets = [target] if target in ("local", "cloud") else ["local", "cloud"]
     ports = [_studio_port_for_target(t) for t in targets]
 
     killed: dict[int, list[int]] = {}
     for port in ports:
-        pids = _pids_listening_on_port(port)
+        pids = sorted(_pids_listening_on_port(port))
         if not pids:
             continue
         for pid in pids:
-            try:
-                alive = subprocess.run(
-                    ["kill", "-0", str(pid)],
-                    timeout=2,
-                    check=False,
-                    capture_output=True,
-                    text=True,
-                )
-                if alive.returncode == 0:
-                    subprocess.run(
-                        ["kill", "-TERM", str(pid)],
-                        timeout=2,
-                        check=False,
-                        capture_output=True,
-                        text=True,
-                    )
-            except Exception:
-                pass
-        killed[port] = sorted(pids)
+            if _pid_alive(pid):
+                _send_signal(pid, signal.SIGTERM)
+        killed[port] = pids
 
     if not killed:
         if not quiet:
@@ -382,40 +584,16 @@ def _stop_prisma_studio(router: Router, target: str | None = None, quiet: bool =
             )
         return True
 
-    # Best-effort hard kill for any survivors.
+    # Best-effort hard kill for any survivors, after one grace period for all.
+    stubborn = _wait_for_exit(sorted({pid for pids in killed.values() for pid in pids}), 0.2)
+    for pid in stubborn:
+        _send_signal(pid, signal.SIGKILL)
+    remaining = set(_wait_for_exit(stubborn, 0.2))
     survivors: dict[int, list[int]] = {}
     for port, pids in killed.items():
-        remaining = []
-        for pid in pids:
-            try:
-                check = subprocess.run(
-                    ["kill", "-0", str(pid)],
-                    timeout=2,
-                    check=False,
-                    capture_output=True,
-                    text=True,
-                )
-                if check.returncode == 0:
-                    subprocess.run(
-                        ["kill", "-KILL", str(pid)],
-                        timeout=2,
-                        check=False,
-                        capture_output=True,
-                        text=True,
-                    )
-                    check2 = subprocess.run(
-                        ["kill", "-0", str(pid)],
-                        timeout=2,
-                        check=False,
-                        capture_output=True,
-                        text=True,
-                    )
-                    if check2.returncode == 0:
-                        remaining.append(pid)
-            except Exception:
-                continue
-        if remaining:
-            survivors[port] = remaining
+        left = [pid for pid in pids if pid in remaining]
+        if left:
+            survivors[port] = left
 
     lines = ["[bold green]✓ Stop signal sent to Prisma Studio process(es)[/bold green]"]
     for port, pids in killed.items():
@@ -435,40 +613,38 @@ def _start_studio_pipeline_background(router: Router, target: str, profile: Sour
 
     Logs every step to `_logs/prisma_pipeline_*.log` for diagnostics.
     """
-    schema_path = _schema_for_target(target)
-    if not schema_path.exists():
-        router.console.print(f"[red]Schema file not found:[/] {schema_path}")
-        return False
-    if shutil.which("npx") is None:
-        router.console.print("[red]`npx` not found. Install Node.js/npm first.[/]")
+    checked = _preflight(router, target)
+    if checked is None:
         return False
+    schema_path, prisma_cli = checked
 
-    env = _prisma_env_for(profile)
-    _stop_prisma_studio(router, target=target, quiet=True)
+    env_overlay = _prisma_env_for(profile)
+    port = _studio_port_for_target(target)
+    if _port_busy(port):
+        _stop_prisma_studio(router, target=target, quiet=True)
 
     # Keep schema backup parity with interactive db pull.
     try:
-        backup_dir = PRISMA_DIR / "backups"
-        backup_dir.mkdir(parents=True, exist_ok=True)
+        backup_dir = _ensure_dir(PRISMA_DIR / "backups")
         stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_name = f"{schema_path.name}.{target}.{profile.schema_name}.{stamp}.bak"
         shutil.copy2(schema_path, backup_dir / backup_name)
     except Exception:
         pass
 
-    port = _studio_port_for_target(target)
     log_path = _log_path("prisma_pipeline", target, profile.schema_name)
 
     q_schema = shlex.quote(str(schema_path))
+    prisma = shlex.join(prisma_cli)
     script = " ; ".join(
         [
             "set -e",
             f"echo '=== Prisma pipeline start: target={target} schema={profile.schema_name} at $(date -Iseconds) ==='",
-            f"npx --yes prisma validate --schema {q_schema}",
-            f"npx --yes prisma db pull --schema {q_schema}",
-            f"npx --yes prisma generate --schema {q_schema}",
+            f"{prisma} validate --schema {q_schema}",
+            f"{prisma} db pull --schema {q_schema}",
+            f"{prisma} generate --schema {q_schema}",
             f"echo '=== Starting Prisma Studio on {port} ==='",
-            f"exec npx --yes prisma studio --schema {q_schema} --port {port} --browser none",
+            f"exec {prisma} studio --schema {q_schema} --port {port} --browser none",
         ]
     )
 
@@ -477,10 +653,11 @@ def _start_studio_pipeline_background(router: Router, target: str, profile: Sour
             proc = subprocess.Popen(
                 ["/bin/bash", "-lc", script],
                 cwd=str(PROJECT_ROOT),
-                env=env,
+                env={**os.environ, **env_overlay},
                 stdout=lf,
                 stderr=lf,
                 start_new_session=True,
+                close_fds=_CLOSE_FDS,
             )
     except Exception as e:
         router.console.print(f"[red]Failed to start Prisma pipeline:[/] {e}")
@@ -525,9 +702,23 @@ def _start_studio_pipeline_background(router: Router, target: str, profile: Sour
 
 
 def _show_recent_prisma_logs(router: Router, target: str, profile: SourceProfile) -> None:
-    pattern = f"prisma_*_{target}_{re.sub(r'[^a-zA-Z0-9_.-]', '_', profile.schema_name)}_*.log"
-    logs = sorted(LOG_DIR.glob(pattern), key=lambda p: p.stat().st_mtime, reverse=True)
-    if not logs:
+    pattern = f"prisma_*_{target}_{_safe_schema(profile.schema_name)}_*.log"
+    latest: Path | None = None
+    latest_mtime = -1.0
+    try:
+        with os.scandir(LOG_DIR) as it:
+            for entry in it:
+                if not fnmatch.fnmatchcase(entry.name, pattern):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if mtime > latest_mtime:
+                    latest, latest_mtime = Path(entry.path), mtime
+    except OSError:
+        pass
+    if latest is None:
         router.console.print(
             Panel(
                 "No recent Prisma logs found for this target/schema yet.",
@@ -537,7 +728,6 @@ def _show_recent_prisma_logs(router: Router, target: str, profile: SourceProfile
         )
         return
 
-    latest = logs[0]
     tail = _tail_text(latest, max_lines=50)
     router.console.print(
         Panel(
@@ -555,9 +745,9 @@ def _show_recent_prisma_logs(router: Router, target: str, profile: SourceProfile
 
 
 def _render_db_info(router: Router, profile: SourceProfile) -> None:
-    servers = discover_servers()
-    local = next((s for s in servers if s.name == "local"), None)
-    cloud = next((s for s in servers if s.name == "cloud"), None)
+    servers = _servers_cached(env_mtime_ns())
+    local = servers.get("local")
+    cloud = servers.get("cloud")
 
     info = Table.grid(padding=(0, 2))
     info.add_column(style="bold")
@@ -631,6 +821,7 @@ def _run_db_action(router: Router, profile: SourceProfile, action: str) -> str |
 
 @register_screen("database_management")
 def show_database_management(router: Router) -> str | None:
+    _clear_discovery_cache()
     render_header(router.console, router.settings)
 
     profile_choice = _choose_profile(router)
@@ -642,7 +833,7 @@ def show_database_management(router: Router) -> str | None:
 
     _render_db_info(router, profile)
 
-    choices = database_management_choices()
+    choices = list(database_management_choices())
 
     action = questionary.select(
         "Choose a database action:",
@@ -663,6 +854,7 @@ def show_database_management(router: Router) -> str | None:
 
 @register_screen("database_management_advanced")
 def show_database_management_advanced(router: Router) -> str | None:
+    _clear_discovery_cache()
     render_header(router.console, router.settings)
 
     profile_choice = _choose_profile(router)
@@ -674,7 +866,7 @@ def show_database_management_advanced(router: Router) -> str | None:
 
     _render_db_info(router, profile)
 
-    choices = database_management_advanced_choices()
+    choices = list(database_management_advanced_choices())
 
     action = questionary.select(
         "Advanced database action:",
@@ -4,6 +4,8 @@ Keeps the screen/controller file focused on orchestration and rendering.
 """
 from __future__ import annotations
 
+import functools
+
 import questionary
 
 from ..components import nav_choices
@@ -31,9 +33,14 @@ def db_action_handlers() -> dict[str, tuple[str, list[str]]]:
     }
 
 
-def database_management_choices() -> list:
-    """Primary database-management screen choices."""
-    return [
+@functools.lru_cache(maxsize=1)
+def database_management_choices() -> tuple:
+    """Primary database-management screen choices.
+
+    Built once; questionary keeps the shortcut keys it assigns on the Choice
+    objects, so reusing them yields the same menu every time.
+    """
+    return (
         questionary.Separator("── Local DB (schema.local.prisma) ──"),
         questionary.Choice(
             "Run Prisma Studio (Local: validate + pull + generate + studio)",
@@ -54,12 +61,13 @@ def database_management_choices() -> list:
         questionary.Choice("Advanced Prisma actions…", value="database_management_advanced"),
         questionary.Separator(""),
         *nav_choices(include_separator=False),
-    ]
+    )
 
 
-def database_management_advanced_choices() -> list:
-    """Advanced database-management screen choices."""
-    return [
+@functools.lru_cache(maxsize=1)
+def database_management_advanced_choices() -> tuple:
+    """Advanced database-management screen choices (built once, like the primary menu)."""
+    return (
         questionary.Separator("── Local DB (schema.local.prisma) ──"),
         questionary.Choice("Prisma Validate (Local)", value="validate_local"),
         questionary.Choice("Prisma DB Pull / Introspect (Local)", value="pull_local"),
@@ -79,4 +87,4 @@ def database_management_advanced_choices() -> list:
         questionary.Choice("Stop Prisma Studio (All)", value="stop_studio_all"),
         questionary.Separator(""),
         *nav_choices(include_separator=False),
-    ]
+    )
@@ -17,20 +17,7 @@ if TYPE_CHECKING:
     from ..router import Router
 
 
-@register_screen("help")
-def show_help(router: Router) -> str | None:
-    """Help screen with keyboard shortcuts and workflow overview.
-    
-    Args:
-        router: Router instance
-        
-    Returns:
-        Navigation command
-    """
-    router.console.clear()
-    render_breadcrumbs(router)
-    
-    content = """[bold]Navigation[/bold]
+_HELP_CONTENT = """[bold]Navigation[/bold]
   ↑/↓       Navigate menus
   Enter     Select option
   Ctrl+C    Exit gracefully (from anywhere)
@@ -56,8 +43,25 @@ def show_help(router: Router) -> str | None:
 [dim]Install alias: bash scripts/install_alias.sh[/dim]
 [dim]For more info, see: docs/USAGE.md[/dim]
 """
+
+# Static content; the panel is built once at import.
+_HELP_PANEL = Panel.fit(_HELP_CONTENT, title="Help", border_style="cyan") if questionary is not None else None
+
+
+@register_screen("help")
+def show_help(router: Router) -> str | None:
+    """Help screen with keyboard shortcuts and workflow overview.
+    
+    Args:
+        router: Router instance
+        
+    Returns:
+        Navigation command
+    """
+    router.console.clear()
+    render_breadcrumbs(router)
     
-    router.console.print(Panel.fit(content, title="Help", border_style="cyan"))
+    router.console.print(_HELP_PANEL)
     router.console.print()
     
     if questionary is None:  # pragma: no cover
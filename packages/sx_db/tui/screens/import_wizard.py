@@ -2,70 +2,68 @@
 from __future__ import annotations
 
 import os
+import queue
 import subprocess
 import sys
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable
 
 import questionary
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 
 from ..components import BRAND_STYLE, nav_choices, render_header
-from ..db_targets import DatabaseServer, discover_servers, get_active_server, get_server_by_name
+from ..db_targets import DatabaseServer, discover_servers
 from ..profiles import SourceProfile, discover_profiles
 from ..router import Router, register_screen
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 
-def _ensure_schema(router: Router, profile: SourceProfile, server: DatabaseServer) -> bool:
-    """Ensure the PostgreSQL schema exists on the given server.
+
+# Static screen header, built once at import.
+_HEADER_PANEL = Panel(
+    "Import CSV data from SchedulerX assets directories\n"
+    "into PostgreSQL schemas on local or cloud databases.",
+    title="Import Data",
+    border_style="cyan",
+)
+
+
+def _quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _ensure_schemas_for_server(router: Router, profiles: list[SourceProfile], server: DatabaseServer) -> bool:
+    """Ensure every profile's PostgreSQL schema exists on `server`.
+
+    Uses one connection and one lookup for all schemas, then creates only
+    the missing ones.
 
     Returns:
-        True if schema exists or was created, False on error.
+        True if all schemas exist or were created, False on error.
     """
+    names = list(dict.fromkeys(p.schema_name for p in profiles))
     dsn = server.dsn()
     if not dsn:
         router.console.print(
-            f"  [yellow]⚠ No DSN for {server.label}, cannot verify schema {profile.schema_name}[/]"
+            f"  [yellow]⚠ No DSN for {server.label}, cannot verify schema(s) {', '.join(names)}[/]"
         )
         return False
 
     try:
-        conn = None
-        cur = None
-
         # Prefer psycopg (v3), fallback to psycopg2 for environments still on v2.
         try:
             import psycopg  # type: ignore[import-untyped]
 
             conn = psycopg.connect(dsn)
-            conn.autocommit = True
-            cur = conn.cursor()
         except ImportError:
             import psycopg2  # type: ignore[import-untyped]
 
             conn = psycopg2.connect(dsn)
-            conn.autocommit = True
-            cur = conn.cursor()
-
-        cur.execute(
-            "SELECT schema_name FROM information_schema.schemata WHERE schema_name = %s",
-            (profile.schema_name,),
-        )
-        exists = cur.fetchone() is not None
-
-        if not exists:
-            cur.execute(f'CREATE SCHEMA "{profile.schema_name}"')
-            router.console.print(
-                f"  [green]✓[/] Created schema [cyan]{profile.schema_name}[/] on {server.short_label}"
-            )
-        else:
-            router.console.print(
-                f"  [dim]✓ Schema {profile.schema_name} exists on {server.short_label}[/]"
-            )
-
-        cur.close()
-        conn.close()
-        return True
-
     except ImportError:
         router.console.print(
             "  [yellow]⚠ psycopg/psycopg2 not installed — schema check skipped[/]"
@@ -75,13 +73,41 @@ def _ensure_schema(router: Router, profile: SourceProfile, server: DatabaseServe
         router.console.print(f"  [red]✗ Schema error ({server.short_label}): {e}[/]")
         return False
 
+    try:
+        conn.autocommit = True
+        cur = conn.cursor()
+        cur.execute(
+            "SELECT schema_name FROM information_schema.schemata WHERE schema_name = ANY(%s)",
+            (names,),
+        )
+        existing = {row[0] for row in cur.fetchall()}
+        missing = [n for n in names if n not in existing]
+        if missing:
+            cur.execute("; ".join(f"CREATE SCHEMA IF NOT EXISTS {_quote_ident(n)}" for n in missing))
+        cur.close()
+    except Exception as e:
+        router.console.print(f"  [red]✗ Schema error ({server.short_label}): {e}[/]")
+        return False
+    finally:
+        conn.close()
+
+    for name in names:
+        if name in existing:
+            router.console.print(f"  [dim]✓ Schema {name} exists on {server.short_label}[/]")
+        else:
+            router.console.print(
+                f"  [green]✓[/] Created schema [cyan]{name}[/] on {server.short_label}"
+            )
+    return True
+
 
 def _find_csvs(profile: SourceProfile) -> list[str]:
     """Find CSV files in the profile's assets xlsx_files directory."""
-    xlsx_dir = profile.xlsx_dir
-    if not xlsx_dir.exists():
+    try:
+        with os.scandir(profile.xlsx_dir) as it:
+            return [e.name for e in it if e.name.endswith(".csv") and e.is_file()]
+    except OSError:
         return []
-    return [f.name for f in xlsx_dir.glob("*.csv")]
 
 
 def _build_import_cmd(source_id: str) -> list[str]:
@@ -89,12 +115,114 @@ def _build_import_cmd(source_id: str) -> list[str]:
     return [sys.executable, "-m", "sx_db", "import-csv", "--source", source_id]
 
 
-def _best_error_snippet(result: subprocess.CompletedProcess[str], limit: int = 280) -> str:
-    """Return the most useful stderr/stdout snippet for a failed subprocess."""
-    text = (result.stderr or "").strip() or (result.stdout or "").strip()
-    if not text:
-        return "command failed with no error output"
-    return text[:limit]
+def _import_workers(settings, job_count: int) -> int:
+    """How many import jobs to run at once.
+
+    Postgres targets take independent per-schema imports in parallel (capped
+    at 3); the SQLite backend has a single database file, so imports stay serial.
+    """
+    mode = str(getattr(settings, "SX_DB_BACKEND_MODE", "SQLITE") or "SQLITE").strip().upper()
+    if mode != "POSTGRES_PRIMARY":
+        return 1
+    return max(1, min(3, job_count))
+
+
+_ImportJob = tuple[DatabaseServer, SourceProfile]
+
+
+def _stage_import_jobs(
+    jobs: list[_ImportJob],
+) -> tuple[list[_ImportJob], Callable[[DatabaseServer, bool], list[_ImportJob]]]:
+    """Split jobs so each server's first import runs before the rest fan out.
+
+    The first `import-csv` against a server bootstraps its global tables
+    (public.sources, the source registry); concurrent CREATE TABLE IF NOT
+    EXISTS on a fresh PostgreSQL database can fail with a pg_type unique
+    violation. Returns the jobs to start now and a callback that, given a
+    finished job's server and outcome, returns the jobs to start next: the
+    server's remaining jobs after a success, or its next job alone after a
+    failure (the server is still not bootstrapped).
+    """
+    waiting: dict[str, deque[_ImportJob]] = {}
+    initial: list[_ImportJob] = []
+    for job in jobs:
+        key = job[0].name
+        if key in waiting:
+            waiting[key].append(job)
+        else:
+            waiting[key] = deque()
+            initial.append(job)
+
+    def _after(srv: DatabaseServer, ok: bool) -> list[_ImportJob]:
+        rest = waiting.get(srv.name)
+        if not rest:
+            return []
+        if ok:
+            ready = list(rest)
+            rest.clear()
+            return ready
+        return [rest.popleft()]
+
+    return initial, _after
+
+
+def _run_import_job(
+    srv: DatabaseServer,
+    p: SourceProfile,
+    project_root: str,
+    on_line: Callable[[str], None] | None = None,
+    timeout: float = 300,
+    base_env: dict[str, str] | None = None,
+) -> tuple[bool, str]:
+    """Run one profile import against one server; return (ok, failure detail).
+
+    Output is streamed line by line (to `on_line`, for live status) and only
+    the last lines are kept for the error snippet. `base_env` is an environment
+    snapshot shared by all jobs of a run (defaults to os.environ).
+    """
+    env = dict(os.environ if base_env is None else base_env)
+    env["DB_PROFILE"] = env["SX_PIPELINE_DB_PROFILE"] = srv.alias_for(p.index)
+
+    tail: deque[str] = deque(maxlen=20)
+    try:
+        proc = subprocess.Popen(
+            _build_import_cmd(p.profile_id),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            cwd=project_root,
+            env=env,
+        )
+    except Exception as e:
+        return False, f": {e}"
+
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, _kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            line = line.rstrip()
+            if line:
+                tail.append(line)
+                if on_line is not None:
+                    on_line(line)
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+
+    if timed_out.is_set():
+        return False, f": timed out ({timeout / 60:g} min)"
+    if returncode == 0:
+        return True, ""
+    snippet = "\n    ".join(tail)[-280:] or "command failed with no error output"
+    return False, f":\n    {snippet}"
 
 
 @register_screen("import_wizard")
@@ -102,14 +230,7 @@ def show_import_wizard(router: Router) -> str | None:
     """Multi-profile CSV import to PostgreSQL schemas with DB target selection."""
     render_header(router.console, router.settings)
 
-    router.console.print(
-        Panel(
-            "Import CSV data from SchedulerX assets directories\n"
-            "into PostgreSQL schemas on local or cloud databases.",
-            title="Import Data",
-            border_style="cyan",
-        )
-    )
+    router.console.print(_HEADER_PANEL)
 
     # ── Step 1: Discover & select profiles ─────────────────────────
     profiles = discover_profiles()
@@ -154,8 +275,9 @@ def show_import_wizard(router: Router) -> str | None:
     selected = [p for p in active if p.index in selected_indices]
 
     # ── Step 2: Select database target ─────────────────────────────
+    # One .env parse; same fallback as get_active_server().
     servers = discover_servers()
-    active_server = get_active_server()
+    active_server = next((srv for srv in servers if srv.is_active), servers[0] if servers else None)
     active_label = active_server.label if active_server else "Unknown"
 
     db_target = questionary.select(
@@ -223,8 +345,7 @@ def show_import_wizard(router: Router) -> str | None:
     router.console.print("\n[bold]Checking PostgreSQL schemas...[/]\n")
     for srv in target_servers:
         router.console.print(f"  [cyan]{srv.label}:[/]")
-        for p, _ in import_plan:
-            _ensure_schema(router, p, srv)
+        _ensure_schemas_for_server(router, [p for p, _ in import_plan], srv)
 
     # ── Step 5: Confirm & import ───────────────────────────────────
     summary_table = Table(
@@ -250,56 +371,59 @@ def show_import_wizard(router: Router) -> str | None:
     if not proceed:
         return "back"
 
-    # ── Run import for each server ─────────────────────────────────
-    project_root = str(
-        __import__("pathlib").Path(__file__).resolve().parent.parent.parent.parent
-    )
+    # ── Run imports (bounded parallelism) ─────────────────────────
+    project_root = str(PROJECT_ROOT)
+    base_env = os.environ.copy()
 
-    router.console.print()
+    jobs = [(srv, p) for srv in target_servers for p, _ in import_plan]
+    workers = _import_workers(router.settings, len(jobs))
+
+    at_a_time = f" ({workers} at a time)" if workers > 1 else ""
+    router.console.print(f"\n[bold cyan]Importing {len(jobs)} job(s) to {target_names}{at_a_time}...[/]\n")
     success_count = 0
     failure_count = 0
-    for srv in target_servers:
-        router.console.print(f"\n[bold cyan]Importing to {srv.label}...[/]\n")
-
-        for p, csvs in import_plan:
-            with router.console.status(
-                f"[cyan]Importing {p.label} → {p.schema_name} ({srv.short_label})...[/]"
-            ):
+    # Only this thread prints; workers run the subprocesses and queue their
+    # latest output line, which is shown in the spinner.
+    updates: queue.SimpleQueue[str] = queue.SimpleQueue()
+    initial_jobs, next_jobs = _stage_import_jobs(jobs)
+    with router.console.status("[cyan]Importing...[/]") as status, ThreadPoolExecutor(max_workers=workers) as pool:
+        futures: dict = {}
+
+        def _submit(batch: list[_ImportJob]) -> None:
+            for srv, p in batch:
+                fut = pool.submit(
+                    _run_import_job,
+                    srv,
+                    p,
+                    project_root,
+                    lambda line, tag=f"{p.label} → {srv.short_label}": updates.put(f"{tag}: {line}"),
+                    base_env=base_env,
+                )
+                futures[fut] = (srv, p)
+                pending.add(fut)
+
+        pending: set = set()
+        _submit(initial_jobs)
+        while pending:
+            done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+            latest = None
+            while True:
                 try:
-                    env = os.environ.copy()
-                    env["DB_PROFILE"] = srv.alias_for(p.index)
-                    env["SX_PIPELINE_DB_PROFILE"] = srv.alias_for(p.index)
-
-                    cmd = _build_import_cmd(p.profile_id)
-                    result = subprocess.run(
-                        cmd,
-                        capture_output=True,
-                        text=True,
-                        cwd=project_root,
-                        env=env,
-                        timeout=300,
-                    )
-                    if result.returncode == 0:
-                        success_count += 1
-                        router.console.print(
-                            f"  [green]✓[/] {p.label} → {srv.short_label}"
-                        )
-                    else:
-                        failure_count += 1
-                        router.console.print(
-                            f"  [red]✗[/] {p.label} → {srv.short_label}:\n"
-                            f"    {_best_error_snippet(result)}"
-                        )
-                except subprocess.TimeoutExpired:
-                    failure_count += 1
-                    router.console.print(
-                        f"  [red]✗[/] {p.label} → {srv.short_label}: timed out (5 min)"
-                    )
-                except Exception as e:
+                    latest = updates.get_nowait()
+                except queue.Empty:
+                    break
+            if latest is not None:
+                status.update(f"[cyan]Importing...[/] [dim]{escape(latest[:100])}[/]")
+            for fut in done:
+                srv, p = futures[fut]
+                ok, detail = fut.result()
+                _submit(next_jobs(srv, ok))
+                if ok:
+                    success_count += 1
+                    router.console.print(f"  [green]✓[/] {p.label} → {srv.short_label}")
+                else:
                     failure_count += 1
-                    router.console.print(
-                        f"  [red]✗[/] {p.label} → {srv.short_label}: {e}"
-                    )
+                    router.console.print(f"  [red]✗[/] {p.label} → {srv.short_label}{escape(detail)}")
 
     # ── Step 6: Summary ────────────────────────────────────────────
     total_jobs = len(import_plan) * len(target_servers)
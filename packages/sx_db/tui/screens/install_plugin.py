@@ -1,29 +1,46 @@
 """Install Plugin screen — install already-built plugin to vaults."""
 from __future__ import annotations
 
+import functools
+
 import questionary
 from rich.panel import Panel
 
 from ..components import BRAND_STYLE, nav_choices, render_header
+from ..profiles import clear_discovery_cache
 from ..router import Router, register_screen
 
 # Re-use deployment logic from build_deploy
-from .build_deploy import PLUGIN_ARTIFACTS, PLUGIN_DIR, _collect_vault_paths, _deploy_to_vault
+from .build_deploy import (
+    PLUGIN_ARTIFACTS,
+    PLUGIN_DIR,
+    _collect_vault_paths,
+    _deploy_to_vaults,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _next_choices() -> tuple:
+    """Choices for the closing "Next:" prompt, built once."""
+    return tuple(nav_choices())
+
+
+# Static screen header, built once at import.
+_HEADER_PANEL = Panel(
+    "Install the latest built plugin to vault paths\n"
+    "without rebuilding from source.",
+    title="Install Plugin",
+    border_style="cyan",
+)
 
 
 @register_screen("install_plugin")
 def show_install_plugin(router: Router) -> str | None:
     """Install the already-built plugin to selected vaults (no rebuild)."""
+    clear_discovery_cache()
     render_header(router.console, router.settings)
 
-    router.console.print(
-        Panel(
-            "Install the latest built plugin to vault paths\n"
-            "without rebuilding from source.",
-            title="Install Plugin",
-            border_style="cyan",
-        )
-    )
+    router.console.print(_HEADER_PANEL)
 
     # ── Check build artifacts exist ────────────────────────────────
     missing = [a for a in PLUGIN_ARTIFACTS if not (PLUGIN_DIR / a).exists()]
@@ -55,10 +72,7 @@ def show_install_plugin(router: Router) -> str | None:
     # ── Deploy ─────────────────────────────────────────────────────
     router.console.print("\n[bold]Installing plugin...[/]\n")
 
-    success = 0
-    for vp in vault_paths:
-        if _deploy_to_vault(router, vp):
-            success += 1
+    success = _deploy_to_vaults(router, vault_paths)
 
     router.console.print(
         Panel(
@@ -69,7 +83,7 @@ def show_install_plugin(router: Router) -> str | None:
 
     choice = questionary.select(
         "Next:",
-        choices=nav_choices(),
+        choices=list(_next_choices()),
         style=BRAND_STYLE,
     ).ask()
     return choice
@@ -6,7 +6,6 @@ from typing import TYPE_CHECKING
 try:
     import questionary
     from questionary import Choice
-    from rich.prompt import Prompt
     from rich.table import Table
 except ImportError:  # pragma: no cover
     questionary = None  # type: ignore
@@ -37,7 +36,9 @@ def show_search_menu(router: Router) -> str | None:
     
     # Get search query (pre-fill with last search if available)
     default_query = router.state.last_search_query or ""
-    
+
+    from rich.prompt import Prompt
+
     query = Prompt.ask(
         "Search query (leave empty to browse all)",
         default=default_query
@@ -49,7 +50,7 @@ def show_search_menu(router: Router) -> str | None:
     from ...db import connect, get_default_source_id, init_db
     from ...search import search
     
-    conn = connect(router.settings.SX_DB_PATH)
+    conn = connect(router.settings.SX_DB_PATH, profile=router.settings.SX_DB_PROFILE)
     init_db(conn, enable_fts=router.settings.SX_DB_ENABLE_FTS)
     
     source_id = get_default_source_id(
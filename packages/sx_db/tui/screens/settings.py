@@ -1,43 +1,68 @@
 """Settings screen — profile CRUD, config view, user data."""
 from __future__ import annotations
 
+import functools
 import os
+import re
 from pathlib import Path
 
 import questionary
 from rich.panel import Panel
-from rich.prompt import Confirm
 from rich.table import Table
 
 from ..components import BRAND_STYLE, nav_choices, render_header
-from ..profiles import SourceProfile, discover_profiles, discover_vaults
+from ..profiles import (
+    DEFAULT_ENV_PATH,
+    SourceProfile,
+    clear_discovery_cache,
+    discover_profiles_cached,
+    discover_vaults_cached,
+)
 from ..router import Router, register_screen
 
+_ENV_KEY_RE = re.compile(r"^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=")
+# Config keys whose values are never shown; KEY must be a whole word (API_KEY, not MONKEY).
+_SECRET_KEY_RE = re.compile(r"PASSWORD|SECRET|(?<![A-Z])KEY(?![A-Z])")
+
+# Settings listed by "View Config".
+_CONFIG_KEYS = (
+    "SX_DB_BACKEND_MODE",
+    "SX_PIPELINE_DB_MODE",
+    "SX_PIPELINE_DB_PROFILE",
+    "SX_POSTGRES_DSN",
+    "SX_POSTGRES_SCHEMA_PREFIX",
+    "SX_API_HOST",
+    "SX_API_PORT",
+    "SX_DEFAULT_SOURCE_ID",
+)
 
 def _press_enter() -> None:
     """Simple press-enter-to-continue prompt."""
+    from rich.prompt import Confirm
+
     Confirm.ask("[dim]Press Enter to continue[/dim]", default=True, show_default=False)
 
 
 def _upsert_env_vars(env_path: Path, updates: dict[str, str]) -> None:
-    """Upsert key/value pairs into a .env file while preserving unrelated lines."""
+    """Upsert key/value pairs into a .env file while preserving unrelated lines.
 
-    if env_path.exists():
-        lines = env_path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    else:
-        lines = []
+    The file is left untouched (mtime included) when every key already has
+    the requested value.
+    """
+    try:
+        text = env_path.read_text(encoding="utf-8", errors="ignore")
+    except FileNotFoundError:
+        text = ""
 
     remaining = dict(updates)
+    changed = False
     out: list[str] = []
-    for line in lines:
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#") or "=" not in stripped:
-            out.append(line)
-            continue
-        key, _, _val = stripped.partition("=")
-        k = key.strip()
-        if k in remaining:
-            out.append(f"{k}={remaining.pop(k)}")
+    for line in text.splitlines():
+        m = _ENV_KEY_RE.match(line)
+        if m is not None and m.group(1) in remaining:
+            new_line = f"{m.group(1)}={remaining.pop(m.group(1))}"
+            changed = changed or new_line != line
+            out.append(new_line)
         else:
             out.append(line)
 
@@ -45,14 +70,15 @@ def _upsert_env_vars(env_path: Path, updates: dict[str, str]) -> None:
         if out and out[-1].strip():
             out.append("")
         out.append("# Updated by sx_db settings")
-        for k, v in remaining.items():
-            out.append(f"{k}={v}")
+        out.extend(f"{k}={v}" for k, v in remaining.items())
+    elif not changed:
+        return
 
     env_path.write_text("\n".join(out) + "\n", encoding="utf-8")
 
 
 def _choose_profile_for_paths() -> SourceProfile | None:
-    profiles = discover_profiles()
+    profiles = discover_profiles_cached()
     if not profiles:
         return None
 
@@ -85,7 +111,7 @@ def _configure_database_paths(router: Router) -> None:
         _press_enter()
         return
 
-    known_vaults = discover_vaults()
+    known_vaults = discover_vaults_cached()
     vault_choices = [
         questionary.Choice(
             f"{v.path} ({'✓ .obsidian' if v.has_obsidian else 'no .obsidian'})",
@@ -142,7 +168,7 @@ def _configure_database_paths(router: Router) -> None:
     ).ask()
     label = (label or profile.label).strip() or profile.label
 
-    env_path = Path(__file__).resolve().parent.parent.parent.parent / ".env"
+    env_path = DEFAULT_ENV_PATH
 
     router.console.print(
         Panel(
@@ -181,10 +207,26 @@ def _configure_database_paths(router: Router) -> None:
         router.console.print(f"[green]✓ Updated {env_path}[/]")
     except Exception as e:
         router.console.print(f"[red]✗ Failed to update .env: {e}[/]")
+    else:
+        clear_discovery_cache()
 
     _press_enter()
 
 
+@functools.lru_cache(maxsize=1)
+def _settings_choices() -> tuple:
+    """Settings menu choices, built once (questionary keeps assigned shortcuts on each Choice)."""
+    return (
+        questionary.Choice("View Config", value="view_config"),
+        questionary.Choice("Database Paths (Vault/Source)", value="db_paths"),
+        questionary.Choice("Add Profile", value="add_profile"),
+        questionary.Choice("Refresh Profiles", value="refresh_profiles"),
+        questionary.Choice("User Data Export/Import", value="userdata_menu"),
+        questionary.Separator(""),
+        *nav_choices(),
+    )
+
+
 @register_screen("settings")
 def show_settings(router: Router) -> str | None:
     """Settings sub-menu with profile management."""
@@ -192,15 +234,7 @@ def show_settings(router: Router) -> str | None:
 
     choice = questionary.select(
         "Settings:",
-        choices=[
-            questionary.Choice("View Config", value="view_config"),
-            questionary.Choice("Database Paths (Vault/Source)", value="db_paths"),
-            questionary.Choice("Add Profile", value="add_profile"),
-            questionary.Choice("Refresh Profiles", value="refresh_profiles"),
-            questionary.Choice("User Data Export/Import", value="userdata_menu"),
-            questionary.Separator(""),
-            *nav_choices(),
-        ],
+        choices=list(_settings_choices()),
         style=BRAND_STYLE,
     ).ask()
 
@@ -232,47 +266,72 @@ def _show_config(router: Router) -> None:
     table.add_column("Key", style="dim")
     table.add_column("Value")
 
-    # Show key settings
-    important_keys = [
-        "SX_DB_BACKEND_MODE",
-        "SX_PIPELINE_DB_MODE",
-        "SX_PIPELINE_DB_PROFILE",
-        "SX_POSTGRES_DSN",
-        "SX_POSTGRES_SCHEMA_PREFIX",
-        "SX_API_HOST",
-        "SX_API_PORT",
-        "SX_DEFAULT_SOURCE_ID",
-    ]
-
-    for key in important_keys:
-        val = os.getenv(key, "[dim]not set[/]")
+    env = os.environ
+    for key in _CONFIG_KEYS:
         # Mask passwords/secrets
-        if "PASSWORD" in key or "SECRET" in key or "KEY" in key:
-            val = "****"
+        val = "****" if _SECRET_KEY_RE.search(key) else env.get(key, "[dim]not set[/]")
         table.add_row(key, val)
 
     router.console.print(table)
 
     # Show profiles summary
-    profiles = discover_profiles()
-    router.console.print(
-        f"\n[cyan]Profiles discovered: {len(profiles)}[/]"
-    )
+    profiles = discover_profiles_cached()
+    lines = [f"\n[cyan]Profiles discovered: {len(profiles)}[/]"]
     for p in profiles:
         icon = "[green]✓[/]" if p.active else "[red]✗[/]"
-        router.console.print(
+        lines.append(
             f"  {icon} {p.label} → {p.schema_name}\n"
             f"     source: {p.src_path}\n"
             f"     vault:  {p.vault_path}"
         )
+    router.console.print("\n".join(lines))
 
     router.console.print()
     _press_enter()
 
 
+def _local_db_defaults() -> tuple[tuple[str, str], ...]:
+    """DB connection defaults copied into new profiles (from SXO_LOCAL_1_*).
+
+    Read on every call so values reloaded into the environment are picked up.
+    """
+    return tuple(
+        (key, os.getenv(f"SXO_LOCAL_1_DB_{key}", default))
+        for key, default in (
+            ("USER", "jax"),
+            ("PASSWORD", "2112"),
+            ("HOST", "localhost"),
+            ("PORT", "5432"),
+            ("NAME", "sx_obsidian_unified_db"),
+        )
+    )
+
+
+def _profile_env_block(index: int, label: str, src_path: str, profile_id: str, schema_name: str) -> str:
+    """Format the .env block for a new source profile."""
+    local = f"SXO_LOCAL_{index}"
+    lines = [
+        "",
+        "# ══════════════════",
+        f"# Source Profile {index}: {label}",
+        "# ══════════════════",
+        f"SRC_PATH_{index}={src_path}",
+        f"SRC_PATH_{index}_LABEL={label}",
+        f"SRC_PROFILE_{index}_ID={profile_id}",
+        f"SRC_PATH_{index}_DB_LOCAL={local}",
+        f"DATABASE_PROFILE_{index}_LOCAL={local}",
+        f"DATABASE_PROFILE_{index}={profile_id}",
+        "",
+        f"# {local} ({label})",
+    ]
+    lines.extend(f"{local}_DB_{key}={value}" for key, value in _local_db_defaults())
+    lines.append(f"{local}_DB_SCHEMA={schema_name}")
+    return "\n".join(lines) + "\n"
+
+
 def _add_profile(router: Router) -> None:
     """Wizard to add a new source profile to .env."""
-    profiles = discover_profiles()
+    profiles = discover_profiles_cached()
     next_index = max((p.index for p in profiles), default=0) + 1
 
     router.console.print(
@@ -321,49 +380,26 @@ def _add_profile(router: Router) -> None:
     if not proceed:
         return
 
-    # Append to .env
-    env_path = Path(__file__).resolve().parent.parent.parent.parent / ".env"
-    db_name = os.getenv("SXO_LOCAL_1_DB_NAME", "sx_obsidian_unified_db")
-    db_user = os.getenv("SXO_LOCAL_1_DB_USER", "jax")
-    db_pass = os.getenv("SXO_LOCAL_1_DB_PASSWORD", "2112")
-    db_host = os.getenv("SXO_LOCAL_1_DB_HOST", "localhost")
-    db_port = os.getenv("SXO_LOCAL_1_DB_PORT", "5432")
-
-    block = f"""
-# ══════════════════
-# Source Profile {next_index}: {label}
-# ══════════════════
-SRC_PATH_{next_index}={src_path}
-SRC_PATH_{next_index}_LABEL={label}
-SRC_PROFILE_{next_index}_ID={profile_id}
-SRC_PATH_{next_index}_DB_LOCAL=SXO_LOCAL_{next_index}
-DATABASE_PROFILE_{next_index}_LOCAL=SXO_LOCAL_{next_index}
-DATABASE_PROFILE_{next_index}={profile_id}
-
-# SXO_LOCAL_{next_index} ({label})
-SXO_LOCAL_{next_index}_DB_USER={db_user}
-SXO_LOCAL_{next_index}_DB_PASSWORD={db_pass}
-SXO_LOCAL_{next_index}_DB_HOST={db_host}
-SXO_LOCAL_{next_index}_DB_PORT={db_port}
-SXO_LOCAL_{next_index}_DB_NAME={db_name}
-SXO_LOCAL_{next_index}_DB_SCHEMA={schema_name}
-"""
+    block = _profile_env_block(next_index, label, src_path, profile_id, schema_name)
 
     try:
-        with open(env_path, "a") as f:
+        with open(DEFAULT_ENV_PATH, "a") as f:
             f.write(block)
         router.console.print(
             f"\n[green]✓ Profile {next_index} added to .env[/]"
         )
     except Exception as e:
         router.console.print(f"\n[red]✗ Failed to write .env: {e}[/]")
+    else:
+        clear_discovery_cache()
 
     _press_enter()
 
 
 def _refresh_profiles(router: Router) -> None:
     """Re-scan .env and show current profile status."""
-    profiles = discover_profiles()
+    clear_discovery_cache()
+    profiles = discover_profiles_cached()
 
     router.console.print(
         Panel(
@@ -373,13 +409,16 @@ def _refresh_profiles(router: Router) -> None:
         )
     )
 
-    for p in profiles:
-        icon = "[green]✓[/]" if p.active else "[red]✗[/]"
+    if profiles:
+        # One print for all profiles rather than a render pass per profile.
         router.console.print(
-            f"  {icon} Profile {p.index}: {p.label}\n"
-            f"     Source: {p.src_path}\n"
-            f"     Vault: {p.vault_path}\n"
-            f"     Schema: {p.schema_name}\n"
+            "\n".join(
+                f"  {'[green]✓[/]' if p.active else '[red]✗[/]'} Profile {p.index}: {p.label}\n"
+                f"     Source: {p.src_path}\n"
+                f"     Vault: {p.vault_path}\n"
+                f"     Schema: {p.schema_name}\n"
+                for p in profiles
+            )
         )
 
     _press_enter()
@@ -5,30 +5,24 @@ import questionary
 from rich.table import Table
 
 from ..components import BRAND_STYLE, nav_choices, render_header
-from ..profiles import discover_profiles
+from ..profiles import SourceProfile, discover_profiles_cached
 from ..router import Router, register_screen
 
 
-@register_screen("sources_menu")
-def show_sources_menu(router: Router) -> str | None:
-    """Show all source profiles from .env with active status."""
-    render_header(router.console, router.settings)
+# Last built table + checkbox choices, keyed by the identity of the cached profiles tuple.
+_VIEW_CACHE: tuple[tuple[SourceProfile, ...], Table, tuple] | None = None
 
-    profiles = discover_profiles()
 
-    if not profiles:
-        router.console.print(
-            "[yellow]No source profiles found in .env[/]\n"
-            "Add profiles via Settings > Add Profile."
-        )
-        choice = questionary.select(
-            "Actions:",
-            choices=nav_choices(),
-            style=BRAND_STYLE,
-        ).ask()
-        return choice
+def _profile_view(profiles: tuple[SourceProfile, ...]) -> tuple[Table, tuple]:
+    """Build the Source Profiles table and active-profile choices, reused while profiles are unchanged.
+
+    questionary's checkbox keeps its selection state on the prompt, not on the
+    Choice objects, so the same choices can back every visit.
+    """
+    global _VIEW_CACHE
+    if _VIEW_CACHE is not None and _VIEW_CACHE[0] is profiles:
+        return _VIEW_CACHE[1], _VIEW_CACHE[2]
 
-    # ── Profile table ──────────────────────────────────────────────
     table = Table(
         title="Source Profiles",
         show_header=True,
@@ -53,22 +47,49 @@ def show_sources_menu(router: Router) -> str | None:
             p.src_path,
         )
 
+    choices = tuple(
+        questionary.Choice(
+            f"{p.label} ({p.profile_id})",
+            value=p.index,
+            checked=True,
+        )
+        for p in profiles
+        if p.active
+    )
+
+    _VIEW_CACHE = (profiles, table, choices)
+    return table, choices
+
+
+@register_screen("sources_menu")
+def show_sources_menu(router: Router) -> str | None:
+    """Show all source profiles from .env with active status."""
+    render_header(router.console, router.settings)
+
+    profiles = discover_profiles_cached()
+
+    if not profiles:
+        router.console.print(
+            "[yellow]No source profiles found in .env[/]\n"
+            "Add profiles via Settings > Add Profile."
+        )
+        choice = questionary.select(
+            "Actions:",
+            choices=nav_choices(),
+            style=BRAND_STYLE,
+        ).ask()
+        return choice
+
+    # ── Profile table ──────────────────────────────────────────────
+    table, active_choices = _profile_view(profiles)
     router.console.print(table)
     router.console.print()
 
     # ── Multi-select active profiles ───────────────────────────────
-    active_profiles = [p for p in profiles if p.active]
-    if active_profiles:
+    if active_choices:
         selected = questionary.checkbox(
             "Select active source profiles for import:",
-            choices=[
-                questionary.Choice(
-                    f"{p.label} ({p.profile_id})",
-                    value=p.index,
-                    checked=True,
-                )
-                for p in active_profiles
-            ],
+            choices=list(active_choices),
             style=BRAND_STYLE,
         ).ask()
 
@@ -62,7 +62,8 @@ def show_userdata_menu(router: Router) -> str | None:
         out_path = Prompt.ask("Output path", default="exports/sx_userdata.jsonl.gz").strip()
         
         try:
-            export_userdata(out=out_path, include_meta=True, include_notes=True)
+            with router.console.status("[cyan]Exporting user data...[/]"):
+                export_userdata(out=out_path, include_meta=True, include_notes=True, source=None)
         except Exception as e:
             router.console.print(f"\n[red]Error:[/red] {e}\n")
         
@@ -79,7 +80,8 @@ def show_userdata_menu(router: Router) -> str | None:
         overwrite = Confirm.ask("Overwrite existing rows?", default=True)
         
         try:
-            import_userdata(input_path=in_path, overwrite=overwrite, strict=False, max_rows=0)
+            with router.console.status("[cyan]Importing user data...[/]"):
+                import_userdata(input_path=in_path, overwrite=overwrite, strict=False, max_rows=0, source=None)
         except Exception as e:
             router.console.print(f"\n[red]Error:[/red] {e}\n")
         
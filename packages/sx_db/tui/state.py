@@ -1,10 +1,14 @@
 """Session state for remembering user choices across screens."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass, field, fields
 
+# Screen visits kept in session_history; older entries are dropped.
+HISTORY_MAXLEN = 256
 
-@dataclass
+
+@dataclass(slots=True)
 class UIState:
     """UI session state - remembers user preferences and last choices.
     
@@ -18,8 +22,8 @@ class UIState:
     last_import_csv: str | None = None
     last_import_source: str | None = None
     
-    # Session history for analytics/debugging
-    session_history: list[str] = field(default_factory=list)
+    # Session history for analytics/debugging (bounded, most recent last)
+    session_history: deque[str] = field(default_factory=lambda: deque(maxlen=HISTORY_MAXLEN))
     
     # Import wizard state (multi-step)
     import_wizard_step: int = 0
@@ -41,11 +45,13 @@ class UIState:
             state.remember(last_source="default", last_search_query="travel")
         """
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in _FIELDS:
                 setattr(self, key, value)
     
     def add_to_history(self, screen: str) -> None:
         """Record screen visit in session history.
+
+        Only the last `HISTORY_MAXLEN` visits are kept.
         
         Args:
             screen: Screen identifier that was visited
@@ -56,3 +62,7 @@ class UIState:
         """Reset wizard state (called when wizard completes or is cancelled)."""
         self.import_wizard_step = 0
         self.import_wizard_data = {}
+
+
+# Attribute names accepted by UIState.remember(); unknown keys are ignored.
+_FIELDS = frozenset(f.name for f in fields(UIState))
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+from .db import connect
+
+logger = logging.getLogger(__name__)
+
+# One write "unit" is a list of (sql, rows) statements applied atomically.
+_Unit = list[tuple[str, list[Sequence[Any]]]]
+
+
+class WriterQueue:
+    """Single-writer queue for SQLite writes.
+
+    Callers submit statements from any thread; one background thread owns the
+    only read-write connection and applies queued units in batches (up to
+    `batch_size` units or `flush_interval` seconds) inside a single
+    `BEGIN IMMEDIATE ... COMMIT`. Each submit returns a Future that resolves
+    once its unit is committed.
+
+    If a batch fails, it is rolled back and its units are retried one by one so
+    a single bad statement does not fail unrelated writers. If the writer thread
+    itself dies (e.g. the database cannot be opened), every queued Future gets
+    the error and later submits raise instead of blocking forever.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        profile: str | None = None,
+        batch_size: int = 500,
+        flush_interval: float = 0.01,
+    ):
+        self.db_path = db_path
+        self.profile = profile
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = float(flush_interval)
+        self._queue: queue.Queue[tuple[_Unit, Future] | None] = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        # Set (under _lock) when the writer thread stops on an error.
+        self._error: BaseException | None = None
+
+    def submit(self, sql: str, params: Sequence[Any] = ()) -> Future:
+        return self.submit_unit([(sql, [params])])
+
+    def submit_many(self, sql: str, rows: Iterable[Sequence[Any]]) -> Future:
+        return self.submit_unit([(sql, list(rows))])
+
+    def submit_unit(self, unit: _Unit) -> Future:
+        """Queue several statements that must commit (or fail) together."""
+        fut: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("WriterQueue is closed")
+            if self._error is not None:
+                raise RuntimeError("WriterQueue writer thread failed") from self._error
+            self._ensure_started()
+            self._queue.put((unit, fut))
+        return fut
+
+    def close(self) -> None:
+        """Flush pending writes and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            if thread is None:
+                return
+            self._queue.put(None)
+        thread.join()
+        atexit.unregister(self.close)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="sx-db-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        try:
+            conn = connect(self.db_path, profile=self.profile)
+        except BaseException as e:
+            logger.error("WriterQueue could not open %s: %s", self.db_path, e)
+            self._fail_pending(e)
+            return
+        # Explicit BEGIN/COMMIT below; disable sqlite3's implicit transactions.
+        conn.isolation_level = None
+        batch: list[tuple[_Unit, Future]] = []
+        try:
+            stop = False
+            while not stop:
+                item = self._queue.get()
+                if item is None:
+                    break
+                batch = [item]
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        nxt = self._queue.get(timeout=timeout)
+                    except queue.Empty:
+                        break
+                    if nxt is None:
+                        stop = True
+                        break
+                    batch.append(nxt)
+                self._apply(conn, batch)
+        except BaseException as e:
+            logger.exception("WriterQueue writer thread failed")
+            self._fail_pending(e, batch)
+        finally:
+            conn.close()
+
+    def _fail_pending(self, error: BaseException, batch: Iterable[tuple[_Unit, Future]] = ()) -> None:
+        """Stop accepting work and fail every Future still waiting on this thread."""
+        with self._lock:
+            self._error = error
+        pending = list(batch)
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                pending.append(item)
+        for _, fut in pending:
+            if not fut.done():
+                fut.set_exception(error)
+
+    def _apply(self, conn: sqlite3.Connection, batch: list[tuple[_Unit, Future]]) -> None:
+        try:
+            self._commit(conn, [unit for unit, _ in batch])
+        except Exception:
+            if len(batch) == 1:
+                unit, fut = batch[0]
+                self._apply_one(conn, unit, fut)
+                return
+            logger.warning("Batched write failed; retrying %d units individually", len(batch))
+            for unit, fut in batch:
+                self._apply_one(conn, unit, fut)
+            return
+        for _, fut in batch:
+            fut.set_result(None)
+
+    def _apply_one(self, conn: sqlite3.Connection, unit: _Unit, fut: Future) -> None:
+        try:
+            self._commit(conn, [unit])
+        except Exception as e:
+            fut.set_exception(e)
+        else:
+            fut.set_result(None)
+
+    def _commit(self, conn: sqlite3.Connection, units: list[_Unit]) -> None:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for unit in units:
+                for sql, rows in unit:
+                    conn.executemany(sql, rows)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
@@ -5,8 +5,10 @@ Canonical package location: `packages/sx_scheduler`.
 
 from pathlib import Path
 
-_pkg_dir = Path(__file__).resolve().parent
-_canonical = _pkg_dir.parent / "packages" / "sx_scheduler"
+# `__file__` is already absolute, so the path is built lexically (no resolve()).
+_canonical = str(Path(__file__).parent.parent / "packages" / "sx_scheduler")
 
-if _canonical.is_dir():
-    __path__.append(str(_canonical))
+# Re-executing this module (importlib.reload) finds the path already present
+# and skips the directory check.
+if _canonical not in __path__ and Path(_canonical).is_dir():
+    __path__.append(_canonical)
@@ -1,15 +1,39 @@
 from __future__ import annotations
 
-import os
+import shutil
 import sys
+from pathlib import Path
+
+import pytest
 
 
 def _ensure_project_root_on_path() -> None:
     # When running via the venv's pytest entrypoint, the CWD is not guaranteed to
     # be on sys.path. Ensure the repository root (containing `sx/`) is importable.
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    # pytest imports conftest by absolute path, so the parent is computed lexically.
+    project_root = str(Path(__file__).parent.parent)
     if project_root not in sys.path:
         sys.path.insert(0, project_root)
 
 
 _ensure_project_root_on_path()
+
+
+@pytest.fixture(scope="session")
+def db_template(tmp_path_factory) -> Path:
+    """A SQLite file with the sx_db schema applied, built once per session."""
+    from sx_db.db import connect, init_db
+
+    path = tmp_path_factory.mktemp("db_template") / "template.db"
+    conn = connect(path)
+    init_db(conn, enable_fts=False)
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def fresh_db(tmp_path: Path, db_template: Path) -> Path:
+    """Per-test copy of `db_template` (schema only, no rows)."""
+    dst = tmp_path / "sx_obsidian.db"
+    shutil.copyfile(db_template, dst)
+    return dst
@@ -5,7 +5,7 @@ from pathlib import Path
 from fastapi.testclient import TestClient
 
 from sx_db.api import create_app
-from sx_db.db import connect, ensure_source, init_db
+from sx_db.db import connect, ensure_source
 from sx_db.settings import Settings
 
 
@@ -26,10 +26,9 @@ def _mk_client(db_path: Path) -> TestClient:
     return TestClient(create_app(settings))
 
 
-def test_authors_total_and_counts(tmp_path: Path) -> None:
-    db_path = tmp_path / "sx_obsidian.db"
+def test_authors_total_and_counts(fresh_db: Path) -> None:
+    db_path = fresh_db
     conn = connect(db_path)
-    init_db(conn, enable_fts=False)
     ensure_source(conn, "default", label="default")
     conn.execute(
         """
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
+from types import SimpleNamespace
 
 from fastapi.testclient import TestClient
 import pytest
 
 from sx_db.api import create_app
-from sx_db.db import connect, ensure_source, init_db
+from sx_db.db import connect, ensure_source
 from sx_db.settings import Settings
 
 
@@ -25,36 +27,19 @@ def _mk_client(db_path: Path, scheduler_env: Path) -> TestClient:
     return TestClient(create_app(settings))
 
 
-def _seed_video(
-    db_path: Path,
-    source_id: str,
-    item_id: str,
-    *,
-    video_path: str = "Favorites/videos/vid-1.mp4",
-    cover_path: str = "Favorites/covers/vid-1.jpg",
-) -> None:
-    conn = connect(db_path)
-    init_db(conn, enable_fts=False)
-    ensure_source(conn, source_id, label=source_id)
-    conn.execute(
-        """
-        INSERT INTO videos(source_id, id, platform, caption, bookmarked, video_path, cover_path, updated_at)
-        VALUES(?, ?, 'tiktok', 'hello', 1, ?, ?, '2026-01-01T00:00:00Z')
-        """,
-        (source_id, item_id, video_path, cover_path),
-    )
-    conn.commit()
-
+@pytest.fixture(scope="module")
+def split_layout(tmp_path_factory, db_template: Path) -> SimpleNamespace:
+    """One DB + SchedulerX env with SRC_PATH_1 and VAULT_1 on different roots.
 
-def test_item_links_use_src_path_root_when_vault_differs(tmp_path: Path) -> None:
-    db_path = tmp_path / "sx_obsidian.db"
-    env_path = tmp_path / "pipeline.env"
-
-    src_root = tmp_path / "source_root"
-    vault_root = tmp_path / "vault_root"
+    The API client is built once for the module; create_app() dominates the
+    per-test cost and these tests only differ in the rows they seed.
+    """
+    base = tmp_path_factory.mktemp("split_layout")
+    src_root = base / "source_root"
+    vault_root = base / "vault_root"
     src_root.mkdir(parents=True)
     vault_root.mkdir(parents=True)
-
+    env_path = base / "pipeline.env"
     env_path.write_text(
         "\n".join(
             [
@@ -65,39 +50,81 @@ def test_item_links_use_src_path_root_when_vault_differs(tmp_path: Path) -> None
         ),
         encoding="utf-8",
     )
+    db_path = base / "sx_obsidian.db"
+    shutil.copyfile(db_template, db_path)
+    return SimpleNamespace(
+        db_path=db_path,
+        client=_mk_client(db_path, env_path),
+        src_root=src_root,
+        vault_root=vault_root,
+    )
+
+
+@pytest.fixture
+def split_db(split_layout: SimpleNamespace) -> SimpleNamespace:
+    """`split_layout` with its DB emptied, so each test seeds its own rows."""
+    conn = connect(split_layout.db_path)
+    conn.execute("DELETE FROM video_notes")
+    conn.execute("DELETE FROM user_meta")
+    conn.execute("DELETE FROM videos")
+    conn.commit()
+    conn.close()
+    return split_layout
+
+
+def _seed_videos(db_path: Path, rows: list[tuple[str, str, str, str]]) -> None:
+    """Insert `(source_id, item_id, video_path, cover_path)` rows in one transaction.
+
+    The DB must already be initialized (see `fresh_db`). Durability is irrelevant
+    for tmp test databases, so the connection runs with `synchronous=OFF`.
+    """
+    conn = connect(db_path)
+    try:
+        conn.execute("PRAGMA synchronous=OFF")
+        with conn:
+            for source_id in dict.fromkeys(r[0] for r in rows):
+                ensure_source(conn, source_id, label=source_id)
+            conn.executemany(
+                """
+                INSERT INTO videos(source_id, id, platform, caption, bookmarked, video_path, cover_path, updated_at)
+                VALUES(?, ?, 'tiktok', 'hello', 1, ?, ?, '2026-01-01T00:00:00Z')
+                """,
+                rows,
+            )
+    finally:
+        conn.close()
+
+
+def _seed_video(
+    db_path: Path,
+    source_id: str,
+    item_id: str,
+    *,
+    video_path: str = "Favorites/videos/vid-1.mp4",
+    cover_path: str = "Favorites/covers/vid-1.jpg",
+) -> None:
+    """Insert one video into an already-initialized DB (see `fresh_db`)."""
+    _seed_videos(db_path, [(source_id, item_id, video_path, cover_path)])
+
+
+def test_item_links_use_src_path_root_when_vault_differs(split_db: SimpleNamespace) -> None:
+    db_path = split_db.db_path
 
     _seed_video(db_path, "assets_1", "vid-1")
-    client = _mk_client(db_path, env_path)
+    client = split_db.client
 
     r = client.get("/items/vid-1/links", params={"source_id": "assets_1"})
     assert r.status_code == 200
     links = r.json()
-    assert links["video_abs"].startswith(str(src_root / "data"))
-    assert links["sxopen_video"].startswith(f"sxopen:{src_root}/data/")
+    assert links["video_abs"].startswith(str(split_db.src_root / "data"))
+    assert links["sxopen_video"].startswith(f"sxopen:{split_db.src_root}/data/")
 
 
-def test_note_uses_group_embed_when_src_and_vault_split(tmp_path: Path) -> None:
-    db_path = tmp_path / "sx_obsidian.db"
-    env_path = tmp_path / "pipeline.env"
-
-    src_root = tmp_path / "source_root"
-    vault_root = tmp_path / "vault_root"
-    src_root.mkdir(parents=True)
-    vault_root.mkdir(parents=True)
-
-    env_path.write_text(
-        "\n".join(
-            [
-                f"SRC_PATH_1={src_root}",
-                f"VAULT_1={vault_root}",
-                "SRC_PROFILE_1_ID=assets_1",
-            ]
-        ),
-        encoding="utf-8",
-    )
+def test_note_uses_group_embed_when_src_and_vault_split(split_db: SimpleNamespace) -> None:
+    db_path = split_db.db_path
 
     _seed_video(db_path, "assets_1", "vid-1")
-    client = _mk_client(db_path, env_path)
+    client = split_db.client
 
     r = client.get("/items/vid-1/note", params={"source_id": "assets_1", "force": True})
     assert r.status_code == 200
@@ -108,29 +135,11 @@ def test_note_uses_group_embed_when_src_and_vault_split(tmp_path: Path) -> None:
     assert "![[group:assets_1/Favorites/videos/vid-1.mp4]]" in md
 
 
-def test_stale_cached_note_is_auto_regenerated(tmp_path: Path) -> None:
-    db_path = tmp_path / "sx_obsidian.db"
-    env_path = tmp_path / "pipeline.env"
-
-    src_root = tmp_path / "source_root"
-    vault_root = tmp_path / "vault_root"
-    src_root.mkdir(parents=True)
-    vault_root.mkdir(parents=True)
-
-    env_path.write_text(
-        "\n".join(
-            [
-                f"SRC_PATH_1={src_root}",
-                f"VAULT_1={vault_root}",
-                "SRC_PROFILE_1_ID=assets_1",
-            ]
-        ),
-        encoding="utf-8",
-    )
+def test_stale_cached_note_is_auto_regenerated(split_db: SimpleNamespace) -> None:
+    db_path = split_db.db_path
 
     _seed_video(db_path, "assets_1", "vid-1")
     conn = connect(db_path)
-    init_db(conn, enable_fts=False)
     conn.execute(
         """
         INSERT INTO video_notes(source_id, video_id, markdown, template_version, updated_at)
@@ -139,7 +148,7 @@ def test_stale_cached_note_is_auto_regenerated(tmp_path: Path) -> None:
     )
     conn.commit()
 
-    client = _mk_client(db_path, env_path)
+    client = split_db.client
     r = client.get("/items/vid-1/note", params={"source_id": "assets_1"})
     assert r.status_code == 200
     body = r.json()
@@ -147,29 +156,11 @@ def test_stale_cached_note_is_auto_regenerated(tmp_path: Path) -> None:
     assert "group:assets_1/Favorites/videos/vid-1.mp4" in body["markdown"]
 
 
-def test_force_regenerates_even_user_cached_note(tmp_path: Path) -> None:
-    db_path = tmp_path / "sx_obsidian.db"
-    env_path = tmp_path / "pipeline.env"
-
-    src_root = tmp_path / "source_root"
-    vault_root = tmp_path / "vault_root"
-    src_root.mkdir(parents=True)
-    vault_root.mkdir(parents=True)
-
-    env_path.write_text(
-        "\n".join(
-            [
-                f"SRC_PATH_1={src_root}",
-                f"VAULT_1={vault_root}",
-                "SRC_PROFILE_1_ID=assets_1",
-            ]
-        ),
-        encoding="utf-8",
-    )
+def test_force_regenerates_even_user_cached_note(split_db: SimpleNamespace) -> None:
+    db_path = split_db.db_path
 
     _seed_video(db_path, "assets_1", "vid-1")
     conn = connect(db_path)
-    init_db(conn, enable_fts=False)
     conn.execute(
         """
         INSERT INTO video_notes(source_id, video_id, markdown, template_version, updated_at)
@@ -178,7 +169,7 @@ def test_force_regenerates_even_user_cached_note(tmp_path: Path) -> None:
     )
     conn.commit()
 
-    client = _mk_client(db_path, env_path)
+    client = split_db.client
 
     keep = client.get("/items/vid-1/note", params={"source_id": "assets_1"})
     assert keep.status_code == 200
@@ -191,28 +182,11 @@ def test_force_regenerates_even_user_cached_note(tmp_path: Path) -> None:
     assert "group:assets_1/Favorites/videos/vid-1.mp4" in body["markdown"]
 
 
-def test_note_pathlinker_group_override_is_ephemeral(tmp_path: Path) -> None:
-    db_path = tmp_path / "sx_obsidian.db"
-    env_path = tmp_path / "pipeline.env"
-
-    src_root = tmp_path / "source_root"
-    vault_root = tmp_path / "vault_root"
-    src_root.mkdir(parents=True)
-    vault_root.mkdir(parents=True)
-
-    env_path.write_text(
-        "\n".join(
-            [
-                f"SRC_PATH_1={src_root}",
-                f"VAULT_1={vault_root}",
-                "SRC_PROFILE_1_ID=assets_1",
-            ]
-        ),
-        encoding="utf-8",
-    )
+def test_note_pathlinker_group_override_is_ephemeral(split_db: SimpleNamespace) -> None:
+    db_path = split_db.db_path
 
     _seed_video(db_path, "assets_1", "vid-1")
-    client = _mk_client(db_path, env_path)
+    client = split_db.client
 
     base = client.get("/items/vid-1/note", params={"source_id": "assets_1", "force": True})
     assert base.status_code == 200
@@ -231,8 +205,8 @@ def test_note_pathlinker_group_override_is_ephemeral(tmp_path: Path) -> None:
     assert "group:assets_1/Favorites/videos/vid-1.mp4" in after.json()["markdown"]
 
 
-def test_media_cover_resolves_data_prefixed_relative_path(tmp_path: Path) -> None:
-    db_path = tmp_path / "sx_obsidian.db"
+def test_media_cover_resolves_data_prefixed_relative_path(tmp_path: Path, fresh_db: Path) -> None:
+    db_path = fresh_db
     env_path = tmp_path / "pipeline.env"
 
     src_root = tmp_path / "source_root"
@@ -262,8 +236,8 @@ def test_media_cover_resolves_data_prefixed_relative_path(tmp_path: Path) -> Non
     assert r.status_code == 200
 
 
-def test_media_cover_resolves_windows_src_path_in_wsl_runtime(tmp_path: Path) -> None:
-    db_path = tmp_path / "sx_obsidian.db"
+def test_media_cover_resolves_windows_src_path_in_wsl_runtime(tmp_path: Path, fresh_db: Path) -> None:
+    db_path = fresh_db
     env_path = tmp_path / "pipeline.env"
 
     # Emulate SchedulerX .env configured with Windows path while API runs on Linux/WSL.
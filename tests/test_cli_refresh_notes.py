@@ -10,6 +10,7 @@ class _Settings:
     def __init__(self, db_path: Path, scheduler_env: Path):
         self.SX_DB_PATH = db_path
         self.SX_DB_ENABLE_FTS = False
+        self.SX_DB_PROFILE = None
         self.SX_DEFAULT_SOURCE_ID = "default"
         self.SX_DB_BACKEND_MODE = "SQLITE"
         self.SX_SCHEDULERX_ENV = scheduler_env
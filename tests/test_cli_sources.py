@@ -10,6 +10,7 @@ class _Settings:
     def __init__(self, db_path: Path):
         self.SX_DB_PATH = db_path
         self.SX_DB_ENABLE_FTS = False
+        self.SX_DB_PROFILE = None
         self.SX_DEFAULT_SOURCE_ID = "default"
 
 
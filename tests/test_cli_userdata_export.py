@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import sx_db.cli as cli
+from sx_db.db import connect, ensure_source, init_db
+
+
+def test_export_userdata_streams_all_rows(tmp_path: Path, monkeypatch) -> None:
+    db_path = tmp_path / "sx.db"
+    conn = connect(db_path)
+    init_db(conn, enable_fts=False)
+    ensure_source(conn, "assets_1", label="assets_1")
+    conn.executemany(
+        "INSERT INTO videos(source_id, id, platform, caption) VALUES('assets_1', ?, 'tiktok', '')",
+        [(f"v{i}",) for i in range(2500)],
+    )
+    conn.executemany(
+        "INSERT INTO video_notes(source_id, video_id, markdown) VALUES('assets_1', ?, ?)",
+        [(f"v{i}", f"note {i} ✓") for i in range(2500)],
+    )
+    conn.execute("INSERT INTO user_meta(source_id, video_id, rating) VALUES('assets_1', 'v1', 5)")
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr(
+        cli,
+        "load_settings",
+        lambda: SimpleNamespace(SX_DB_PATH=db_path, SX_DB_ENABLE_FTS=False, SX_DB_PROFILE=None),
+    )
+    out = tmp_path / "exports" / "userdata.jsonl.gz"
+    cli.export_userdata(out=str(out), include_meta=True, include_notes=True, source=None)
+
+    with gzip.open(out, "rt", encoding="utf-8") as f:
+        objs = [json.loads(line) for line in f]
+    assert objs[0]["type"] == "sx_userdata_export"
+    assert [o["type"] for o in objs[1:]].count("user_meta") == 1
+    notes = [o for o in objs if o["type"] == "video_note"]
+    assert len(notes) == 2500
+    assert notes[-1]["markdown"] == "note 2499 ✓"
+
+
+def test_write_jsonl_pipelined_surfaces_writer_errors(tmp_path: Path) -> None:
+    missing_dir = tmp_path / "nope" / "out.jsonl"
+    with pytest.raises(FileNotFoundError):
+        cli._write_jsonl_pipelined(missing_dir, ({"i": i} for i in range(5000)), batch_rows=10)
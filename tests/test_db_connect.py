@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from sx_db.db import connect, init_db
+
+
+def test_connect_applies_high_performance_pragmas(tmp_path: Path) -> None:
+    conn = connect(tmp_path / "sx.db")
+    init_db(conn, enable_fts=False)
+
+    assert str(conn.execute("PRAGMA journal_mode").fetchone()[0]).lower() == "wal"
+    assert int(conn.execute("PRAGMA synchronous").fetchone()[0]) == 1  # NORMAL
+    assert int(conn.execute("PRAGMA cache_size").fetchone()[0]) == -64000
+    assert int(conn.execute("PRAGMA temp_store").fetchone()[0]) == 2  # MEMORY
+    conn.close()
+
+
+def test_connect_low_resource_profile_and_unknown_fallback(tmp_path: Path) -> None:
+    low = connect(tmp_path / "sx.db", profile="low_resource")
+    assert int(low.execute("PRAGMA cache_size").fetchone()[0]) == -2000
+    assert int(low.execute("PRAGMA mmap_size").fetchone()[0]) == 0
+    low.close()
+
+    other = connect(tmp_path / "sx.db", profile="nonsense")
+    assert int(other.execute("PRAGMA cache_size").fetchone()[0]) == -64000
+    other.close()
+    # close() is idempotent even though it runs PRAGMA optimize first.
+    other.close()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from sx_db.db import connect
+from sx_db.writer import WriterQueue
+
+
+def _make_db(db_path: Path) -> None:
+    conn = connect(db_path)
+    conn.execute("CREATE TABLE kv (k TEXT PRIMARY KEY, v INTEGER)")
+    conn.commit()
+    conn.close()
+
+
+def test_writer_queue_commits_concurrent_submits(tmp_path: Path) -> None:
+    db_path = tmp_path / "w.db"
+    _make_db(db_path)
+    writer = WriterQueue(db_path)
+
+    def put(i: int):
+        return writer.submit("INSERT INTO kv(k, v) VALUES(?, ?)", (f"k{i}", i))
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        futures = list(ex.map(put, range(200)))
+    for f in futures:
+        f.result(timeout=5)
+    writer.submit_many("UPDATE kv SET v=v+1 WHERE k=?", [("k0",), ("k1",)]).result(timeout=5)
+    writer.close()
+
+    conn = connect(db_path)
+    assert conn.execute("SELECT COUNT(*) FROM kv").fetchone()[0] == 200
+    assert conn.execute("SELECT v FROM kv WHERE k='k1'").fetchone()[0] == 2
+    conn.close()
+
+
+def test_writer_queue_failed_unit_does_not_poison_batch(tmp_path: Path) -> None:
+    db_path = tmp_path / "w.db"
+    _make_db(db_path)
+    writer = WriterQueue(db_path, flush_interval=0.05)
+
+    ok1 = writer.submit("INSERT INTO kv(k, v) VALUES('a', 1)")
+    bad = writer.submit_unit(
+        [
+            ("INSERT INTO kv(k, v) VALUES('b', 1)", [()]),
+            ("INSERT INTO kv(k, v) VALUES('a', 2)", [()]),  # duplicate key
+        ]
+    )
+    ok2 = writer.submit("INSERT INTO kv(k, v) VALUES('c', 1)")
+
+    ok1.result(timeout=5)
+    ok2.result(timeout=5)
+    with pytest.raises(Exception):
+        bad.result(timeout=5)
+    writer.close()
+
+    conn = connect(db_path)
+    # The failing unit is rolled back as a whole ('b' is absent).
+    assert [r[0] for r in conn.execute("SELECT k FROM kv ORDER BY k")] == ["a", "c"]
+    conn.close()
+
+    with pytest.raises(RuntimeError):
+        writer.submit("INSERT INTO kv(k, v) VALUES('d', 1)")
+
+
+def test_writer_queue_fails_futures_when_db_cannot_open(tmp_path: Path) -> None:
+    # A directory is not an openable SQLite database.
+    writer = WriterQueue(tmp_path, flush_interval=0.05)
+
+    fut = writer.submit("SELECT 1")
+    with pytest.raises(sqlite3.OperationalError):
+        fut.result(timeout=5)
+    writer._thread.join(timeout=5)  # noqa: SLF001
+
+    with pytest.raises(RuntimeError):
+        writer.submit("SELECT 1")
+    writer.close()
@@ -8,7 +8,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from sx_db.api import create_app
-from sx_db.repositories import PostgresRepository, safe_ident
+from sx_db.repositories import CompatCursor, PostgresRepository, safe_ident, sanitize_source_id
 from sx_db.settings import Settings
 
 
@@ -20,6 +20,64 @@ def test_safe_ident_rejects_injection() -> None:
     assert safe_ident("sx_assets_1") == "sx_assets_1"
 
 
+def test_sanitize_source_id_clean_and_dirty_inputs() -> None:
+    assert sanitize_source_id("sx_p01") == "sx_p01"
+    assert sanitize_source_id("assets-1.v2") == "assets-1.v2"
+    assert sanitize_source_id("  assets_1 ") == "assets_1"
+    assert sanitize_source_id("assets_1\n") == "assets_1"
+    assert sanitize_source_id("a;b c") == "abc"
+    assert sanitize_source_id("", fallback="fb") == "fb"
+    assert sanitize_source_id(None) == "default"
+
+
+def test_compat_cursor_rows_share_layout() -> None:
+    class _Cur:
+        def fetchall(self):
+            return [{"id": "a", "caption": "x"}, {"id": "b", "caption": "y"}]
+
+    rows = CompatCursor(_Cur()).fetchall()
+    assert [dict(r) for r in rows] == [{"id": "a", "caption": "x"}, {"id": "b", "caption": "y"}]
+    assert rows[1][0] == "b" and rows[1]["caption"] == "y"
+    assert rows[0]._batch is rows[1]._batch  # noqa: SLF001
+
+
+def test_ensure_global_tables_runs_once_per_repository(tmp_path: Path) -> None:
+    executed: list[str] = []
+    commits: list[int] = []
+
+    class _Cur:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, sql, params=None):
+            executed.append(sql)
+
+    class _Conn:
+        def cursor(self):
+            return _Cur()
+
+        def commit(self):
+            commits.append(1)
+
+    settings = Settings(
+        SX_DB_PATH=tmp_path / "sx_obsidian.db",
+        SX_DB_BACKEND_MODE="POSTGRES_PRIMARY",
+        SX_DEFAULT_SOURCE_ID="default",
+    )
+    repo = PostgresRepository(settings)
+    repo._ensure_global_tables(_Conn())  # noqa: SLF001
+    first = len(executed)
+    assert first > 0 and commits == [1]
+
+    # Later read requests must not pay for the bootstrap writes again.
+    repo._ensure_global_tables(_Conn())  # noqa: SLF001
+    assert len(executed) == first
+    assert commits == [1]
+
+
 def test_postgres_primary_missing_schema_mapping_returns_400(tmp_path: Path) -> None:
     settings = Settings(
         SX_DB_PATH=tmp_path / "sx_obsidian.db",
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from sx_db.db import connect, init_db
+from sx_db.scheduler import Scheduler
+from sx_db.settings import Settings
+
+
+def _scheduler(tmp_path: Path) -> Scheduler:
+    settings = Settings(
+        SX_DB_PATH=tmp_path / "sx_obsidian.db",
+        SX_DB_ENABLE_FTS=False,
+        SX_DEFAULT_SOURCE_ID="default",
+        SX_VAULT_PATH=str(tmp_path / "vault"),
+        _env_file=None,
+    )
+    return Scheduler(settings)
+
+
+def test_extract_media_paths_single_pass_dedup_in_order(tmp_path: Path) -> None:
+    sched = _scheduler(tmp_path)
+    md = "a [[x.mp4]] ![c](d/e.MP4) [[x.mp4]] [[cover.png]] ![z](y.mp4)"
+    assert sched._extract_media_paths(md) == ["x.mp4", "d/e.MP4", "y.mp4"]  # noqa: SLF001
+
+
+def test_get_note_path_uses_index_and_sees_new_notes(tmp_path: Path) -> None:
+    vault = tmp_path / "vault"
+    (vault / "Videos").mkdir(parents=True)
+    (vault / "deep" / "er").mkdir(parents=True)
+    (vault / "deep" / "er" / "v1.md").write_text("x", encoding="utf-8")
+    (vault / ".trash").mkdir()
+    (vault / ".trash" / "v9.md").write_text("x", encoding="utf-8")
+    sched = _scheduler(tmp_path)
+
+    assert sched._get_note_path("default", "v1") == vault / "deep" / "er" / "v1.md"  # noqa: SLF001
+    assert sched._get_note_path("default", "v2") is None  # noqa: SLF001
+    assert sched._get_note_path("default", "v9") is None  # noqa: SLF001
+
+    (vault / "deep" / "v2.md").write_text("x", encoding="utf-8")
+    assert sched._get_note_path("default", "v2") == vault / "deep" / "v2.md"  # noqa: SLF001
+
+    (vault / "Videos" / "v3.md").write_text("x", encoding="utf-8")
+    assert sched._get_note_path("default", "v3") == vault / "Videos" / "v3.md"  # noqa: SLF001
+
+
+def test_enqueue_many_persists_artifacts_and_jobs(tmp_path: Path) -> None:
+    vault = tmp_path / "vault"
+    (vault / "Videos").mkdir(parents=True)
+    (vault / "Videos" / "v1.md").write_text("---\ntitle: One\nplatform: pinterest\n---\nbody\n", encoding="utf-8")
+    (vault / "Videos" / "v2.md").write_text("---\ntitle: Two\npublish_time: '2026-01-01T00:00:00Z'\n---\nbody\n", encoding="utf-8")
+    sched = _scheduler(tmp_path)
+    conn = connect(sched.settings.SX_DB_PATH)
+    init_db(conn, enable_fts=False)
+    conn.close()
+
+    results = sched.enqueue_many([("default", "v1"), ("default", "v2"), ("default", "missing")])
+    sched.close()
+
+    assert [r["ok"] for r in results] == [True, True, False]
+    assert results[0]["artifact"]["platform"] == "pinterest"
+
+    conn = connect(sched.settings.SX_DB_PATH)
+    jobs = {r["video_id"]: r["action"] for r in conn.execute("SELECT video_id, action FROM job_queue")}
+    n_artifacts = conn.execute("SELECT COUNT(*) FROM scheduling_artifacts").fetchone()[0]
+    conn.close()
+    assert jobs == {"v1": "publish_draft", "v2": "publish_scheduled"}
+    assert n_artifacts == 2
+
+
+def test_enqueue_many_duplicate_video_gets_distinct_job_ids(tmp_path: Path) -> None:
+    vault = tmp_path / "vault"
+    (vault / "Videos").mkdir(parents=True)
+    (vault / "Videos" / "v1.md").write_text("---\ntitle: One\n---\nbody\n", encoding="utf-8")
+    sched = _scheduler(tmp_path)
+    conn = connect(sched.settings.SX_DB_PATH)
+    init_db(conn, enable_fts=False)
+    conn.close()
+
+    results = sched.enqueue_many([("default", "v1"), ("default", "v1")])
+    sched.close()
+
+    assert [r["ok"] for r in results] == [True, True]
+    assert results[0]["job_id"] != results[1]["job_id"]
+    conn = connect(sched.settings.SX_DB_PATH)
+    assert conn.execute("SELECT COUNT(*) FROM job_queue").fetchone()[0] == 2
+    conn.close()
+
+
+def test_enqueue_many_persist_failure_only_fails_that_source(tmp_path: Path, monkeypatch) -> None:
+    vault = tmp_path / "vault"
+    (vault / "Videos").mkdir(parents=True)
+    (vault / "Videos" / "v1.md").write_text("---\ntitle: One\n---\nbody\n", encoding="utf-8")
+    sched = _scheduler(tmp_path)
+    conn = connect(sched.settings.SX_DB_PATH)
+    init_db(conn, enable_fts=False)
+    conn.close()
+
+    persist = sched._persist_jobs  # noqa: SLF001
+
+    def _persist(source_id, prepared):
+        if source_id == "broken":
+            raise RuntimeError("boom")
+        persist(source_id, prepared)
+
+    monkeypatch.setattr(sched, "_persist_jobs", _persist)
+    results = sched.enqueue_many([("broken", "v1"), ("default", "v1")])
+    sched.close()
+
+    assert results[0] == {"ok": False, "error": "Failed to persist job for v1: boom"}
+    assert results[1]["ok"] is True
+    conn = connect(sched.settings.SX_DB_PATH)
+    assert [r[0] for r in conn.execute("SELECT source_id FROM job_queue")] == ["default"]
+    conn.close()
+
+
+def test_confirm_upload_rewrites_frontmatter_and_keeps_body(tmp_path: Path) -> None:
+    vault = tmp_path / "vault"
+    (vault / "Videos").mkdir(parents=True)
+    note = vault / "Videos" / "v1.md"
+    body = "\n# Heading\n\n--- not a fence\ntext\n"
+    note.write_text("---\ntitle: One\n---" + body, encoding="utf-8")
+    sched = _scheduler(tmp_path)
+    conn = connect(sched.settings.SX_DB_PATH)
+    init_db(conn, enable_fts=False)
+    conn.close()
+
+    out = sched.confirm_upload("default", "v1", "default/v1/clip.mp4")
+    sched.close()
+
+    assert out["ok"] is True
+    text = note.read_text(encoding="utf-8")
+    assert text.startswith("---\ntitle: One\nr2_media_url: ")
+    assert text.endswith("---" + body)
+    assert not (vault / "Videos" / "v1.md.tmp").exists()
+    assert sched.confirm_upload("default", "v1", "other/v1/clip.mp4")["ok"] is False
+    for bad in ("default/v1/../../other/x.mp4", "default/v1//clip.mp4", "default/v1/./clip.mp4", "default/v1/a\\..\\b.mp4"):
+        assert sched.confirm_upload("default", "v1", bad)["ok"] is False
+    assert "other" not in note.read_text(encoding="utf-8")
+
+
+def test_write_frontmatter_keeps_mode_and_cleans_up_on_failure(tmp_path: Path, monkeypatch) -> None:
+    note = tmp_path / "v1.md"
+    note.write_text("---\ntitle: One\n---\nbody\n", encoding="utf-8")
+    note.chmod(0o640)
+    sched = _scheduler(tmp_path)
+
+    sched._write_frontmatter(note, note.read_text(encoding="utf-8"), {"title": "Two"})  # noqa: SLF001
+    assert note.stat().st_mode & 0o777 == 0o640
+    assert note.read_text(encoding="utf-8") == "---\ntitle: Two\n---\nbody\n"
+
+    def _fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", _fail)
+    with pytest.raises(OSError):
+        sched._write_frontmatter(note, note.read_text(encoding="utf-8"), {"title": "Three"})  # noqa: SLF001
+    sched.close()
+
+    assert not (tmp_path / "v1.md.tmp").exists()
+    assert "Two" in note.read_text(encoding="utf-8")
+
+
+def test_upload_to_r2_streams_every_size_from_disk(tmp_path: Path) -> None:
+    calls: list[tuple[str, object]] = []
+
+    class _FakeS3:
+        def upload_file(self, filename, bucket, key, **kwargs):
+            calls.append(("file", filename))
+
+        def upload_fileobj(self, fileobj, bucket, key, **kwargs):
+            calls.append(("fileobj", fileobj))
+
+    sched = _scheduler(tmp_path)
+    sched.settings.SX_R2_BUCKET_NAME = "bucket"
+    sched.s3_client = _FakeS3()
+
+    small = tmp_path / "small.mp4"
+    small.write_bytes(b"tiny")
+    big = tmp_path / "big.mp4"
+    big.write_bytes(b"abcd" * 16)
+
+    assert sched._upload_to_r2(small, "default/v1/small.mp4")  # noqa: SLF001
+    assert sched._upload_to_r2(big, "default/v1/big.mp4")  # noqa: SLF001
+    sched.close()
+
+    assert calls == [("file", str(small)), ("file", str(big))]
+
+
+def test_r2_client_pool_covers_all_part_uploads(tmp_path: Path, monkeypatch) -> None:
+    import sx_db.scheduler as scheduler_mod
+
+    seen: dict = {}
+    monkeypatch.setattr(scheduler_mod.boto3, "client", lambda *a, **kw: seen.update(kw) or object())
+    settings = Settings(
+        SX_DB_PATH=tmp_path / "sx_obsidian.db",
+        SX_R2_ACCOUNT_ID="acct",
+        SX_R2_ACCESS_KEY_ID="key",
+        SX_R2_SECRET_ACCESS_KEY="secret",
+        _env_file=None,
+    )
+    sched = Scheduler(settings)
+    sched.close()
+
+    expected = scheduler_mod._UPLOAD_WORKERS * scheduler_mod._TRANSFER_CONFIG.max_concurrency  # noqa: SLF001
+    assert seen["config"].max_pool_connections == expected
+
+
+def test_resolve_media_prefers_note_dir_then_vault(tmp_path: Path) -> None:
+    vault = tmp_path / "vault"
+    note_dir = vault / "Videos"
+    (note_dir / "sub").mkdir(parents=True)
+    (note_dir / "a.mp4").write_bytes(b"x")
+    (vault / "a.mp4").write_bytes(b"x")
+    (vault / "b.mp4").write_bytes(b"x")
+    (note_dir / "sub" / "c.mp4").write_bytes(b"x")
+    sched = _scheduler(tmp_path)
+    roots = (note_dir, vault)
+    dir_files: dict = {}
+
+    assert sched._resolve_media("a.mp4", roots, dir_files) == note_dir / "a.mp4"  # noqa: SLF001
+    assert sched._resolve_media("b.mp4", roots, dir_files) == vault / "b.mp4"  # noqa: SLF001
+    assert sched._resolve_media("missing.mp4", roots, dir_files) is None  # noqa: SLF001
+    assert sched._resolve_media("sub/c.mp4", roots, dir_files) == note_dir / "sub" / "c.mp4"  # noqa: SLF001
+    # Each root was listed once.
+    assert set(dir_files) == {note_dir, vault}
+    sched.close()
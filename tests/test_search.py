@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from sx_db.db import FTS_SQL, connect, fts_needs_rebuild, init_db, rebuild_fts
+from sx_db.pool import ReadPool
+from sx_db.search import _sanitize_fts, search
+
+
+def _seed(db_path: Path, *, enable_fts: bool):
+    conn = connect(db_path)
+    init_db(conn, enable_fts=enable_fts)
+    rows = [
+        ("default", "111", "cats on a keyboard", "alice", "Alice", 0, "2024-01-01"),
+        ("default", "222", "dogs: the sequel", "bob", "Bob", 1, "2024-01-02"),
+        ("other", "333", "cats elsewhere", "carol", "Carol", 0, "2024-01-03"),
+    ]
+    conn.executemany(
+        "INSERT INTO videos(source_id, id, caption, author_unique_id, author_name, bookmarked, updated_at) VALUES(?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    rebuild_fts(conn)
+    return conn
+
+
+def test_sanitize_fts_quotes_terms_and_prefixes_last() -> None:
+    assert _sanitize_fts('foo:bar "baz') == '"foo:bar" """baz"*'
+    assert _sanitize_fts("  ") == ""
+
+
+def test_search_uses_fts_with_prefix_and_source_isolation(tmp_path: Path) -> None:
+    conn = _seed(tmp_path / "sx.db", enable_fts=True)
+
+    assert [r["id"] for r in search(conn, "cat")] == ["111"]
+    assert [r["id"] for r in search(conn, "ali")] == ["111"]
+    assert [r["id"] for r in search(conn, "cats", source_id="other")] == ["333"]
+    # Punctuation no longer raises inside FTS.
+    assert [r["id"] for r in search(conn, "dogs:")] == ["222"]
+    # Past the end of FTS results stays empty instead of switching to LIKE.
+    assert search(conn, "cats", offset=5) == []
+
+
+def test_init_db_realigns_legacy_fts_rowids(tmp_path: Path) -> None:
+    conn = connect(tmp_path / "sx.db")
+    init_db(conn, enable_fts=True)
+    conn.executemany(
+        "INSERT INTO videos(source_id, id, caption) VALUES('default', ?, ?)",
+        [("v0", "alpha cats"), ("v1", "beta dogs"), ("v2", "gamma birds")],
+    )
+    conn.execute("DELETE FROM videos WHERE id='v0'")
+    # Legacy index: FTS rows numbered on their own, not by videos.rowid.
+    conn.execute("DROP TABLE videos_fts")
+    conn.executescript(FTS_SQL)
+    for r in conn.execute("SELECT source_id, id, caption FROM videos ORDER BY rowid").fetchall():
+        conn.execute("INSERT INTO videos_fts(source_id, id, caption, author_unique_id, author_name) VALUES(?, ?, ?, '', '')", tuple(r))
+    conn.execute("PRAGMA user_version=0")
+    conn.commit()
+
+    init_db(conn, enable_fts=True)
+    assert [r["id"] for r in search(conn, "gamma")] == ["v2"]
+    assert int(conn.execute("PRAGMA user_version").fetchone()[0]) >= 1
+
+
+def test_fts_needs_rebuild_after_deletes(tmp_path: Path) -> None:
+    conn = _seed(tmp_path / "sx.db", enable_fts=True)
+    assert fts_needs_rebuild(conn) is False
+
+    # Deleting the highest rowid lets the next insert reuse it.
+    conn.execute("DELETE FROM videos WHERE id='333'")
+    conn.commit()
+    assert fts_needs_rebuild(conn) is True
+    rebuild_fts(conn)
+    assert fts_needs_rebuild(conn) is False
+    conn.close()
+
+
+def test_search_like_fallback_for_ids_and_without_fts(tmp_path: Path) -> None:
+    conn = _seed(tmp_path / "fts.db", enable_fts=True)
+    assert [r["id"] for r in search(conn, "22")] == ["222"]
+
+    plain = _seed(tmp_path / "plain.db", enable_fts=False)
+    assert [r["id"] for r in search(plain, "keyboard")] == ["111"]
+
+
+def test_fts_existence_is_cached_on_connection(tmp_path: Path) -> None:
+    conn = _seed(tmp_path / "sx.db", enable_fts=True)
+    assert conn._has_fts is True  # noqa: SLF001 - set by init_db
+
+    fresh = connect(tmp_path / "sx.db")
+    assert fresh._has_fts is None  # noqa: SLF001
+    search(fresh, "cats")
+    assert fresh._has_fts is True  # noqa: SLF001
+
+
+def test_pooled_connection_notices_fts_created_later(tmp_path: Path) -> None:
+    db_path = tmp_path / "sx.db"
+    _seed(db_path, enable_fts=False).close()
+    pool = ReadPool(db_path, size=1)
+    with pool.acquire() as conn:
+        assert [r["id"] for r in search(conn, "cats")] == ["111"]
+        assert conn._has_fts is False  # noqa: SLF001
+
+    writer = connect(db_path)
+    init_db(writer, enable_fts=True)
+    rebuild_fts(writer)
+    writer.close()
+
+    with pool.acquire() as conn:
+        assert [r["id"] for r in search(conn, "cats")] == ["111"]
+        assert conn._has_fts is True  # noqa: SLF001
+    pool.close()
+
+
+def test_search_through_read_only_pool(tmp_path: Path) -> None:
+    db_path = tmp_path / "sx.db"
+    _seed(db_path, enable_fts=True).close()
+    pool = ReadPool(db_path, size=2)
+
+    with pool.acquire() as conn:
+        assert [r["id"] for r in search(conn, "cat")] == ["111"]
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM videos")
+        first = conn
+    with pool.acquire() as conn:
+        # Idle connections are reused rather than reopened.
+        assert conn is first
+    pool.close()
+
+
+def test_browse_ordering_is_index_driven(tmp_path: Path) -> None:
+    conn = _seed(tmp_path / "sx.db", enable_fts=False)
+    plan = " ".join(
+        str(r[3])
+        for r in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM videos WHERE source_id=? ORDER BY bookmarked DESC, updated_at DESC LIMIT 5",
+            ("default",),
+        )
+    )
+    assert "idx_videos_source_browse" in plan
+    assert "TEMP B-TREE" not in plan
+    assert [r["id"] for r in search(conn, "")] == ["222", "111"]
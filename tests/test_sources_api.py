@@ -27,6 +27,19 @@ def _mk_client(db_path: Path) -> TestClient:
     return TestClient(app)
 
 
+def test_app_shutdown_closes_scheduler_and_read_pool(tmp_path: Path, monkeypatch):
+    from sx_db import api as api_mod
+
+    closed: list[str] = []
+    monkeypatch.setattr(api_mod.Scheduler, "close", lambda self: closed.append("scheduler"))
+    monkeypatch.setattr(api_mod.ReadPool, "close", lambda self: closed.append("read_pool"))
+
+    with _mk_client(tmp_path / "sx_obsidian.db") as client:
+        assert client.get("/search", params={"q": ""}).status_code == 200
+        assert closed == []
+    assert closed == ["scheduler", "read_pool"]
+
+
 def test_sources_crud_and_default_resolution(tmp_path: Path):
     db_path = tmp_path / "sx_obsidian.db"
     conn = connect(db_path)
@@ -93,8 +106,26 @@ def test_sources_delete_rejects_non_empty_source(tmp_path: Path):
     assert bad.status_code == 400
 
 
+def _mk_pipeline_client(tmp_path: Path, env_path: Path) -> TestClient:
+    settings = Settings(
+        SX_DB_PATH=tmp_path / "sx_obsidian.db",
+        SX_DB_ENABLE_FTS=False,
+        SX_API_CORS_ALLOW_ALL=False,
+        SX_DEFAULT_SOURCE_ID="default",
+        SX_DB_BACKEND_MODE="SQLITE",
+        SX_API_REQUIRE_EXPLICIT_SOURCE=False,
+        SX_API_ENFORCE_PROFILE_SOURCE_MATCH=False,
+        SX_SCHEDULERX_ENV=env_path,
+        SX_PROFILE_INDEX=1,
+        DATA_DIR=str(tmp_path),
+        SX_MEDIA_VAULT=str(tmp_path),
+        SX_MEDIA_DATA_DIR=str(tmp_path),
+        SX_MEDIA_STYLE="linux",
+    )
+    return TestClient(create_app(settings))
+
+
 def test_pipeline_profiles_includes_sql_mode_metadata(tmp_path: Path):
-    db_path = tmp_path / "sx_obsidian.db"
     env_path = tmp_path / "pipeline.env"
     env_path.write_text(
         "\n".join(
@@ -117,22 +148,7 @@ def test_pipeline_profiles_includes_sql_mode_metadata(tmp_path: Path):
         encoding="utf-8",
     )
 
-    settings = Settings(
-        SX_DB_PATH=db_path,
-        SX_DB_ENABLE_FTS=False,
-        SX_API_CORS_ALLOW_ALL=False,
-        SX_DEFAULT_SOURCE_ID="default",
-        SX_DB_BACKEND_MODE="SQLITE",
-        SX_API_REQUIRE_EXPLICIT_SOURCE=False,
-        SX_API_ENFORCE_PROFILE_SOURCE_MATCH=False,
-        SX_SCHEDULERX_ENV=env_path,
-        SX_PROFILE_INDEX=1,
-        DATA_DIR=str(tmp_path),
-        SX_MEDIA_VAULT=str(tmp_path),
-        SX_MEDIA_DATA_DIR=str(tmp_path),
-        SX_MEDIA_STYLE="linux",
-    )
-    client = TestClient(create_app(settings))
+    client = _mk_pipeline_client(tmp_path, env_path)
 
     r = client.get("/pipeline/profiles")
     assert r.status_code == 200
@@ -145,6 +161,34 @@ def test_pipeline_profiles_includes_sql_mode_metadata(tmp_path: Path):
     assert "SQL" in p1["available_modes"]
 
 
+def test_pipeline_env_parse_cached_until_file_changes(tmp_path: Path, monkeypatch):
+    env_path = tmp_path / "pipeline.env"
+    env_path.write_text("SRC_PATH_1=/mnt/t/AlexNova/data\nDATABASE_PROFILE_1=assets_1\n", encoding="utf-8")
+    client = _mk_pipeline_client(tmp_path, env_path)
+    assert len(client.get("/pipeline/profiles").json()["profiles"]) == 1
+
+    # The env file is parsed once and re-read only after it changes.
+    reads: list[Path] = []
+    real_read_text = Path.read_text
+
+    def _counting_read_text(self, *args, **kwargs):
+        if self == env_path:
+            reads.append(self)
+        return real_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", _counting_read_text)
+    assert client.get("/pipeline/profiles").status_code == 200
+    assert reads == []
+
+    env_path.write_text(real_read_text(env_path, encoding="utf-8") + "\nSRC_PATH_2=/mnt/t/Other/data\n", encoding="utf-8")
+    payload = client.get("/pipeline/profiles").json()
+    assert reads
+    assert len(payload["profiles"]) == 2
+    reads.clear()
+    assert client.get("/pipeline/profiles").status_code == 200
+    assert reads == []
+
+
 def test_postgres_mirror_mode_falls_back_without_url(tmp_path: Path):
     db_path = tmp_path / "sx_obsidian.db"
     settings = Settings(
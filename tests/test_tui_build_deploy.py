@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import io
+import os
+import shutil
+import subprocess
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 
-from sx_db.tui.screens.build_deploy import _default_checked_vault_paths
+from rich.console import Console
+
+from sx_db.tui.screens import build_deploy as bd
+from sx_db.tui.screens.build_deploy import _default_checked_vault_paths, _visible_subdirs
 
 
 def _profile(index: int, root: str):
@@ -46,3 +54,277 @@ def test_default_checked_uses_obsidian_hint_when_profiles_missing() -> None:
 
     checked = _default_checked_vault_paths(all_paths, [], None)
     assert checked == {"/x/two"}
+
+
+def test_visible_subdirs_skips_hidden_and_files(tmp_path: Path) -> None:
+    for name in ("b", "a", ".hidden", "C"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "file.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "link").symlink_to(tmp_path / "a", target_is_directory=True)
+
+    dirs, total = _visible_subdirs(tmp_path)
+    assert [d.name for d in dirs] == ["C", "a", "b", "link"]
+    assert total == 4
+    assert dirs[1].path == str(tmp_path / "a")
+
+    head, total = _visible_subdirs(tmp_path, limit=2)
+    assert [d.name for d in head] == ["C", "a"]
+    assert total == 4
+
+
+def test_deploy_to_vaults_parallel_keeps_output_order(tmp_path: Path, monkeypatch) -> None:
+    plugin_dir = tmp_path / "plugin"
+    plugin_dir.mkdir()
+    for name in bd.PLUGIN_ARTIFACTS:
+        (plugin_dir / name).write_text(name, encoding="utf-8")
+    monkeypatch.setattr(bd, "PLUGIN_DIR", plugin_dir)
+    monkeypatch.setattr(bd, "discover_profiles_cached", lambda: ())
+    monkeypatch.setattr(bd, "discover_vaults_cached", lambda: ())
+
+    vaults = []
+    for name in ("v1", "v2", "v3"):
+        (tmp_path / name / ".obsidian").mkdir(parents=True)
+        vaults.append(tmp_path / name)
+    vaults.append(tmp_path / "no_obsidian")
+
+    printed: list[str] = []
+    router = SimpleNamespace(console=SimpleNamespace(print=printed.append))
+
+    assert bd._deploy_to_vaults(router, vaults) == 3
+    for v in vaults[:3]:
+        dest = v / ".obsidian" / "plugins" / bd.PLUGIN_ID
+        assert sorted(p.name for p in dest.iterdir()) == sorted(bd.PLUGIN_ARTIFACTS)
+    assert [line for line in printed if "Deployed to" in line] == [
+        "  [green]✓[/] Deployed to v1",
+        "  [green]✓[/] Deployed to v2",
+        "  [green]✓[/] Deployed to v3",
+    ]
+    assert "no template" in printed[-1]
+
+
+def test_deploy_reads_artifacts_once_for_all_vaults(tmp_path: Path, monkeypatch) -> None:
+    plugin_dir = tmp_path / "plugin"
+    plugin_dir.mkdir()
+    (plugin_dir / "main.js").write_text("js", encoding="utf-8")
+    (plugin_dir / "main.js").chmod(0o640)
+    (plugin_dir / "manifest.json").write_text("{}", encoding="utf-8")
+    monkeypatch.setattr(bd, "PLUGIN_DIR", plugin_dir)
+
+    loads: list[int] = []
+    orig_load = bd._load_plugin_artifacts
+
+    def _counting_load():
+        loads.append(1)
+        return orig_load()
+
+    monkeypatch.setattr(bd, "_load_plugin_artifacts", _counting_load)
+    vaults = [tmp_path / "v1", tmp_path / "v2"]
+    for v in vaults:
+        (v / ".obsidian").mkdir(parents=True)
+    printed: list[str] = []
+    router = SimpleNamespace(console=SimpleNamespace(print=printed.append))
+
+    assert bd._deploy_to_vaults(router, vaults) == 2
+    assert loads == [1]
+    for v in vaults:
+        dest = v / ".obsidian" / "plugins" / bd.PLUGIN_ID
+        assert (dest / "main.js").read_text(encoding="utf-8") == "js"
+        assert (dest / "main.js").stat().st_mode & 0o777 == 0o640
+        assert (dest / "main.js").stat().st_mtime_ns == (plugin_dir / "main.js").stat().st_mtime_ns
+        assert not (dest / "styles.css").exists()
+    assert sum("styles.css not found" in line for line in printed) == 2
+
+    # Overwriting an existing artifact also takes the build's mode and mtime.
+    (plugin_dir / "main.js").write_text("js2", encoding="utf-8")
+    (plugin_dir / "main.js").chmod(0o600)
+    os.utime(plugin_dir / "main.js", ns=(10**18, 10**18))
+    assert bd._deploy_to_vaults(router, vaults[:1]) == 1
+    dst = vaults[0] / ".obsidian" / "plugins" / bd.PLUGIN_ID / "main.js"
+    assert dst.read_text(encoding="utf-8") == "js2"
+    assert dst.stat().st_mode & 0o777 == 0o600
+    assert dst.stat().st_mtime_ns == 10**18
+
+
+def test_deploy_skips_unchanged_artifacts(tmp_path: Path, monkeypatch) -> None:
+    plugin_dir = tmp_path / "plugin"
+    plugin_dir.mkdir()
+    for name in bd.PLUGIN_ARTIFACTS:
+        (plugin_dir / name).write_text(name, encoding="utf-8")
+    monkeypatch.setattr(bd, "PLUGIN_DIR", plugin_dir)
+    vault = tmp_path / "v"
+    (vault / ".obsidian").mkdir(parents=True)
+    router = SimpleNamespace(console=SimpleNamespace(print=lambda *_: None))
+
+    assert bd._deploy_to_vault(router, vault)
+    dest = vault / ".obsidian" / "plugins" / bd.PLUGIN_ID
+    os.utime(dest / "main.js", ns=(1, 1))
+    (plugin_dir / "styles.css").write_text("changed", encoding="utf-8")
+
+    assert bd._deploy_to_vault(router, vault)
+    assert (dest / "main.js").stat().st_mtime_ns == 1  # identical: not rewritten
+    assert (dest / "styles.css").read_text(encoding="utf-8") == "changed"
+
+
+def test_build_plugin_logs_npm_output_and_shows_tail_on_failure(tmp_path: Path, monkeypatch) -> None:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    npm = bin_dir / "npm"
+    npm.write_text('#!/bin/sh\necho "compiling $*"\necho "error TS1005: [oops]" >&2\nexit 1\n', encoding="utf-8")
+    npm.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+
+    plugin_dir = tmp_path / "plugin"
+    (plugin_dir / "node_modules").mkdir(parents=True)
+    monkeypatch.setattr(bd, "PLUGIN_DIR", plugin_dir)
+    monkeypatch.setattr(bd, "BUILD_LOG_PATH", tmp_path / "_logs" / "plugin_build.log")
+
+    printed: list[str] = []
+    router = SimpleNamespace(console=Console(file=io.StringIO(), width=200))
+    router.console.print = lambda msg="", *a, **k: printed.append(str(msg))
+
+    assert bd._build_plugin(router) is False
+    log = bd.BUILD_LOG_PATH.read_text(encoding="utf-8")
+    assert "$ npm run build" in log
+    assert "compiling run build" in log
+    assert any("error TS1005: \\[oops]" in line for line in printed)
+
+
+def test_build_plugin_emit_mode_buffers_status_without_spinner(tmp_path: Path, monkeypatch) -> None:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    npm = bin_dir / "npm"
+    npm.write_text("#!/bin/sh\necho ok\n", encoding="utf-8")
+    npm.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    plugin_dir = tmp_path / "plugin"
+    plugin_dir.mkdir()
+    monkeypatch.setattr(bd, "PLUGIN_DIR", plugin_dir)
+    monkeypatch.setattr(bd, "BUILD_LOG_PATH", tmp_path / "_logs" / "plugin_build.log")
+
+    def _no_console(*_a, **_k):
+        raise AssertionError("background build must not touch the console")
+
+    router = SimpleNamespace(console=SimpleNamespace(print=_no_console, status=_no_console))
+    lines: list[str] = []
+
+    assert bd._build_plugin(router, lines.append) is True
+    assert lines == ["[green]✓ Dependencies installed[/]", "[green]✓ Plugin built successfully[/]"]
+
+
+def test_run_npm_never_inherits_stdin(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(bd, "BUILD_LOG_PATH", tmp_path / "plugin_build.log")
+    seen: dict = {}
+    monkeypatch.setattr(bd.subprocess, "run", lambda *a, **k: seen.update(k) or SimpleNamespace(returncode=0))
+
+    assert bd._run_npm(["run", "build"]) == 0
+    assert seen["stdin"] is subprocess.DEVNULL
+
+
+def test_start_build_reuses_in_flight_build(monkeypatch) -> None:
+    release = threading.Event()
+    calls: list[int] = []
+
+    def _fake_build(router, emit):
+        calls.append(1)
+        release.wait(5)
+        return True
+
+    monkeypatch.setattr(bd, "_build_plugin", _fake_build)
+    monkeypatch.setattr(bd, "_BUILD", None)
+
+    first, lines, reused = bd._start_build(SimpleNamespace())
+    again, again_lines, reused_again = bd._start_build(SimpleNamespace())
+    assert (reused, reused_again) == (False, True)
+    assert again is first and again_lines is lines
+
+    release.set()
+    assert first.result(timeout=5) is True
+    later, _, reused_later = bd._start_build(SimpleNamespace())
+    assert later is not first and reused_later is False
+    later.result(timeout=5)
+    assert len(calls) == 2
+
+
+def test_build_timeout_shows_error_panel(tmp_path: Path, monkeypatch) -> None:
+    def _timeout(router, emit):
+        raise subprocess.TimeoutExpired(["npm", "run", "build"], 120)
+
+    class _Ask:
+        def ask(self):
+            return "back"
+
+    monkeypatch.setattr(bd, "_BUILD", None)
+    monkeypatch.setattr(bd, "_build_plugin", _timeout)
+    monkeypatch.setattr(bd, "render_header", lambda *a, **k: None)
+    monkeypatch.setattr(bd, "_collect_vault_paths", lambda router: [tmp_path])
+    monkeypatch.setattr(bd.questionary, "select", lambda *a, **k: _Ask())
+    out = io.StringIO()
+    router = SimpleNamespace(console=Console(file=out, width=200), settings=None)
+
+    assert bd.show_build_deploy(router) == "back"
+    assert "Plugin build timed out after 120s" in out.getvalue()
+
+
+def test_clone_or_copy_produces_independent_copy(tmp_path: Path) -> None:
+    src_dir = tmp_path / "tmpl" / ".obsidian"
+    (src_dir / "plugins").mkdir(parents=True)
+    (src_dir / "app.json").write_text('{"a": 1}', encoding="utf-8")
+    (src_dir / "plugins" / "x.json").write_text("x", encoding="utf-8")
+    dst_dir = tmp_path / "vault" / ".obsidian"
+
+    shutil.copytree(src_dir, dst_dir, dirs_exist_ok=True, copy_function=bd._clone_or_copy)
+    assert (dst_dir / "plugins" / "x.json").read_text(encoding="utf-8") == "x"
+
+    (dst_dir / "app.json").write_text('{"a": 2}', encoding="utf-8")
+    assert (src_dir / "app.json").read_text(encoding="utf-8") == '{"a": 1}'
+    assert os.stat(dst_dir / "app.json").st_ino != os.stat(src_dir / "app.json").st_ino
+
+
+def test_collect_vault_paths_merges_sources_in_one_pass(tmp_path: Path, monkeypatch) -> None:
+    known = tmp_path / "known"
+    remembered = tmp_path / "remembered"
+    profile_root = tmp_path / "profile"
+    for d in (known, remembered, profile_root):
+        d.mkdir()
+    (remembered / ".obsidian").mkdir()
+
+    monkeypatch.setattr(bd, "discover_vaults_cached", lambda: (SimpleNamespace(path=str(known), has_obsidian=True),))
+    monkeypatch.setattr(
+        bd,
+        "discover_profiles_cached",
+        lambda: (
+            SimpleNamespace(index=1, vault_root=known, label="dup"),
+            SimpleNamespace(index=2, vault_root=profile_root, label="P2"),
+            SimpleNamespace(index=3, vault_root=tmp_path / "missing", label="P3"),
+        ),
+    )
+    monkeypatch.setattr(bd, "_load_known_vault_memory", lambda: [str(remembered), str(known)])
+    probed: list[str] = []
+    real_has_obsidian = bd._has_obsidian
+    monkeypatch.setattr(bd, "_has_obsidian", lambda p: probed.append(p) or real_has_obsidian(p))
+
+    seen: dict[str, str] = {}
+
+    class _Ask:
+        def __init__(self, value):
+            self.value = value
+
+        def ask(self):
+            return self.value
+
+    monkeypatch.setattr(bd.questionary, "select", lambda *a, **k: _Ask("pick"))
+
+    def _checkbox(*a, choices, **k):
+        seen.update({c.value: c.title for c in choices})
+        return _Ask([])
+
+    monkeypatch.setattr(bd.questionary, "checkbox", _checkbox)
+    router = SimpleNamespace(state=SimpleNamespace(data={}))
+
+    assert bd._collect_vault_paths(router) is None
+    assert seen == {
+        str(known): f"{known}  [✓ .obsidian]",
+        str(remembered): f"{remembered}  [✓ .obsidian] [remembered]",
+        str(profile_root): f"{profile_root}  [no .obsidian] (P2)",
+    }
+    assert sorted(probed) == sorted([str(remembered), str(profile_root)])
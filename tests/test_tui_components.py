@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+from sx_db.db import connect, init_db
+from sx_db.tui import components
+
+
+def test_header_counts_single_query_and_cached(tmp_path: Path, monkeypatch) -> None:
+    db_path = tmp_path / "sx.db"
+    conn = connect(db_path)
+    init_db(conn, enable_fts=False)
+    conn.execute("INSERT INTO sources(id, label) VALUES ('a', 'a')")
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr(components, "_HEADER_CACHE", None)
+    settings = SimpleNamespace(SX_DB_PATH=db_path, SX_DB_ENABLE_FTS=False, SX_DB_PROFILE=None)
+
+    videos, sources = components._header_counts(settings)
+    assert videos == 0
+    assert sources >= 1
+
+    # Within the TTL the cached counts are reused, even after the DB changes.
+    conn = connect(db_path)
+    conn.execute("INSERT INTO sources(id, label) VALUES ('b', 'b')")
+    conn.commit()
+    conn.close()
+    assert components._header_counts(settings) == (videos, sources)
+
+    # Expired (or a different DB path) re-reads.
+    ts, key, v, s = components._HEADER_CACHE
+    monkeypatch.setattr(components, "_HEADER_CACHE", (ts - 10.0, key, v, s))
+    assert components._header_counts(settings) == (videos, sources + 1)
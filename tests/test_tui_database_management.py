@@ -1,13 +1,30 @@
 """Unit tests for database management TUI helpers."""
 from __future__ import annotations
 
+import errno
+import os
+import signal
+import socket
+import subprocess
+import sys
 from unittest.mock import MagicMock
 
+import pytest
+from questionary.prompts.common import InquirerControl
+
 from sx_db.tui.db_targets import DatabaseServer
+from sx_db.tui.screens import database_management as dm
 from sx_db.tui.screens.database_management import (
+    _pids_listening_on_port,
     _schema_for_target,
     _stop_prisma_studio,
     _studio_port_for_target,
+    _tail_text,
+    _wait_for_studio,
+)
+from sx_db.tui.screens.database_management_menu import (
+    database_management_advanced_choices,
+    database_management_choices,
 )
 
 
@@ -23,6 +40,14 @@ def test_schema_for_target_mapping():
     assert _schema_for_target("cloud").name == "schema.cloud.prisma"
 
 
+def test_unknown_target_is_rejected():
+    """Targets are a closed set; typos no longer fall through to cloud."""
+    with pytest.raises(KeyError):
+        _schema_for_target("staging")
+    with pytest.raises(KeyError):
+        _studio_port_for_target("all")
+
+
 def test_prisma_dsn_uses_schema_query_param():
     """Prisma DSN should use ?schema=... so db pull targets the intended schema."""
     server = DatabaseServer(
@@ -62,3 +87,256 @@ def test_stop_prisma_studio_no_listeners(monkeypatch):
 
     ok = _stop_prisma_studio(router, None)
     assert ok is True
+
+
+def test_tail_text_reads_only_the_end(tmp_path):
+    """Tail should match a full read for small and multi-block logs."""
+    log = tmp_path / "prisma.log"
+    assert _tail_text(log) == ""
+
+    log.write_text("", encoding="utf-8")
+    assert _tail_text(log) == ""
+
+    lines = [f"line {i} " + "x" * 200 for i in range(2000)]
+    log.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    assert _tail_text(log, max_lines=30) == "\n".join(lines[-30:])
+
+    log.write_text("a\nb\nc", encoding="utf-8")
+    assert _tail_text(log, max_lines=2) == "b\nc"
+    assert _tail_text(log, max_lines=10) == "a\nb\nc"
+
+
+def test_wait_for_studio_detects_tcp_listener():
+    """Readiness is a plain TCP connect; a closed port times out."""
+    srv = socket.socket()
+    srv.bind(("127.0.0.1", 0))
+    srv.listen(1)
+    port = srv.getsockname()[1]
+    try:
+        assert _wait_for_studio(port, timeout_sec=1.0) is True
+    finally:
+        srv.close()
+    assert _wait_for_studio(port, timeout_sec=0.3) is False
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc/net/tcp")
+def test_pids_listening_on_port_reads_proc(monkeypatch):
+    """Listeners are found from /proc without spawning lsof/ss."""
+
+    def _no_subprocess(*args, **kwargs):
+        raise AssertionError("subprocess should not be used on Linux")
+
+    monkeypatch.setattr("sx_db.tui.screens.database_management.subprocess.run", _no_subprocess)
+
+    srv = socket.socket()
+    srv.bind(("127.0.0.1", 0))
+    srv.listen(1)
+    port = srv.getsockname()[1]
+    try:
+        assert os.getpid() in _pids_listening_on_port(port)
+    finally:
+        srv.close()
+    assert _pids_listening_on_port(port) == set()
+
+
+def test_stop_prisma_studio_signals_without_subprocess(monkeypatch):
+    """TERM goes to every listener; only the survivor gets KILL; no `kill` processes."""
+    dm = "sx_db.tui.screens.database_management"
+    alive = {101, 202}
+    sent: list[tuple[int, int]] = []
+
+    def _fake_kill(pid, sig):
+        if pid not in alive:
+            raise ProcessLookupError(pid)
+        if sig:
+            sent.append((pid, sig))
+            if sig == signal.SIGKILL or pid == 101:
+                alive.discard(pid)
+
+    def _no_subprocess(*args, **kwargs):
+        raise AssertionError("subprocess should not be used")
+
+    def _no_pidfd(pid):
+        raise OSError(errno.ENOSYS, "pidfd_open")
+
+    monkeypatch.setattr(f"{dm}.os.kill", _fake_kill)
+    monkeypatch.setattr(f"{dm}.os.pidfd_open", _no_pidfd, raising=False)
+    monkeypatch.setattr(f"{dm}.time.sleep", lambda s: None)
+    monkeypatch.setattr(f"{dm}.subprocess.run", _no_subprocess)
+    monkeypatch.setattr(f"{dm}._pids_listening_on_port", lambda port: {101, 202} if port == 5555 else set())
+
+    assert _stop_prisma_studio(MagicMock(), "local", quiet=True) is True
+    assert sent == [(101, signal.SIGTERM), (202, signal.SIGTERM), (202, signal.SIGKILL)]
+
+
+def test_prisma_env_reuses_server_discovery(monkeypatch, tmp_path):
+    """Server discovery runs once per screen visit, not once per lookup."""
+    calls: list[int] = []
+    server = DatabaseServer(
+        name="local",
+        label="Local",
+        host="localhost",
+        port=5432,
+        db_name="db",
+        user="u",
+        password="p",
+        alias_prefix="SXO_LOCAL",
+        is_active=True,
+    )
+    monkeypatch.setattr(dm, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(dm, "discover_servers", lambda: calls.append(1) or [server])
+    dm._clear_discovery_cache()
+
+    profile = MagicMock(schema_name="sxo_assets_1")
+    env = dm._prisma_env_for(profile)
+    dm._prisma_env_for(profile)
+    assert env["LOCAL_DATABASE_URL"].endswith("?schema=sxo_assets_1")
+    assert calls == [1]
+    dm._clear_discovery_cache()
+
+
+def test_npx_lookup_cached_per_visit(monkeypatch):
+    """PATH is searched for npx once until the screen cache is cleared."""
+    calls: list[str] = []
+    monkeypatch.setattr(dm.shutil, "which", lambda name: calls.append(name) or "/usr/bin/npx")
+    dm._clear_discovery_cache()
+    assert dm._npx_path() == "/usr/bin/npx"
+    assert dm._npx_path() == "/usr/bin/npx"
+    assert calls == ["npx"]
+    dm._clear_discovery_cache()
+
+
+def test_run_prisma_streams_output_to_log(monkeypatch, tmp_path):
+    """Prisma output lands in a log file and its tail is shown on failure."""
+    prisma_dir = tmp_path / "prisma"
+    prisma_dir.mkdir()
+    schema = prisma_dir / "schema.local.prisma"
+    schema.write_text("// schema\n", encoding="utf-8")
+    monkeypatch.setattr(dm, "PRISMA_DIR", prisma_dir)
+    monkeypatch.setitem(dm._SCHEMA_PATH, "local", schema)
+    monkeypatch.setattr(dm, "LOG_DIR", tmp_path / "_logs")
+    monkeypatch.setattr(dm, "_npx_path", lambda: "/usr/bin/npx")
+    monkeypatch.setattr(dm, "_prisma_env_for", lambda profile: {})
+
+    def _fake_run(cmd, *, stdout, stderr, **kwargs):
+        assert stderr is dm.subprocess.STDOUT
+        stdout.write(b"".join(b"line %d\n" % i for i in range(100)) + b"Error: P1001 unreachable\n")
+        return MagicMock(returncode=1)
+
+    monkeypatch.setattr(dm.subprocess, "run", _fake_run)
+    router = MagicMock()
+    profile = MagicMock(schema_name="sxo assets")
+
+    assert dm._run_prisma(router, "local", ["validate"], profile) is False
+    logs = list((tmp_path / "_logs").glob("prisma_cmd_local_sxo_assets_*.log"))
+    assert len(logs) == 1
+    panel = router.console.print.call_args_list[0].args[0]
+    assert panel.renderable.endswith("Error: P1001 unreachable")
+    assert "line 50" not in panel.renderable
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="needs pidfd_open")
+def test_wait_for_exit_returns_when_process_exits():
+    """pidfd wait reports live PIDs on timeout and returns early once they exit."""
+    proc = subprocess.Popen(["sleep", "30"])
+    try:
+        assert dm._wait_for_exit([proc.pid], 0.05) == [proc.pid]
+        proc.terminate()
+        # Exit is seen through the pidfd even before the zombie is reaped.
+        assert dm._wait_for_exit([proc.pid], 5.0) == []
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def test_show_recent_prisma_logs_picks_newest_match(monkeypatch, tmp_path):
+    """Only the newest log for the target/schema is tailed."""
+    monkeypatch.setattr(dm, "LOG_DIR", tmp_path)
+    old = tmp_path / "prisma_cmd_local_s1_20240101_000000.log"
+    new = tmp_path / "prisma_studio_local_s1_20240102_000000.log"
+    other = tmp_path / "prisma_cmd_cloud_s1_20250101_000000.log"
+    for i, p in enumerate((old, new, other)):
+        p.write_text(f"{p.name}\n", encoding="utf-8")
+        os.utime(p, (1000 + i, 1000 + i))
+
+    router = MagicMock()
+    dm._show_recent_prisma_logs(router, "local", MagicMock(schema_name="s1"))
+    text = router.console.print.call_args.args[0].renderable
+    assert str(new) in text and old.name not in text
+
+    router = MagicMock()
+    dm._show_recent_prisma_logs(router, "local", MagicMock(schema_name="none"))
+    assert "No recent Prisma logs" in router.console.print.call_args.args[0].renderable
+
+
+def test_prisma_cli_prefers_local_binary(monkeypatch, tmp_path):
+    """A project-local prisma binary is used directly instead of going through npx."""
+    monkeypatch.setattr(dm, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(dm, "_npx_path", lambda: "/usr/bin/npx")
+    assert dm._prisma_cli() == ["npx", "--yes", "prisma"]
+
+    local = tmp_path / "node_modules" / ".bin" / "prisma"
+    local.parent.mkdir(parents=True)
+    local.write_text("#!/bin/sh\n", encoding="utf-8")
+    assert dm._prisma_cli() == [str(local)]
+
+    local.unlink()
+    monkeypatch.setattr(dm, "_npx_path", lambda: None)
+    assert dm._prisma_cli() is None
+
+
+def test_menu_choices_built_once_with_stable_shortcuts():
+    """Cached menu choices keep the same shortcut keys across prompts."""
+    assert database_management_choices() is database_management_choices()
+    for build in (database_management_choices, database_management_advanced_choices):
+        first = [c.shortcut_key for c in InquirerControl(list(build()), use_shortcuts=True).choices]
+        again = [c.shortcut_key for c in InquirerControl(list(build()), use_shortcuts=True).choices]
+        assert first == again
+
+
+def test_preflight_reports_first_missing_piece(monkeypatch, tmp_path):
+    """Preflight returns schema + CLI, or explains what is missing."""
+    prisma_dir = tmp_path / "prisma"
+    schema = prisma_dir / "schema.local.prisma"
+    monkeypatch.setattr(dm, "PRISMA_DIR", prisma_dir)
+    monkeypatch.setitem(dm._SCHEMA_PATH, "local", schema)
+    monkeypatch.setattr(dm, "_prisma_cli", lambda: ["npx", "--yes", "prisma"])
+
+    router = MagicMock()
+    assert dm._preflight(router, "local") is None
+    assert "Prisma folder not found" in router.console.print.call_args.args[0]
+
+    prisma_dir.mkdir()
+    assert dm._preflight(router, "local") is None
+    assert "Schema file not found" in router.console.print.call_args.args[0]
+
+    schema.write_text("// schema\n", encoding="utf-8")
+    assert dm._preflight(router, "local") == (schema, ["npx", "--yes", "prisma"])
+
+    monkeypatch.setattr(dm, "_prisma_cli", lambda: None)
+    assert dm._preflight(router, "local") is None
+    assert "`npx` not found" in router.console.print.call_args.args[0]
+
+
+def test_launch_skips_stop_when_port_is_free(monkeypatch, tmp_path):
+    """A cold Studio launch does not run the stop/kill sweep."""
+    srv = socket.socket()
+    srv.bind(("127.0.0.1", 0))
+    srv.listen(1)
+    port = srv.getsockname()[1]
+    try:
+        assert dm._port_busy(port) is True
+    finally:
+        srv.close()
+    assert dm._port_busy(port) is False
+
+    schema = tmp_path / "schema.local.prisma"
+    schema.write_text("// schema\n", encoding="utf-8")
+    monkeypatch.setattr(dm, "_preflight", lambda router, target: (schema, ["prisma"]))
+    monkeypatch.setattr(dm, "_prisma_env_for", lambda profile: {})
+    monkeypatch.setitem(dm._STUDIO_PORT, "local", port)
+    monkeypatch.setattr(dm, "_stop_prisma_studio", MagicMock(side_effect=AssertionError("stop called")))
+    monkeypatch.setattr(dm.subprocess, "Popen", MagicMock(return_value=MagicMock(pid=1)))
+    monkeypatch.setattr(dm, "_wait_for_studio", lambda port, timeout_sec=8.0: True)
+
+    assert dm._launch_prisma_studio(MagicMock(), "local", MagicMock(schema_name="s"), log_path=tmp_path / "s.log") is True
@@ -1,10 +1,133 @@
 from __future__ import annotations
 
+import os
 import sys
+from pathlib import Path
+from types import SimpleNamespace
 
-from sx_db.tui.screens.import_wizard import _build_import_cmd
+from sx_db.tui.screens import import_wizard
+from sx_db.tui.screens.import_wizard import _build_import_cmd, _find_csvs, _import_workers, _run_import_job, _stage_import_jobs
 
 
 def test_build_import_cmd_uses_current_interpreter_and_source_flag() -> None:
     cmd = _build_import_cmd("assets_1")
     assert cmd == [sys.executable, "-m", "sx_db", "import-csv", "--source", "assets_1"]
+
+
+def test_import_workers_parallel_only_for_postgres() -> None:
+    assert _import_workers(SimpleNamespace(SX_DB_BACKEND_MODE="SQLITE"), 6) == 1
+    assert _import_workers(SimpleNamespace(), 6) == 1
+    assert _import_workers(SimpleNamespace(SX_DB_BACKEND_MODE="postgres_primary"), 6) == 3
+    assert _import_workers(SimpleNamespace(SX_DB_BACKEND_MODE="POSTGRES_PRIMARY"), 2) == 2
+
+
+def test_stage_import_jobs_runs_each_servers_first_import_alone() -> None:
+    local = SimpleNamespace(name="local")
+    cloud = SimpleNamespace(name="cloud")
+    jobs = [(srv, p) for srv in (local, cloud) for p in ("a", "b", "c")]
+
+    initial, after = _stage_import_jobs(jobs)
+    assert initial == [(local, "a"), (cloud, "a")]
+
+    # A failed bootstrap releases only the next job for that server.
+    assert after(cloud, False) == [(cloud, "b")]
+    assert after(cloud, True) == [(cloud, "c")]
+    assert after(local, True) == [(local, "b"), (local, "c")]
+    assert after(local, True) == []
+    assert after(cloud, True) == []
+
+
+def test_run_import_job_streams_output_and_keeps_tail(monkeypatch) -> None:
+    script = (
+        "import os, sys\n"
+        "print(os.environ['DB_PROFILE'], os.environ['SX_PIPELINE_DB_PROFILE'])\n"
+        "for i in range(50): print('row', i)\n"
+        "print('boom', file=sys.stderr)\n"
+        "sys.exit(1)\n"
+    )
+    monkeypatch.setattr(import_wizard, "_build_import_cmd", lambda source_id: [sys.executable, "-c", script])
+    srv = SimpleNamespace(alias_for=lambda i: f"SXO_LOCAL_{i}")
+    profile = SimpleNamespace(index=2, profile_id="assets_2")
+
+    lines: list[str] = []
+    ok, detail = _run_import_job(srv, profile, ".", lines.append)
+    assert not ok
+    assert lines[0] == "SXO_LOCAL_2 SXO_LOCAL_2"
+    assert len(lines) == 52
+    assert detail.endswith("boom") and "row 0\n" not in detail
+
+
+def test_run_import_job_uses_base_env_snapshot_without_mutating_it(monkeypatch) -> None:
+    script = "import os; print(os.environ['SNAPSHOT_ONLY'], os.environ['DB_PROFILE'])"
+    monkeypatch.setattr(import_wizard, "_build_import_cmd", lambda source_id: [sys.executable, "-c", script])
+    srv = SimpleNamespace(alias_for=lambda i: f"SXO_CLOUD_{i}")
+    base_env = {**os.environ, "SNAPSHOT_ONLY": "yes"}
+
+    lines: list[str] = []
+    ok, _ = _run_import_job(srv, SimpleNamespace(index=1, profile_id="assets_1"), ".", lines.append, base_env=base_env)
+    assert ok
+    assert lines == ["yes SXO_CLOUD_1"]
+    assert "DB_PROFILE" not in base_env or base_env["DB_PROFILE"] != "SXO_CLOUD_1"
+
+
+def test_run_import_job_times_out(monkeypatch) -> None:
+    monkeypatch.setattr(
+        import_wizard, "_build_import_cmd", lambda source_id: [sys.executable, "-c", "import time; time.sleep(30)"]
+    )
+    srv = SimpleNamespace(alias_for=lambda i: f"SXO_LOCAL_{i}")
+    ok, detail = _run_import_job(srv, SimpleNamespace(index=1, profile_id="a"), ".", timeout=0.3)
+    assert not ok and "timed out" in detail
+
+
+class _FakeCursor:
+    def __init__(self, log: list, existing: set[str]):
+        self.log = log
+        self.existing = existing
+
+    def execute(self, sql, params=None):
+        self.log.append((sql, params))
+
+    def fetchall(self):
+        names = self.log[-1][1][0]
+        return [(n,) for n in names if n in self.existing]
+
+    def close(self):
+        pass
+
+
+def test_ensure_schemas_for_server_one_connection_one_lookup(monkeypatch) -> None:
+    log: list = []
+    connects: list[str] = []
+
+    class _Conn:
+        autocommit = False
+
+        def cursor(self):
+            return _FakeCursor(log, {"s1"})
+
+        def close(self):
+            pass
+
+    fake_psycopg = SimpleNamespace(connect=lambda dsn: connects.append(dsn) or _Conn())
+    monkeypatch.setitem(sys.modules, "psycopg", fake_psycopg)
+    router = SimpleNamespace(console=SimpleNamespace(print=lambda *a, **k: None))
+    server = SimpleNamespace(dsn=lambda: "postgresql://x", label="Local", short_label="Local")
+    profiles = [SimpleNamespace(schema_name=n) for n in ("s1", 'we"ird', "s1")]
+
+    assert import_wizard._ensure_schemas_for_server(router, profiles, server) is True
+    assert connects == ["postgresql://x"]
+    assert len(log) == 2
+    assert log[0][1] == (["s1", 'we"ird'],)
+    assert log[1][0] == 'CREATE SCHEMA IF NOT EXISTS "we""ird"'
+
+
+def test_find_csvs_lists_csv_files_only(tmp_path: Path) -> None:
+    xlsx_dir = tmp_path / "xlsx_files"
+    xlsx_dir.mkdir()
+    (xlsx_dir / "consolidated.csv").write_text("id\n", encoding="utf-8")
+    (xlsx_dir / "authors.csv").write_text("id\n", encoding="utf-8")
+    (xlsx_dir / "notes.txt").write_text("x", encoding="utf-8")
+    (xlsx_dir / "old.csv").mkdir()
+
+    assert sorted(_find_csvs(SimpleNamespace(xlsx_dir=xlsx_dir))) == ["authors.csv", "consolidated.csv"]
+    assert _find_csvs(SimpleNamespace(xlsx_dir=tmp_path / "missing")) == []
@@ -104,3 +104,18 @@ def test_navigator_database_management_label():
 
     assert nav.current() == "database_management"
     assert nav.breadcrumbs() == "Home > Database management"
+
+
+def test_navigator_breadcrumbs_cached_until_stack_changes():
+    """Breadcrumbs are reused between renders and rebuilt after push/pop/home."""
+    nav = Navigator()
+    nav.push("sources_menu")
+    first = nav.breadcrumbs()
+    assert nav.breadcrumbs() is first
+
+    nav.push("sources_add")
+    assert nav.breadcrumbs() == "Home > Sources > Add Source"
+    nav.pop()
+    assert nav.breadcrumbs() == "Home > Sources"
+    nav.home()
+    assert nav.breadcrumbs() == "Home"
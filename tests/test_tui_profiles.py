@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
-from sx_db.tui.profiles import discover_profiles
+from sx_db.tui import profiles as profiles_mod
+from sx_db.tui.profiles import SourceProfile, discover_profiles
 
 
 def test_discover_profiles_uses_explicit_vault(tmp_path: Path) -> None:
@@ -57,3 +59,56 @@ def test_discover_profiles_fallbacks_vault_to_src(tmp_path: Path) -> None:
     p = profiles[0]
     assert p.vault_path == str(src)
     assert p.vault_fallback is True
+
+
+def test_source_profile_has_csvs(tmp_path: Path) -> None:
+    p = SourceProfile(
+        index=1,
+        label="x",
+        src_path=str(tmp_path),
+        vault_path=str(tmp_path),
+        assets_path=str(tmp_path),
+        profile_id="assets_1",
+        schema_name="sxo_assets_1",
+        db_local_alias="SXO_LOCAL_1",
+    )
+    assert p.has_csvs() is False  # xlsx_files/ missing
+
+    (tmp_path / "xlsx_files" / "dir.csv").mkdir(parents=True)
+    assert p.has_csvs() is False
+
+    (tmp_path / "xlsx_files" / "consolidated.csv").write_text("id\n", encoding="utf-8")
+    assert p.has_csvs() is True
+
+
+def test_discover_cached_until_env_or_vault_changes(tmp_path: Path, monkeypatch) -> None:
+    env = tmp_path / ".env"
+    vault = tmp_path / "vault"
+    env.write_text(f"SRC_PATH_1={vault}\nVAULT_1={vault}\nSRC_PATH_1_LABEL=One\n", encoding="utf-8")
+    monkeypatch.setattr(profiles_mod, "DEFAULT_ENV_PATH", env)
+    calls: list[str] = []
+    real_profiles, real_vaults = profiles_mod.discover_profiles, profiles_mod.discover_vaults
+    monkeypatch.setattr(profiles_mod, "discover_profiles", lambda: calls.append("p") or real_profiles())
+    monkeypatch.setattr(profiles_mod, "discover_vaults", lambda: calls.append("v") or real_vaults())
+    profiles_mod.clear_discovery_cache()
+
+    first = profiles_mod.discover_profiles_cached()
+    vaults = profiles_mod.discover_vaults_cached()
+    assert [p.active for p in first] == [False]
+    assert [v.has_obsidian for v in vaults] == [False]
+    assert profiles_mod.discover_profiles_cached() is first
+    assert profiles_mod.discover_vaults_cached() is vaults
+    assert calls == ["p", "v"]
+
+    # Vault root (and .obsidian) appears without an .env edit: re-discovered.
+    (vault / ".obsidian").mkdir(parents=True)
+    assert [p.active for p in profiles_mod.discover_profiles_cached()] == [True]
+    assert [v.has_obsidian for v in profiles_mod.discover_vaults_cached()] == [True]
+    assert calls == ["p", "v", "p", "v"]
+
+    # .env edit (new mtime): re-discovered.
+    env.write_text(env.read_text(encoding="utf-8") + "SRC_PATH_2=/nope\n", encoding="utf-8")
+    os.utime(env, ns=(1, 1))
+    assert len(profiles_mod.discover_profiles_cached()) == 2
+    assert calls == ["p", "v", "p", "v", "p"]
+    profiles_mod.clear_discovery_cache()
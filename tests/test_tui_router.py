@@ -92,7 +92,7 @@ def test_router_screen_history(router_components):
     nav.push("import_wizard")
     state.add_to_history(nav.current())
     
-    assert state.session_history == [
+    assert list(state.session_history) == [
         "main_menu",
         "sources_menu",
         "import_wizard",
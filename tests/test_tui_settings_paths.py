@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import io
+import os
 from pathlib import Path
+from types import SimpleNamespace
 
+from rich.console import Console
+
+from sx_db.tui import profiles as profiles_mod
+from sx_db.tui.screens import settings
 from sx_db.tui.screens.settings import _upsert_env_vars
 
 
@@ -33,3 +40,82 @@ def test_upsert_env_vars_updates_and_appends(tmp_path: Path) -> None:
     assert "SRC_PATH_1_LABEL=NewLabel" in content
     assert "VAULT_1=/new/vault" in content
     assert "UNRELATED_KEY=keep" in content
+
+
+def test_profile_discovery_cached_until_env_write(tmp_path: Path, monkeypatch) -> None:
+    calls: list[int] = []
+    monkeypatch.setattr(settings, "DEFAULT_ENV_PATH", tmp_path / ".env")
+    monkeypatch.setattr(profiles_mod, "DEFAULT_ENV_PATH", tmp_path / ".env")
+    monkeypatch.setattr(profiles_mod, "discover_profiles", lambda: calls.append(1) or [])
+    settings.clear_discovery_cache()
+
+    settings.discover_profiles_cached()
+    settings.discover_profiles_cached()
+    assert calls == [1]
+
+    settings._upsert_env_vars(settings.DEFAULT_ENV_PATH, {"SRC_PATH_1": "/x"})
+    settings.discover_profiles_cached()
+    assert calls == [1, 1]
+    settings.clear_discovery_cache()
+
+
+def test_upsert_env_vars_skips_noop_write_and_ignores_comments(tmp_path: Path) -> None:
+    env_path = tmp_path / ".env"
+    env_path.write_text("# VAULT_1=/commented\n  VAULT_1 = /v\nSRC_PATH_1=/s\n", encoding="utf-8")
+
+    _upsert_env_vars(env_path, {"VAULT_1": "/w"})
+    assert env_path.read_text(encoding="utf-8") == "# VAULT_1=/commented\nVAULT_1=/w\nSRC_PATH_1=/s\n"
+
+    os.utime(env_path, ns=(1, 1))
+    _upsert_env_vars(env_path, {"VAULT_1": "/w", "SRC_PATH_1": "/s"})
+    assert env_path.stat().st_mtime_ns == 1
+
+
+def test_profile_env_block_uses_local_db_defaults(monkeypatch) -> None:
+    monkeypatch.setenv("SXO_LOCAL_1_DB_HOST", "db.internal")
+    block = settings._profile_env_block(3, "Lab", "/data/lab", "assets_3", "sxo_assets_3")
+
+    lines = block.splitlines()
+    assert block.startswith("\n# ══") and block.endswith("SXO_LOCAL_3_DB_SCHEMA=sxo_assets_3\n")
+    assert "SRC_PATH_3=/data/lab" in lines
+    assert "DATABASE_PROFILE_3=assets_3" in lines
+    assert "SXO_LOCAL_3_DB_HOST=db.internal" in lines
+    assert "SXO_LOCAL_3_DB_PORT=5432" in lines
+
+    # Environment changes during the session are picked up.
+    monkeypatch.setenv("SXO_LOCAL_1_DB_HOST", "db.other")
+    assert "SXO_LOCAL_3_DB_HOST=db.other" in settings._profile_env_block(3, "Lab", "/data/lab", "assets_3", "sxo_assets_3")
+
+
+def test_refresh_profiles_prints_all_profiles_once(monkeypatch) -> None:
+    profiles = tuple(
+        SimpleNamespace(index=i, label=f"P{i}", active=i == 1, src_path=f"/src/{i}", vault_path=f"/v/{i}", schema_name=f"sxo_{i}")
+        for i in (1, 2)
+    )
+    monkeypatch.setattr(settings, "discover_profiles_cached", lambda: profiles)
+    monkeypatch.setattr(settings, "clear_discovery_cache", lambda: None)
+    monkeypatch.setattr(settings, "_press_enter", lambda: None)
+    buf = io.StringIO()
+    console = Console(file=buf, width=120)
+    prints = []
+    monkeypatch.setattr(console, "print", lambda *a, **k: (prints.append(a), Console.print(console, *a, **k)))
+
+    settings._refresh_profiles(SimpleNamespace(console=console))
+
+    assert len(prints) == 2  # header panel + one print for every profile
+    out = buf.getvalue()
+    assert "✓ Profile 1: P1" in out and "✗ Profile 2: P2" in out
+    assert "     Schema: sxo_1\n\n  ✗ Profile 2" in out
+
+
+def test_settings_choices_built_once() -> None:
+    choices = settings._settings_choices()
+    assert choices is settings._settings_choices()
+    assert [getattr(c, "value", None) for c in choices][-2:] == ["back", "home"]
+
+
+def test_secret_key_pattern_matches_whole_word_key() -> None:
+    for key in ("SXO_LOCAL_1_DB_PASSWORD", "CLIENT_SECRET", "API_KEY", "KEY"):
+        assert settings._SECRET_KEY_RE.search(key), key
+    for key in ("SX_POSTGRES_SCHEMA_PREFIX", "MONKEY_MODE", "KEYCHAIN_PATH", "SX_API_PORT"):
+        assert not settings._SECRET_KEY_RE.search(key), key
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from sx_db.tui.profiles import discover_profiles
+from sx_db.tui.screens import sources
+
+
+def _write_env(env: Path, vault: Path) -> None:
+    env.write_text(f"SRC_PATH_1={vault}\nVAULT_1={vault}\nSRC_PATH_1_LABEL=One\n", encoding="utf-8")
+
+
+def test_profile_view_reused_for_same_profiles(tmp_path: Path, monkeypatch) -> None:
+    env = tmp_path / ".env"
+    _write_env(env, tmp_path)
+    env.write_text(env.read_text(encoding="utf-8") + "SRC_PATH_2=/missing\n", encoding="utf-8")
+    monkeypatch.setattr(sources, "_VIEW_CACHE", None)
+    profiles = tuple(discover_profiles(env))
+
+    table, choices = sources._profile_view(profiles)
+    assert table.row_count == 2
+    assert [c.value for c in choices] == [1]  # only active profiles are offered
+    assert sources._profile_view(profiles) == (table, choices)
+    assert sources._profile_view(tuple(discover_profiles(env)))[0] is not table
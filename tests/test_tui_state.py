@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import pytest
 
-from sx_db.tui.state import UIState
+from sx_db.tui.state import HISTORY_MAXLEN, UIState
 
 
 def test_uistate_initial_state():
@@ -14,7 +14,7 @@ def test_uistate_initial_state():
     assert state.last_search_query is None
     assert state.last_import_csv is None
     assert state.last_import_source is None
-    assert state.session_history == []
+    assert list(state.session_history) == []
     assert state.import_wizard_step == 0
     assert state.import_wizard_data == {}
 
@@ -38,6 +38,15 @@ def test_uistate_remember_ignores_unknown():
     assert not hasattr(state, "unknown_attr")
 
 
+def test_uistate_remember_ignores_methods():
+    """Test remember() only updates declared fields, not methods."""
+    state = UIState()
+
+    state.remember(add_to_history="value")
+    state.add_to_history("main_menu")
+    assert list(state.session_history) == ["main_menu"]
+
+
 def test_uistate_add_to_history():
     """Test adding screens to session history."""
     state = UIState()
@@ -46,7 +55,19 @@ def test_uistate_add_to_history():
     state.add_to_history("sources_menu")
     state.add_to_history("import_wizard")
     
-    assert state.session_history == ["main_menu", "sources_menu", "import_wizard"]
+    assert list(state.session_history) == ["main_menu", "sources_menu", "import_wizard"]
+
+
+def test_uistate_history_is_bounded():
+    """Test session history keeps only the most recent visits."""
+    state = UIState()
+
+    for i in range(HISTORY_MAXLEN + 10):
+        state.add_to_history(f"screen_{i}")
+
+    assert len(state.session_history) == HISTORY_MAXLEN
+    assert state.session_history[0] == "screen_10"
+    assert state.session_history[-1] == f"screen_{HISTORY_MAXLEN + 9}"
 
 
 def test_uistate_clear_wizard_state():
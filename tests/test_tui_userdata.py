@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import io
+from types import SimpleNamespace
+
+import pytest
+from rich.console import Console
+
+import sx_db.cli as cli
+from sx_db.tui.screens import userdata
+
+
+@pytest.mark.parametrize(
+    ("action", "command"),
+    [("export", "export_userdata"), ("import", "import_userdata")],
+)
+def test_userdata_menu_runs_command_under_status_with_explicit_source(monkeypatch, action, command) -> None:
+    console = Console(file=io.StringIO())
+    router = SimpleNamespace(console=console, breadcrumbs=[])
+    calls: list[dict] = []
+
+    monkeypatch.setattr(userdata, "render_breadcrumbs", lambda router: None)
+    monkeypatch.setattr(userdata.questionary, "select", lambda *a, **k: SimpleNamespace(ask=lambda: action))
+    monkeypatch.setattr("rich.prompt.Prompt.ask", lambda *a, **k: "out.jsonl.gz")
+    monkeypatch.setattr("rich.prompt.Confirm.ask", lambda *a, **k: True)
+    monkeypatch.setattr(cli, command, lambda **kw: calls.append({**kw, "live": console._live_stack[:]}))
+
+    assert userdata.show_userdata_menu(router) == "userdata_menu"
+    assert len(calls) == 1
+    # Typer option defaults are not values; the TUI must pass source explicitly.
+    assert calls[0]["source"] is None
+    assert calls[0]["live"], "command should run while the status spinner is shown"
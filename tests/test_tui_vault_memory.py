@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import os
+import pty
 from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
 
 from sx_db.tui.screens import build_deploy as bd
 
@@ -38,3 +43,152 @@ def test_delete_memory_at_cursor_last() -> None:
     assert removed == "/b"
     assert updated == ["/a"]
     assert next_cursor == 0
+
+
+def test_known_vault_memory_cached_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    mem_file = tmp_path / "known_vault_paths.json"
+    monkeypatch.setattr(bd, "KNOWN_VAULTS_PATH", mem_file)
+    monkeypatch.setattr(bd, "_MEM_CACHE", None)
+
+    bd._save_known_vault_memory(["/a", "/b"])
+    reads: list[Path] = []
+    orig_read_text = Path.read_text
+
+    def _counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return orig_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", _counting_read_text)
+
+    first = bd._load_known_vault_memory()
+    first.append("/mutated")
+    assert bd._load_known_vault_memory() == ["/a", "/b"]
+    assert reads == []
+
+    mem_file.write_text('{"paths": ["/c", "/d", "/e"]}\n', encoding="utf-8")
+    assert bd._load_known_vault_memory() == ["/c", "/d", "/e"]
+    assert reads == [mem_file]
+
+
+def test_remembered_panel_uses_precomputed_obsidian_status(tmp_path: Path) -> None:
+    vault = tmp_path / "v"
+    (vault / ".obsidian").mkdir(parents=True)
+    plain = tmp_path / "plain"
+    plain.mkdir()
+
+    assert bd._has_obsidian(str(vault)) is True
+    assert bd._has_obsidian(str(plain)) is False
+    assert bd._has_obsidian(str(tmp_path / "missing")) is False
+
+    # A precomputed status wins over the filesystem (no re-probe per redraw).
+    text = bd._render_remembered_vaults_panel([str(plain)], 0, {str(plain): True})
+    assert "✓ .obsidian" in text
+    text = bd._render_remembered_vaults_panel([str(vault), str(plain)], 1)
+    assert f"  {vault}  [✓ .obsidian]" in text
+    assert f"❯ {plain}  [no .obsidian]" in text
+
+
+def test_manage_known_vaults_writes_once_per_session(tmp_path: Path, monkeypatch) -> None:
+    mem_file = tmp_path / "known_vault_paths.json"
+    monkeypatch.setattr(bd, "KNOWN_VAULTS_PATH", mem_file)
+    monkeypatch.setattr(bd, "_MEM_CACHE", None)
+    bd._save_known_vault_memory(["/a", "/b", "/c"])
+
+    actions = iter(["down", "delete", "delete", "done"])
+    monkeypatch.setattr(bd, "_raw_action_reader", lambda: None)
+    monkeypatch.setattr(bd, "_capture_memory_list_action", lambda: next(actions))
+    monkeypatch.setattr(bd.questionary, "confirm", lambda *a, **k: SimpleNamespace(ask=lambda: True))
+    saves: list[list[str]] = []
+    orig_save = bd._save_known_vault_memory
+    monkeypatch.setattr(bd, "_save_known_vault_memory", lambda paths: (saves.append(list(paths)), orig_save(paths)))
+
+    router = SimpleNamespace(console=SimpleNamespace(print=lambda *_: None))
+    bd._manage_known_vaults(router, bd._load_known_vault_memory())
+
+    assert saves == [["/a"]]
+    assert bd._load_known_vault_memory() == ["/a"]
+
+
+def test_manage_known_vaults_keeps_deletes_when_manager_fails(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(bd, "KNOWN_VAULTS_PATH", tmp_path / "known_vault_paths.json")
+    monkeypatch.setattr(bd, "_MEM_CACHE", None)
+    bd._save_known_vault_memory(["/a", "/b", "/c"])
+
+    def _actions():
+        yield "delete"
+        raise OSError("terminal went away")
+
+    actions = _actions()
+    monkeypatch.setattr(bd, "_raw_action_reader", lambda: None)
+    monkeypatch.setattr(bd, "_capture_memory_list_action", lambda: next(actions))
+    monkeypatch.setattr(bd.questionary, "confirm", lambda *a, **k: SimpleNamespace(ask=lambda: True))
+    offered: list[list[str]] = []
+
+    def _checkbox(*a, choices, **k):
+        offered.append([c.value for c in choices])
+        return SimpleNamespace(ask=lambda: None)
+
+    monkeypatch.setattr(bd.questionary, "checkbox", _checkbox)
+
+    router = SimpleNamespace(console=SimpleNamespace(print=lambda *_: None))
+    bd._manage_known_vaults(router, bd._load_known_vault_memory())
+
+    assert bd._load_known_vault_memory() == ["/b", "/c"]
+    assert offered == [["/b", "/c"]]
+
+
+def test_decode_raw_action_sequences() -> None:
+    assert bd._decode_raw_action(b"\x1b[A") == "up"
+    assert bd._decode_raw_action(b"\x1bOB") == "down"
+    assert bd._decode_raw_action(b"\x1b[3~") == "delete"
+    assert bd._decode_raw_action(b"\x7f") == "delete"
+    assert bd._decode_raw_action(b"\r") == "done"
+    assert bd._decode_raw_action(b"\x1b") == "cancel"
+    # Unknown keys/escapes are skipped, not mistaken for Esc.
+    assert bd._decode_raw_action(b"x") is None
+    assert bd._decode_raw_action(b"\x1b[C") is None
+    assert bd._decode_raw_action(b"x\x1b[C\x1b[B") == "down"
+
+
+def test_next_raw_action_leaves_following_keys() -> None:
+    data = b"\x1b[A\x1b[3~"
+    assert bd._next_raw_action(data) == ("up", 3)
+    assert bd._next_raw_action(data[3:]) == ("delete", 4)
+    assert bd._next_raw_action(b"x\x1b[C") == (None, 4)
+
+
+def test_read_raw_action_from_a_pty() -> None:
+    if bd.termios is None:  # pragma: no cover
+        pytest.skip("termios not available")
+    master, slave = pty.openpty()
+    try:
+        os.write(master, b"x\x1b[B")
+        assert bd._read_raw_action(slave) == "down"
+        # Two keys arriving in one read are both delivered.
+        os.write(master, b"\x1b[A\x1b[3~")
+        assert bd._read_raw_action(slave) == "up"
+        assert bd._read_raw_action(slave) == "delete"
+        assert slave not in bd._RAW_PENDING
+    finally:
+        os.close(master)
+        os.close(slave)
+
+
+def test_dump_memory_matches_json_layout(monkeypatch) -> None:
+    obj = {"paths": ["/a", "/mnt/ü"]}
+    expected = '{\n  "paths": [\n    "/a",\n    "/mnt/ü"\n  ]\n}\n'.encode("utf-8")
+    assert bd._dump_memory(obj) == expected
+    monkeypatch.setattr(bd, "orjson", None)
+    assert bd._dump_memory(obj) == expected
+
+
+def test_render_panel_reuses_cached_rows(monkeypatch) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(bd, "_has_obsidian", lambda p: calls.append(p) or p == "/v")
+    rows: dict[str, str] = {}
+    first = bd._render_remembered_vaults_panel(["/v", "/x"], 0, row_cache=rows)
+    second = bd._render_remembered_vaults_panel(["/v", "/x"], 1, row_cache=rows)
+    assert calls == ["/v", "/x"]
+    assert "❯ /v  [✓ .obsidian]" in first and "  /x  [no .obsidian]" in first
+    assert "  /v  [✓ .obsidian]" in second and "❯ /x  [no .obsidian]" in second
+    assert bd._render_remembered_vaults_panel([], 0).startswith("(empty)\n\n")